@@ -7,38 +7,589 @@ Scans through project folders for markdown files and extracts structured project
 import os
 import json
 import re
+import hashlib
+import codecs
+import io
+import time
 from pathlib import Path
 from datetime import datetime
 import argparse
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterable, BinaryIO
+
+from file_watcher import create_watcher
+from compact_schema import ProjectRecord, to_json
+from corpus_index import CorpusIndex, IndexedManifest
+from scan_profile import Profiler, TimedIterator, add_profile_arguments
+from scan_output import (OUTPUT_FORMATS, resolve_output_path, write_json_atomic, write_json_shards,
+                         write_ndjson_atomic)
+from project_walker import (IGNORE_FILES, ProjectDiscovery, add_discovery_arguments, discovery_from_args,
+                            walk_files)
+
+# Bump whenever parse_markdown_file output changes so stale manifests are discarded
+MANIFEST_VERSION = 1
+
+# Files larger than this are parsed from a chunk stream instead of being read whole
+STREAM_THRESHOLD = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Files whose changes can alter the scan result
+WATCH_SUFFIXES = (".md",) + IGNORE_FILES
+
+
+def decode_markdown(raw: bytes) -> str:
+    """Decode file bytes the same way open(..., 'r', encoding='utf-8') would."""
+    return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def iter_markdown_chunks(file_obj: BinaryIO, hasher=None,
+                         chunk_size: int = STREAM_CHUNK_SIZE) -> Iterable[str]:
+    """Decode a binary file as text-mode UTF-8 in chunks that end on a line boundary.
+
+    Memory stays bounded by chunk_size plus the longest line. If hasher is
+    given it is updated with the raw bytes as they are read.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+    carry = ''
+    while True:
+        raw = file_obj.read(chunk_size)
+        if hasher is not None:
+            hasher.update(raw)
+        text = carry + decoder.decode(raw, final=not raw)
+        if not raw:
+            if text:
+                yield text
+            return
+        cut = text.rfind('\n') + 1
+        carry = text[cut:]
+        if cut:
+            yield text[:cut]
+
+
+def parse_file_job(scanner_class: type, file_path: str, known_sha256: Optional[str],
+                   stream_threshold: int = STREAM_THRESHOLD
+                   ) -> Tuple[Optional[str], Optional[Dict[str, Any]], Dict[str, float]]:
+    """Read, hash and parse one markdown file.
+
+    Module-level so it can run in worker processes. Returns (sha256, data, timing);
+    data is None when the hash equals known_sha256, and sha256 is None when
+    the file could not be read. Files above stream_threshold are hashed and
+    parsed in a single streaming pass. timing holds the wall and CPU time
+    spent reading and extracting, and the bytes read.
+    """
+    timing = {"read": 0.0, "read_cpu": 0.0, "extract": 0.0, "extract_cpu": 0.0, "bytes": 0}
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > stream_threshold:
+                hasher = hashlib.sha256()
+                scanner = scanner_class()
+                chunks = TimedIterator(iter_markdown_chunks(f, hasher))
+                file_data = scanner.parse_markdown_chunks(chunks)
+                timing.update(read=chunks.wall, read_cpu=chunks.cpu, bytes=size,
+                              extract=time.perf_counter() - wall_start - chunks.wall,
+                              extract_cpu=time.process_time() - cpu_start - chunks.cpu)
+                return hasher.hexdigest(), file_data, timing
+            raw = f.read()
+        sha256 = hashlib.sha256(raw).hexdigest()
+        timing["bytes"] = len(raw)
+        if sha256 != known_sha256:
+            content = decode_markdown(raw)
+    except Exception as e:
+        print(f"   ❌ Error reading {file_path}: {e}")
+        return None, {}, timing
+    
+    extract_start = time.perf_counter()
+    extract_cpu_start = time.process_time()
+    timing.update(read=extract_start - wall_start, read_cpu=extract_cpu_start - cpu_start)
+    if sha256 == known_sha256:
+        return sha256, None, timing
+    file_data = scanner_class().parse_markdown_content(content)
+    timing.update(extract=time.perf_counter() - extract_start,
+                  extract_cpu=time.process_time() - extract_cpu_start)
+    return sha256, file_data, timing
+
+
+class ExtractionRule:
+    """One extraction pattern: literal prefix, separator and (.+) group, plus its category.
+
+    Matches can only start where the lowercase marker occurs (offset adjusts
+    for markers that sit inside the prefix).
+    """
+
+    __slots__ = ("category", "pattern", "prefix", "separator", "min_separator", "marker", "offset",
+                 "first_only")
+
+    def __init__(self, category: str, prefix: str, separator: str, marker: str, offset: int = 0,
+                 first_only: bool = False):
+        flags = re.IGNORECASE | re.MULTILINE
+        self.category = category
+        self.pattern = re.compile(prefix + separator + r'(.+)', flags)
+        self.prefix = re.compile(prefix, flags)
+        # Greedy separator run, used to tell whether a match continues into the next chunk
+        self.separator = re.compile(separator[:-1] + '*')
+        self.min_separator = 1 if separator.endswith('+') else 0
+        self.marker = marker
+        self.offset = offset
+        self.first_only = first_only
+
+
+# Patterns in output order. Each is only tried where its marker occurs, so the
+# document is swept once by a single marker regex instead of once per pattern.
+EXTRACTION_RULES = [
+    ExtractionRule("title", r'^#', r'\s+', '#', first_only=True),
+    ExtractionRule("completed_features", r'✅', r'\s*', '✅'),
+    ExtractionRule("completed_features", r'- \[x\]', r'\s*', '- [x]'),
+    ExtractionRule("completed_features", r'COMPLETED', r'[:\s]+', 'completed'),
+    ExtractionRule("completed_features", r'DONE', r'[:\s]+', 'done'),
+    ExtractionRule("in_progress_features", r'🔄', r'\s*', '🔄'),
+    ExtractionRule("in_progress_features", r'IN PROGRESS', r'[:\s]+', 'in progress'),
+    ExtractionRule("in_progress_features", r'WORKING ON', r'[:\s]+', 'working on'),
+    ExtractionRule("todo_features", r'- \[ \]', r'\s*', '- [ ]'),
+    ExtractionRule("todo_features", r'TODO', r'[:\s]+', 'todo'),
+    ExtractionRule("todo_features", r'NEEDS WORK', r'[:\s]+', 'needs work'),
+    ExtractionRule("todo_features", r'NEXT STEPS', r'[:\s]+', 'next steps'),
+    ExtractionRule("tech_stack", r'Tech Stack', r'[:\s]+', 'stack', offset=-len('tech ')),
+    ExtractionRule("tech_stack", r'Technologies', r'[:\s]+', 'technologies'),
+    ExtractionRule("tech_stack", r'Built with', r'[:\s]+', 'built with'),
+    ExtractionRule("tech_stack", r'Stack', r'[:\s]+', 'stack'),
+    ExtractionRule("business_model", r'Business Model', r'[:\s]+', 'business model', first_only=True),
+    ExtractionRule("business_model", r'Revenue Model', r'[:\s]+', 'revenue model', first_only=True),
+    ExtractionRule("business_model", r'Pricing', r'[:\s]+', 'pricing', first_only=True),
+    ExtractionRule("market_analysis", r'Market Analysis', r'[:\s]+', 'market analysis', first_only=True),
+    ExtractionRule("market_analysis", r'Market Opportunity', r'[:\s]+', 'market opportunity',
+                   first_only=True),
+    ExtractionRule("market_analysis", r'Industry Trends', r'[:\s]+', 'industry trends', first_only=True),
+]
+
+EXTRACTION_MARKERS = list(dict.fromkeys(rule.marker for rule in EXTRACTION_RULES))
+MARKER_RULES = [[index for index, rule in enumerate(EXTRACTION_RULES) if rule.marker == marker]
+                for marker in EXTRACTION_MARKERS]
+# Matched against chunk.lower(): a plain alternation without groups keeps the regex
+# engine's first-character prefilter, which an IGNORECASE or grouped one loses
+MARKER_RE = re.compile('|'.join(re.escape(marker) for marker in EXTRACTION_MARKERS))
+MARKER_INDEX = {marker: index for index, marker in enumerate(EXTRACTION_MARKERS)}
+# Exact fallback for chunks containing CASEFOLD_EXCEPTIONS; the group number is the marker index
+MARKER_RE_IGNORECASE = re.compile('|'.join(f'({re.escape(marker)})' for marker in EXTRACTION_MARKERS),
+                                  re.IGNORECASE)
+# Characters where str.lower() disagrees with re.IGNORECASE or changes the string length
+CASEFOLD_EXCEPTIONS = ('\u0130', '\u0131', '\u017f')
+TECH_SPLIT_RE = re.compile(r'[,•\n]+')
+
+
+class ExtractionEngine:
+    """Single-pass extractor producing the same fields as one re.findall per pattern.
+
+    Text is fed in chunks that end on a line boundary (except the last). Every
+    chunk is swept once for all rule markers; each hit is confirmed with the
+    rule's own compiled pattern at that position. A match whose separator run
+    reaches the end of a chunk is carried into the next chunk, so results do
+    not depend on how the text is split.
+    """
+
+    def __init__(self):
+        self.matches = [[] for _ in EXTRACTION_RULES]
+        self.consumed = [0] * len(EXTRACTION_RULES)
+        self.done = [False] * len(EXTRACTION_RULES)
+        # rule index -> [separator length, last non-newline separator char, its index]
+        self.pending = {}
+        self.offset = 0
+        self.description_lines = []
+        self.in_description = False
+        self.description_done = False
+
+    def feed(self, chunk: str):
+        """Process the next chunk of the document."""
+        if self.pending:
+            self._resolve_pending(chunk)
+        if not self.description_done:
+            self._scan_description(chunk)
+
+        exact = any(char in chunk for char in CASEFOLD_EXCEPTIONS)
+        if exact:
+            text, search = chunk, MARKER_RE_IGNORECASE.search
+        else:
+            text, search = chunk.lower(), MARKER_RE.search
+
+        match = search(text)
+        while match:
+            start = match.start()
+            marker_index = match.lastindex - 1 if exact else MARKER_INDEX[match.group()]
+            for rule_index in MARKER_RULES[marker_index]:
+                self._try_rule(rule_index, chunk, start + EXTRACTION_RULES[rule_index].offset)
+            match = search(text, start + 1)
+
+        self.offset += len(chunk)
+
+    def _try_rule(self, rule_index: int, chunk: str, position: int):
+        """Apply one rule at a marker hit, as re.findall would when scanning past it."""
+        if (position < 0 or self.done[rule_index] or rule_index in self.pending
+                or self.offset + position < self.consumed[rule_index]):
+            return
+
+        rule = EXTRACTION_RULES[rule_index]
+        prefix = rule.prefix.match(chunk, position)
+        if not prefix:
+            return
+
+        separator_end = rule.separator.match(chunk, prefix.end()).end()
+        if separator_end == len(chunk):
+            self.pending[rule_index] = [0, '', -1]
+            self._extend_pending(rule_index, chunk[prefix.end():])
+            return
+
+        match = rule.pattern.match(chunk, position)
+        if match:
+            self._add_match(rule_index, match.group(1), self.offset + match.end())
+
+    def _add_match(self, rule_index: int, value: str, end: int):
+        self.matches[rule_index].append(value)
+        self.consumed[rule_index] = end
+        if EXTRACTION_RULES[rule_index].first_only:
+            self.done[rule_index] = True
+
+    def _extend_pending(self, rule_index: int, separator: str):
+        state = self.pending[rule_index]
+        stripped = separator.rstrip('\n')
+        if stripped:
+            state[1] = stripped[-1]
+            state[2] = state[0] + len(stripped) - 1
+        state[0] += len(separator)
+
+    def _resolve_pending(self, chunk: str):
+        """Finish matches whose separator run continued past the previous chunk."""
+        for rule_index in list(self.pending):
+            separator_end = EXTRACTION_RULES[rule_index].separator.match(chunk).end()
+            if separator_end == len(chunk):
+                self._extend_pending(rule_index, chunk)
+                continue
+            line_end = chunk.find('\n', separator_end)
+            if line_end == -1:
+                line_end = len(chunk)
+            del self.pending[rule_index]
+            self._add_match(rule_index, chunk[separator_end:line_end], self.offset + line_end)
+
+    def _close_pending(self):
+        """At end of input the regex backtracks to the last non-newline separator char."""
+        for rule_index, (_, last_char, last_index) in self.pending.items():
+            if last_index >= EXTRACTION_RULES[rule_index].min_separator:
+                self._add_match(rule_index, last_char, self.offset)
+        self.pending = {}
+
+    def _scan_description(self, chunk: str):
+        """Collect the first paragraph lines before the first section break."""
+        position = 0
+        while position <= len(chunk):
+            line_end = chunk.find('\n', position)
+            if line_end == -1:
+                line_end = len(chunk)
+            line = chunk[position:line_end]
+            position = line_end + 1
+
+            if line.startswith('##') or line.startswith('---'):
+                if self.in_description:
+                    self.description_done = True
+                    return
+            elif line.strip() and not line.startswith('#'):
+                self.in_description = True
+                self.description_lines.append(line.strip())
+                if len(self.description_lines) == 3:
+                    # Only the first 3 lines are used
+                    self.description_done = True
+                    return
+
+    def result(self) -> Dict[str, Any]:
+        """Close the input and return the parsed fields."""
+        self._close_pending()
+        parsed_data = {
+            "title": "",
+            "description": "",
+            "status": "",
+            "progress": 0,
+            "completed_features": [],
+            "in_progress_features": [],
+            "todo_features": [],
+            "tech_stack": [],
+            "key_achievements": [],
+            "next_steps": [],
+            "business_model": "",
+            "market_analysis": "",
+            "risks": [],
+            "timeline": ""
+        }
+
+        if self.description_lines:
+            parsed_data["description"] = ' '.join(self.description_lines[:3])
+
+        chosen = set()
+        for rule, matches in zip(EXTRACTION_RULES, self.matches):
+            if not matches:
+                continue
+            if rule.category == "tech_stack":
+                # Split by common delimiters and clean up
+                for match in matches:
+                    for tech in TECH_SPLIT_RE.split(match):
+                        tech = tech.strip()
+                        if tech and len(tech) > 2:
+                            parsed_data["tech_stack"].append(tech)
+            elif rule.first_only:
+                # First pattern with a match wins, even if it strips to ""
+                if rule.category not in chosen:
+                    chosen.add(rule.category)
+                    parsed_data[rule.category] = matches[0].strip()
+            else:
+                parsed_data[rule.category].extend(m.strip() for m in matches)
+
+        return parsed_data
+
+
+class ScanManifest:
+    """Persistent per-file record of parsed markdown so unchanged files are not re-parsed.
+
+    Entries are keyed by path relative to the projects root and hold the file's
+    size, mtime, content hash and cached parse_markdown_file result. Only files
+    seen during the current scan are written back, so deleted files drop out.
+    """
+
+    def __init__(self, manifest_file: Optional[str] = None, full_scan: bool = False):
+        self.manifest_file = Path(manifest_file) if manifest_file else None
+        self.previous = {}
+        self.current = {}
+        if self.manifest_file and not full_scan:
+            self.load()
+
+    def load(self):
+        """Load entries from a previous scan, ignoring missing or outdated manifests."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable manifest {self.manifest_file}: {e}")
+            return
+
+        if manifest.get("version") == MANIFEST_VERSION:
+            self.previous = manifest.get("files", {})
+
+    def lookup_stat(self, key: str, size: int, mtime_ns: int) -> Optional[Dict[str, Any]]:
+        """Return the cached entry if the file's size and mtime are unchanged."""
+        entry = self.previous.get(key)
+        if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+            return entry
+        return None
+
+    def lookup_hash(self, key: str, sha256: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry if the file was touched but its content is unchanged."""
+        entry = self.previous.get(key)
+        if entry and entry["sha256"] == sha256:
+            return entry
+        return None
+
+    def known_sha256(self, key: str) -> Optional[str]:
+        """Content hash recorded for key by the previous scan, if any."""
+        entry = self.previous.get(key)
+        return entry["sha256"] if entry else None
+
+    def record(self, key: str, size: int, mtime_ns: int, sha256: str, data: Dict[str, Any]):
+        """Record a file seen during the current scan."""
+        self.current[key] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": sha256,
+            "data": data
+        }
+
+    def start_rescan(self, prefixes: Iterable[str]):
+        """Begin another pass in the same process, forgetting entries under prefixes.
+
+        Entries outside the prefixes are carried over as seen; files under them
+        are recorded again as they are reloaded, so deleted ones drop out.
+        """
+        prefixes = tuple(prefixes)
+        self.previous = self.current
+        self.current = {key: entry for key, entry in self.previous.items() if not key.startswith(prefixes)}
+
+    def save(self):
+        """Write the entries seen during this scan back to disk."""
+        if not self.manifest_file:
+            return
+        write_json_atomic(self.manifest_file, {
+            "version": MANIFEST_VERSION,
+            "files": self.current
+        })
+
 
 class AIProjectScanner:
-    def __init__(self, projects_root: str = "../"):
+    def __init__(self, projects_root: str = "../", manifest_file: Optional[str] = None,
+                 full_scan: bool = False, jobs: int = 1, stream_threshold: int = STREAM_THRESHOLD,
+                 discovery: Optional[ProjectDiscovery] = None, output_format: str = "json",
+                 schema: str = "full", quiet: bool = False, profiler: Optional[Profiler] = None,
+                 index: Optional[CorpusIndex] = None):
         self.projects_root = Path(projects_root)
         self.projects_data = {}
+        self.project_paths = {}
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.stream_threshold = stream_threshold
+        self.discovery = discovery
+        self.output_format = output_format
+        self.schema = schema
+        self.quiet = quiet
+        self.profiler = profiler or Profiler()
+        self.index = index
+        if index:
+            self.manifest = IndexedManifest(index, self.projects_root, "scanner", MANIFEST_VERSION, full_scan)
+        else:
+            self.manifest = ScanManifest(manifest_file, full_scan)
         
     def scan_for_projects(self) -> Dict[str, Any]:
         """Scan for project folders and their markdown files."""
         print("🔍 Scanning for project folders...")
         
+        with self.profiler.phase("discover"):
+            project_folders = self.find_project_folders()
+        for project_name, project_path in project_folders:
+            if project_path.exists() and project_path.is_dir():
+                print(f"📁 Found project: {project_name}")
+                self.project_paths[project_name] = project_path
+            else:
+                print(f"⚠️  Project folder not found: {project_name}")
+        
+        self.projects_data.update(self.analyze_projects(self.project_paths))
+        return self.projects_data
+    
+    def find_project_folders(self) -> List[Tuple[str, Path]]:
+        """Return (name, path) for each candidate project folder."""
+        if self.discovery:
+            return self.discovery.find(self.projects_root)
+        
         # Known project folders based on the analysis
         known_projects = [
             "DIYAPP", "BusinessLoclAi", "AiAutoAgency", 
             "CryptoTradingBot", "StockTradingBot"
         ]
+        return [(name, self.projects_root / name) for name in known_projects]
+    
+    def analyze_projects(self, project_paths: Dict[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Find, parse and merge the markdown files of the given projects."""
+        found_projects = []
+        for project_name, project_path in project_paths.items():
+            with self.profiler.phase("walk"):
+                md_files = self.find_markdown_files(project_path)
+            print(f"   📄 {project_name}: {len(md_files)} markdown files")
+            found_projects.append((project_name, md_files))
+        
+        # Parse the files of every project in one batch so --jobs can spread
+        # work across projects as well as across files
+        all_files = [md_file for _, md_files in found_projects for md_file in md_files]
+        all_data = self.load_markdown_files(all_files)
+        
+        projects_data = {}
+        offset = 0
+        for project_name, md_files in found_projects:
+            files_data = all_data[offset:offset + len(md_files)]
+            offset += len(md_files)
+            with self.profiler.phase("merge"):
+                projects_data[project_name] = self.build_project_data(project_name, md_files, files_data)
+        return projects_data
+    
+    def rescan(self, changed_paths: Iterable[str], output_file: str):
+        """Re-parse only the projects touched by changed_paths and rewrite the output."""
+        affected, removed = self.update_projects(changed_paths)
+        if not affected and not removed:
+            return
+        
+        with self.profiler.phase("write"):
+            self.save_to_json(output_file)
+        with self.profiler.phase("manifest_save"):
+            self.manifest.save()
+        print(f"🔄 Updated {len(affected)} project(s), removed {len(removed)}")
+    
+    def update_projects(self, changed_paths: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """Re-parse the projects touched by changed_paths in projects_data; return (affected, removed) names."""
+        changed = [Path(path) for path in changed_paths]
+        folders = {name: path for name, path in self.find_project_folders() if path.is_dir()}
+        
+        affected = {name for name in folders if name not in self.project_paths}
+        removed = set(self.project_paths) - set(folders)
+        for name, project_path in folders.items():
+            for path in changed:
+                if path == project_path or project_path in path.parents or path in project_path.parents:
+                    affected.add(name)
+                    break
         
-        for project_name in known_projects:
-            project_path = self.projects_root / project_name
-            if project_path.exists() and project_path.is_dir():
-                print(f"📁 Found project: {project_name}")
-                self.projects_data[project_name] = self.analyze_project_folder(project_path, project_name)
-            else:
-                print(f"⚠️  Project folder not found: {project_name}")
-                
-        return self.projects_data
+        if not affected and not removed:
+            return affected, removed
+        
+        old_paths = self.project_paths
+        self.project_paths = folders
+        self.manifest.start_rescan(
+            [self.manifest_prefix(old_paths[name]) for name in removed] +
+            [self.manifest_prefix(folders[name]) for name in affected]
+        )
+        updated = self.analyze_projects({name: folders[name] for name in folders if name in affected})
+        self.projects_data = {
+            name: updated[name] if name in updated else self.projects_data[name]
+            for name in folders
+        }
+        return affected, removed
+    
+    def manifest_prefix(self, project_path: Path) -> str:
+        """Manifest key prefix shared by every file of a project."""
+        return str(project_path.relative_to(self.projects_root)) + os.sep
+    
+    def watch_roots(self) -> List[str]:
+        """Folders to watch for changes to the scanned projects."""
+        if self.discovery:
+            # New projects can appear anywhere under the root
+            return [str(self.projects_root)]
+        return [str(path) for path in self.project_paths.values()]
+    
+    def watch(self, output_file: str, debounce: float = 0.5, poll_interval: float = 2.0,
+              force_polling: bool = False):
+        """Keep output_file up to date, rescanning projects whose files change."""
+        self.run_scan(output_file)
+        
+        roots = self.watch_roots()
+        watcher = create_watcher(roots, WATCH_SUFFIXES, poll_interval, force_polling)
+        print(f"\n👀 Watching {len(roots)} folder(s) with {type(watcher).__name__} (Ctrl+C to stop)")
+        
+        try:
+            while True:
+                changed = watcher.wait()
+                # Debounce: keep collecting until the burst of events goes quiet
+                while True:
+                    more = watcher.wait(debounce)
+                    if not more:
+                        break
+                    changed |= more
+                print(f"\n🔔 {len(changed)} change(s) detected")
+                self.rescan(changed, output_file)
+        except KeyboardInterrupt:
+            print("\n👋 Watch mode stopped")
+        finally:
+            watcher.close()
     
     def analyze_project_folder(self, project_path: Path, project_name: str) -> Dict[str, Any]:
         """Analyze a single project folder for markdown files and extract information."""
+        md_files = self.find_markdown_files(project_path)
+        print(f"   📄 Found {len(md_files)} markdown files")
+        return self.build_project_data(project_name, md_files, self.load_markdown_files(md_files))
+    
+    def find_markdown_files(self, project_path: Path) -> List[Path]:
+        """Find all markdown files in a project folder, skipping ignored directories."""
+        if self.index:
+            return self.index.walk_files(project_path, suffixes=(".md",))
+        return list(walk_files(project_path, suffixes=(".md",)))
+    
+    def build_project_data(self, project_name: str, md_files: List[Path],
+                           files_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge parsed markdown files, in order, into a project record."""
+        if self.schema == "compact":
+            return self.build_compact_project(project_name, md_files, files_data)
+        
         project_data = {
             "name": project_name,
             "description": "",
@@ -59,15 +610,7 @@ class AIProjectScanner:
             "markdown_files": []
         }
         
-        # Find all markdown files in the project folder
-        md_files = list(project_path.glob("**/*.md"))
-        md_files = [f for f in md_files if "node_modules" not in str(f)]
-        
-        print(f"   📄 Found {len(md_files)} markdown files")
-        
-        for md_file in md_files:
-            print(f"   📖 Analyzing: {md_file.name}")
-            file_data = self.parse_markdown_file(md_file)
+        for md_file, file_data in zip(md_files, files_data):
             project_data["markdown_files"].append({
                 "filename": md_file.name,
                 "path": str(md_file.relative_to(self.projects_root)),
@@ -85,148 +628,107 @@ class AIProjectScanner:
         
         return project_data
     
+    def build_compact_project(self, project_name: str, md_files: List[Path],
+                              files_data: List[Dict[str, Any]]) -> ProjectRecord:
+        """Build a compact-schema project: one feature table, per-file entries by index."""
+        project = ProjectRecord(project_name, datetime.now().isoformat())
+        for md_file, file_data in zip(md_files, files_data):
+            project.add_file(md_file.name, str(md_file.relative_to(self.projects_root)), file_data)
+        
+        counts = project.raw_counts
+        project.progress = self.progress_from_counts(
+            counts["completed_features"], counts["in_progress_features"], counts["todo_features"]
+        )
+        project.short_description = self.generate_short_description(project)
+        return project
+    
+    def load_markdown_files(self, md_files: List[Path]) -> List[Dict[str, Any]]:
+        """Return parsed data for each file in order, reusing the manifest for unchanged files.
+
+        Files that need reading are parsed in a process pool when jobs > 1; results
+        are collected in input order so the merged output matches the serial path.
+        """
+        files_data = [{} for _ in md_files]
+        pending = []
+        
+        with self.profiler.phase("manifest_lookup"):
+            for index, md_file in enumerate(md_files):
+                key = str(md_file.relative_to(self.projects_root))
+                try:
+                    stat = md_file.stat()
+                except Exception as e:
+                    print(f"   ❌ Error reading {md_file}: {e}")
+                    continue
+                
+                entry = self.manifest.lookup_stat(key, stat.st_size, stat.st_mtime_ns)
+                if entry is not None:
+                    if not self.quiet:
+                        print(f"   ♻️  Unchanged: {md_file.name}")
+                    self.manifest.record(key, stat.st_size, stat.st_mtime_ns, entry["sha256"], entry["data"])
+                    files_data[index] = entry["data"]
+                    continue
+                
+                if not self.quiet:
+                    print(f"   📖 Analyzing: {md_file.name}")
+                pending.append((index, key, stat, self.manifest.known_sha256(key)))
+        
+        jobs = [(type(self), str(md_files[index]), known_sha256, self.stream_threshold)
+                for index, _, _, known_sha256 in pending]
+        with self.profiler.phase("parse_files"):
+            results = self.run_parse_jobs(jobs)
+        for (index, key, stat, _), (sha256, file_data, timing) in zip(pending, results):
+            self.record_file_timing(key, timing)
+            if sha256 is None:
+                continue
+            if file_data is None:
+                # Touched but byte-identical: reuse the cached parse
+                file_data = self.manifest.lookup_hash(key, sha256)["data"]
+            self.manifest.record(key, stat.st_size, stat.st_mtime_ns, sha256, file_data)
+            files_data[index] = file_data
+        
+        return files_data
+    
+    def record_file_timing(self, key: str, timing: Dict[str, float]):
+        """Add a parse_file_job timing to the profiler's read/extract phases and file list."""
+        self.profiler.add_phase("read", timing["read"], timing["read_cpu"])
+        self.profiler.add_phase("extract", timing["extract"], timing["extract_cpu"])
+        self.profiler.record_file(key, timing["read"] + timing["extract"],
+                                  timing["read_cpu"] + timing["extract_cpu"], timing["bytes"],
+                                  {"read": timing["read"], "extract": timing["extract"]})
+    
+    def run_parse_jobs(self, jobs: List[Tuple]) -> List[Tuple[Optional[str], Optional[Dict[str, Any]], Dict[str, float]]]:
+        """Run parse_file_job for each job, in a process pool when jobs > 1."""
+        if self.jobs > 1 and len(jobs) > 1:
+            workers = min(self.jobs, len(jobs))
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(parse_file_job, *zip(*jobs), chunksize=chunksize))
+        return [parse_file_job(*job) for job in jobs]
+    
     def parse_markdown_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse a markdown file and extract structured information."""
         try:
+            if Path(file_path).stat().st_size > self.stream_threshold:
+                with open(file_path, 'rb') as f:
+                    return self.parse_markdown_chunks(iter_markdown_chunks(f))
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
         except Exception as e:
             print(f"   ❌ Error reading {file_path}: {e}")
             return {}
         
-        parsed_data = {
-            "title": "",
-            "description": "",
-            "status": "",
-            "progress": 0,
-            "completed_features": [],
-            "in_progress_features": [],
-            "todo_features": [],
-            "tech_stack": [],
-            "key_achievements": [],
-            "next_steps": [],
-            "business_model": "",
-            "market_analysis": "",
-            "risks": [],
-            "timeline": ""
-        }
-        
-        # Extract title from first heading
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        if title_match:
-            parsed_data["title"] = title_match.group(1).strip()
-        
-        # Extract description from content
-        lines = content.split('\n')
-        description_lines = []
-        in_description = False
-        
-        for line in lines:
-            if line.startswith('##') or line.startswith('---'):
-                if in_description:
-                    break
-            elif line.strip() and not line.startswith('#'):
-                if not in_description:
-                    in_description = True
-                description_lines.append(line.strip())
-        
-        if description_lines:
-            parsed_data["description"] = ' '.join(description_lines[:3])  # First 3 lines
-        
-        # Extract features by status
-        self.extract_features_by_status(content, parsed_data)
-        
-        # Extract tech stack
-        self.extract_tech_stack(content, parsed_data)
-        
-        # Extract business information
-        self.extract_business_info(content, parsed_data)
-        
-        return parsed_data
-    
-    def extract_features_by_status(self, content: str, parsed_data: Dict[str, Any]):
-        """Extract features categorized by their status."""
-        # Look for completed features
-        completed_patterns = [
-            r'✅\s*(.+)',
-            r'- \[x\]\s*(.+)',
-            r'COMPLETED[:\s]+(.+)',
-            r'DONE[:\s]+(.+)'
-        ]
-        
-        for pattern in completed_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            parsed_data["completed_features"].extend([m.strip() for m in matches])
-        
-        # Look for in-progress features
-        in_progress_patterns = [
-            r'🔄\s*(.+)',
-            r'IN PROGRESS[:\s]+(.+)',
-            r'WORKING ON[:\s]+(.+)'
-        ]
-        
-        for pattern in in_progress_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            parsed_data["in_progress_features"].extend([m.strip() for m in matches])
-        
-        # Look for todo features
-        todo_patterns = [
-            r'- \[ \]\s*(.+)',
-            r'TODO[:\s]+(.+)',
-            r'NEEDS WORK[:\s]+(.+)',
-            r'NEXT STEPS[:\s]+(.+)'
-        ]
-        
-        for pattern in todo_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            parsed_data["todo_features"].extend([m.strip() for m in matches])
-    
-    def extract_tech_stack(self, content: str, parsed_data: Dict[str, Any]):
-        """Extract technology stack information."""
-        tech_patterns = [
-            r'Tech Stack[:\s]+(.+)',
-            r'Technologies[:\s]+(.+)',
-            r'Built with[:\s]+(.+)',
-            r'Stack[:\s]+(.+)'
-        ]
-        
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                # Split by common delimiters and clean up
-                tech_items = re.split(r'[,•\n]+', match)
-                for tech in tech_items:
-                    tech = tech.strip()
-                    if tech and len(tech) > 2:
-                        parsed_data["tech_stack"].append(tech)
-    
-    def extract_business_info(self, content: str, parsed_data: Dict[str, Any]):
-        """Extract business-related information."""
-        # Business model
-        business_patterns = [
-            r'Business Model[:\s]+(.+)',
-            r'Revenue Model[:\s]+(.+)',
-            r'Pricing[:\s]+(.+)'
-        ]
-        
-        for pattern in business_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                parsed_data["business_model"] = matches[0].strip()
-                break
-        
-        # Market analysis
-        market_patterns = [
-            r'Market Analysis[:\s]+(.+)',
-            r'Market Opportunity[:\s]+(.+)',
-            r'Industry Trends[:\s]+(.+)'
-        ]
-        
-        for pattern in market_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                parsed_data["market_analysis"] = matches[0].strip()
-                break
+        return self.parse_markdown_content(content)
+
+    def parse_markdown_content(self, content: str) -> Dict[str, Any]:
+        """Extract structured information from markdown text."""
+        return self.parse_markdown_chunks([content])
+
+    def parse_markdown_chunks(self, chunks: Iterable[str]) -> Dict[str, Any]:
+        """Extract structured information from markdown text split on line boundaries."""
+        engine = ExtractionEngine()
+        for chunk in chunks:
+            engine.feed(chunk)
+        return engine.result()
     
     def merge_project_data(self, project_data: Dict[str, Any], file_data: Dict[str, Any]):
         """Merge information from multiple markdown files into project data."""
@@ -256,18 +758,22 @@ class AIProjectScanner:
     
     def calculate_progress(self, project_data: Dict[str, Any]) -> int:
         """Calculate overall project progress based on completed features."""
-        total_features = (
-            len(project_data["completed_features"]) +
-            len(project_data["in_progress_features"]) +
+        return self.progress_from_counts(
+            len(project_data["completed_features"]),
+            len(project_data["in_progress_features"]),
             len(project_data["todo_features"])
         )
+    
+    def progress_from_counts(self, completed: int, in_progress: int, todo: int) -> int:
+        """Progress percentage from feature counts."""
+        total_features = completed + in_progress + todo
         
         if total_features == 0:
             return 0
         
         # Weight completed features higher than in-progress
-        completed_weight = len(project_data["completed_features"]) * 1.0
-        in_progress_weight = len(project_data["in_progress_features"]) * 0.5
+        completed_weight = completed * 1.0
+        in_progress_weight = in_progress * 0.5
         
         progress = int(((completed_weight + in_progress_weight) / total_features) * 100)
         return min(progress, 100)
@@ -353,15 +859,25 @@ class AIProjectScanner:
         return report
     
     def save_to_json(self, output_file: str = "ai_project_analysis.json"):
-        """Save the analyzed data to a JSON file."""
-        # Update status for all projects
+        """Save the analyzed data as JSON, per-project shards or NDJSON (see output_format)."""
+        output_path = resolve_output_path(output_file, self.output_format)
+        projects = self.serialize_projects()
+        if self.output_format == "shards":
+            written = write_json_shards(output_path, projects)
+            print(f"💾 Project data saved to {output_path}/ ({written} shard(s) rewritten)")
+            return
+        if self.output_format == "ndjson":
+            write_ndjson_atomic(output_path, projects.values())
+        else:
+            write_json_atomic(output_path, projects, indent=2)
+        
+        print(f"💾 Project data saved to {output_path}")
+    
+    def serialize_projects(self) -> Dict[str, Dict[str, Any]]:
+        """Update every project's status and return the projects as JSON-serializable dicts."""
         for project_data in self.projects_data.values():
             project_data["status"] = self.determine_status(project_data)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.projects_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"💾 Project data saved to {output_file}")
+        return {name: to_json(project_data) for name, project_data in self.projects_data.items()}
     
     def run_scan(self, output_file: str = "ai_project_analysis.json") -> Dict[str, Any]:
         """Run the complete project scanning process."""
@@ -371,14 +887,18 @@ class AIProjectScanner:
         projects_data = self.scan_for_projects()
         
         # Generate and display report
-        report = self.generate_report()
+        with self.profiler.phase("report"):
+            report = self.generate_report()
         print("\n" + "="*60)
         print("📋 SCANNING REPORT")
         print("="*60)
         print(report)
         
         # Save to JSON
-        self.save_to_json(output_file)
+        with self.profiler.phase("write"):
+            self.save_to_json(output_file)
+        with self.profiler.phase("manifest_save"):
+            self.manifest.save()
         
         print(f"\n✅ Scan complete! Found {len(projects_data)} projects.")
         return projects_data
@@ -387,11 +907,48 @@ def main():
     parser = argparse.ArgumentParser(description="AI Project Scanner Agent")
     parser.add_argument("--root", default="../", help="Root directory to scan for projects")
     parser.add_argument("--output", default="ai_project_analysis.json", help="Output JSON file")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="json",
+                        help="json: one document; shards: a directory with one file per project "
+                             "plus index.json; ndjson: one project per line")
+    parser.add_argument("--schema", choices=("full", "compact"), default="full",
+                        help="compact: deduplicated per-project feature table referenced by index")
+    parser.add_argument("--manifest", default="ai_project_manifest.json",
+                        help="Manifest file used to skip unchanged markdown files")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore the manifest and re-parse every markdown file")
+    parser.add_argument("--index", metavar="FILE",
+                        help="SQLite corpus index shared with project_analyzer.py; replaces --manifest "
+                             "and caches folder listings")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Worker processes for parsing markdown files (0 = one per CPU)")
+    parser.add_argument("--stream-threshold", type=int, default=STREAM_THRESHOLD,
+                        help="Parse files larger than this many bytes as a stream")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and update the output whenever project files change")
+    parser.add_argument("--debounce", type=float, default=0.5,
+                        help="Seconds of quiet to wait for after a change before rescanning")
+    parser.add_argument("--poll-interval", type=float, default=2.0,
+                        help="Seconds between scans when inotify is unavailable")
+    parser.add_argument("--polling", action="store_true",
+                        help="Use polling instead of inotify in watch mode")
+    add_discovery_arguments(parser)
+    add_profile_arguments(parser, "ai_project_profile.json")
     
     args = parser.parse_args()
     
-    scanner = AIProjectScanner(args.root)
+    scanner = AIProjectScanner(args.root, manifest_file=args.manifest, full_scan=args.full,
+                             jobs=args.jobs, stream_threshold=args.stream_threshold,
+                             discovery=discovery_from_args(args), output_format=args.output_format,
+                             schema=args.schema, quiet=args.quiet, profiler=Profiler(args.profile_top),
+                             index=CorpusIndex(args.index) if args.index else None)
+    if args.watch:
+        scanner.watch(args.output, args.debounce, args.poll_interval, args.polling)
+        if args.profile:
+            scanner.profiler.save(args.profile)
+        return
     projects_data = scanner.run_scan(args.output)
+    if args.profile:
+        scanner.profiler.save(args.profile)
     
     # Print summary
     print("\n📊 PROJECT SUMMARY:")
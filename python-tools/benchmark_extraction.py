@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Extraction Benchmark
+Compares the single-pass ExtractionEngine against the previous one-findall-per-pattern
+extraction on a synthetic markdown document, and checks both produce the same parsed data.
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, Any
+
+from ai_project_scanner import AIProjectScanner
+from synthetic_corpus import generate_markdown
+
+
+def legacy_parse(content: str) -> Dict[str, Any]:
+    """The previous parse_markdown_file body: one re.findall sweep per pattern."""
+    parsed_data = {
+        "title": "", "description": "", "status": "", "progress": 0,
+        "completed_features": [], "in_progress_features": [], "todo_features": [],
+        "tech_stack": [], "key_achievements": [], "next_steps": [],
+        "business_model": "", "market_analysis": "", "risks": [], "timeline": ""
+    }
+    flags = re.IGNORECASE | re.MULTILINE
+
+    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    if title_match:
+        parsed_data["title"] = title_match.group(1).strip()
+
+    description_lines = []
+    in_description = False
+    for line in content.split('\n'):
+        if line.startswith('##') or line.startswith('---'):
+            if in_description:
+                break
+        elif line.strip() and not line.startswith('#'):
+            in_description = True
+            description_lines.append(line.strip())
+    if description_lines:
+        parsed_data["description"] = ' '.join(description_lines[:3])
+
+    feature_patterns = {
+        "completed_features": [r'✅\s*(.+)', r'- \[x\]\s*(.+)', r'COMPLETED[:\s]+(.+)', r'DONE[:\s]+(.+)'],
+        "in_progress_features": [r'🔄\s*(.+)', r'IN PROGRESS[:\s]+(.+)', r'WORKING ON[:\s]+(.+)'],
+        "todo_features": [r'- \[ \]\s*(.+)', r'TODO[:\s]+(.+)', r'NEEDS WORK[:\s]+(.+)',
+                          r'NEXT STEPS[:\s]+(.+)'],
+    }
+    for field, patterns in feature_patterns.items():
+        for pattern in patterns:
+            parsed_data[field].extend(m.strip() for m in re.findall(pattern, content, flags))
+
+    for pattern in [r'Tech Stack[:\s]+(.+)', r'Technologies[:\s]+(.+)', r'Built with[:\s]+(.+)',
+                    r'Stack[:\s]+(.+)']:
+        for match in re.findall(pattern, content, flags):
+            for tech in re.split(r'[,•\n]+', match):
+                tech = tech.strip()
+                if tech and len(tech) > 2:
+                    parsed_data["tech_stack"].append(tech)
+
+    first_match_fields = {
+        "business_model": [r'Business Model[:\s]+(.+)', r'Revenue Model[:\s]+(.+)', r'Pricing[:\s]+(.+)'],
+        "market_analysis": [r'Market Analysis[:\s]+(.+)', r'Market Opportunity[:\s]+(.+)',
+                            r'Industry Trends[:\s]+(.+)'],
+    }
+    for field, patterns in first_match_fields.items():
+        for pattern in patterns:
+            matches = re.findall(pattern, content, flags)
+            if matches:
+                parsed_data[field] = matches[0].strip()
+                break
+
+    return parsed_data
+
+
+def best_time(func, content: str, repeat: int) -> float:
+    """Return the fastest of repeat runs of func(content), in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark markdown field extraction")
+    parser.add_argument("--sizes", default="100000,1000000,10000000",
+                        help="Comma-separated document sizes in bytes")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    scanner = AIProjectScanner()
+    print(f"{'size':>12} {'legacy (s)':>12} {'engine (s)':>12} {'speedup':>8}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        content = generate_markdown(size)
+        if legacy_parse(content) != scanner.parse_markdown_content(content):
+            raise SystemExit(f"❌ Engine output differs from legacy extraction at {size} bytes")
+        legacy = best_time(legacy_parse, content, args.repeat)
+        engine = best_time(scanner.parse_markdown_content, content, args.repeat)
+        print(f"{len(content.encode('utf-8')):>12} {legacy:>12.4f} {engine:>12.4f} {legacy / engine:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+Times the analysis tools on a synthetic project corpus: a full and an incremental
+AIProjectScanner.run_scan, parse_markdown_file over every file, save_to_json and
+ProjectAnalyzer.run_full_analysis. Results are written as JSON, tagged with the git
+commit, so runs can be compared between commits with --compare.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ai_project_scanner import AIProjectScanner
+from project_analyzer import ProjectAnalyzer
+from project_walker import ProjectDiscovery, walk_files
+from synthetic_corpus import add_corpus_arguments, corpus_from_args
+
+RESULTS_VERSION = 1
+RESULTS_DIR = "benchmark_results"
+# A benchmark this much slower than the compared run is reported as a regression
+REGRESSION_THRESHOLD = 1.10
+
+
+def git_commit() -> str:
+    """Short hash of HEAD, with -dirty for uncommitted changes, or "unknown" outside git."""
+    cwd = Path(__file__).resolve().parent
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=cwd,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def measure(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """Run func repeat times, with its console output discarded; return wall and CPU timings.
+
+    setup runs before each repetition, outside the timed region.
+    """
+    wall_times = []
+    cpu_times = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            if setup:
+                setup()
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            func()
+            cpu_times.append(time.process_time() - cpu_start)
+            wall_times.append(time.perf_counter() - wall_start)
+    return {
+        "runs": repeat,
+        "best": min(wall_times),
+        "median": statistics.median(wall_times),
+        "mean": statistics.mean(wall_times),
+        "cpu_best": min(cpu_times)
+    }
+
+
+class BenchmarkSuite:
+    """Benchmarks run against one corpus, with scratch files kept in work_dir."""
+
+    def __init__(self, corpus_root: Path, work_dir: Path, repeat: int = 3, jobs: int = 1):
+        self.corpus_root = corpus_root
+        self.work_dir = work_dir
+        self.repeat = repeat
+        self.jobs = jobs
+        self.discovery = ProjectDiscovery(markers=("PROJECT_STATUS.md",))
+        self.manifest_file = work_dir / "manifest.json"
+        self.output_file = work_dir / "scan.json"
+
+    def new_scanner(self, full_scan: bool = True) -> AIProjectScanner:
+        return AIProjectScanner(str(self.corpus_root), manifest_file=str(self.manifest_file),
+                                full_scan=full_scan, jobs=self.jobs, discovery=self.discovery)
+
+    def bench_run_scan(self) -> Dict[str, Any]:
+        return measure(lambda: self.new_scanner().run_scan(str(self.output_file)), self.repeat)
+
+    def bench_run_scan_incremental(self) -> Dict[str, Any]:
+        # Warm the manifest so every file is served from it
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            self.new_scanner().run_scan(str(self.output_file))
+        return measure(lambda: self.new_scanner(full_scan=False).run_scan(str(self.output_file)), self.repeat)
+
+    def bench_parse_markdown_file(self) -> Dict[str, Any]:
+        scanner = self.new_scanner()
+        md_files = list(walk_files(self.corpus_root, suffixes=('.md',)))
+        result = measure(lambda: [scanner.parse_markdown_file(path) for path in md_files], self.repeat)
+        result["files"] = len(md_files)
+        result["per_file_best"] = result["best"] / len(md_files) if md_files else 0.0
+        return result
+
+    def bench_save_to_json(self) -> Dict[str, Any]:
+        scanner = self.new_scanner()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            scanner.scan_for_projects()
+        return measure(lambda: scanner.save_to_json(str(self.output_file)), self.repeat)
+
+    def bench_run_full_analysis(self) -> Dict[str, Any]:
+        # run_full_analysis saves project_analysis.json to the working directory
+        previous_cwd = os.getcwd()
+        os.chdir(self.work_dir)
+        try:
+            return measure(lambda: ProjectAnalyzer(str(self.corpus_root), discovery=self.discovery).run_full_analysis(),
+                           self.repeat)
+        finally:
+            os.chdir(previous_cwd)
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        benchmarks = {
+            "run_scan": self.bench_run_scan,
+            "run_scan_incremental": self.bench_run_scan_incremental,
+            "parse_markdown_file": self.bench_parse_markdown_file,
+            "save_to_json": self.bench_save_to_json,
+            "run_full_analysis": self.bench_run_full_analysis
+        }
+        results = {}
+        for name, bench in benchmarks.items():
+            results[name] = bench()
+            print(f"  {name:<24} best {results[name]['best']:.4f}s  median {results[name]['median']:.4f}s")
+        return results
+
+
+def compare_results(current: Dict[str, Any], previous: Dict[str, Any]) -> bool:
+    """Print best-time ratios against a previous results file; return True if any benchmark regressed."""
+    print(f"\n📊 Compared with {previous.get('commit', 'unknown')}:")
+    if previous.get("corpus", {}).get("bytes") != current["corpus"]["bytes"]:
+        print("⚠️  The corpora differ, so timings are not directly comparable")
+
+    regressed = False
+    for name, result in current["benchmarks"].items():
+        old = previous.get("benchmarks", {}).get(name)
+        if not old:
+            print(f"  {name:<24} (new)")
+            continue
+        ratio = result["best"] / old["best"] if old["best"] else float("inf")
+        flag = ""
+        if ratio > REGRESSION_THRESHOLD:
+            flag = "  ❌ regression"
+            regressed = True
+        print(f"  {name:<24} {old['best']:.4f}s -> {result['best']:.4f}s ({ratio:.2f}x){flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Python analysis tools on a synthetic corpus")
+    add_corpus_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (best, median and mean are kept)")
+    parser.add_argument("--jobs", type=int, default=1, help="Scanner worker processes")
+    parser.add_argument("--corpus", help="Generate the corpus here and keep it (default: a temporary directory)")
+    parser.add_argument("--output", help=f"Results file (default: {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument("--compare", help="Previous results file to compare against; exits 1 on a regression")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    with tempfile.TemporaryDirectory(prefix="projectstatus-bench-") as tmp:
+        tmp = Path(tmp)
+        corpus_root = Path(args.corpus) if args.corpus else tmp / "corpus"
+        work_dir = tmp / "work"
+        work_dir.mkdir()
+
+        print("🏗️  Generating synthetic corpus...")
+        corpus = corpus_from_args(corpus_root, args)
+        print(f"  {corpus['files']} files, {corpus['bytes']:,} bytes in {corpus['projects']} projects")
+
+        print("⏱️  Running benchmarks...")
+        benchmarks = BenchmarkSuite(corpus_root, work_dir, repeat=args.repeat, jobs=args.jobs).run()
+
+    results = {
+        "version": RESULTS_VERSION,
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "jobs": args.jobs,
+        "corpus": {key: value for key, value in corpus.items() if key != "root"},
+        "benchmarks": benchmarks
+    }
+
+    output_file = Path(args.output) if args.output else Path(RESULTS_DIR) / f"{commit}.json"
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results saved to {output_file}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        if compare_results(results, previous):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Compact Schema
+Slotted in-memory records for the scanner's compact output schema. Each project keeps
+one deduplicated feature table; project-level lists and per-file entries refer to it
+by index instead of repeating the strings.
+"""
+
+from typing import Any, Dict, Optional
+
+LIST_FIELDS = (
+    "completed_features", "in_progress_features", "todo_features", "tech_stack",
+    "key_achievements", "next_steps", "risks"
+)
+FILE_SCALAR_FIELDS = ("title", "description", "status", "progress", "business_model",
+                      "market_analysis", "timeline")
+PROJECT_SCALAR_FIELDS = ("name", "description", "short_description", "status", "progress",
+                         "business_model", "market_analysis", "timeline", "last_updated")
+
+
+class FeatureTable:
+    """Unique feature strings of one project, in first-seen order."""
+
+    __slots__ = ("items", "positions")
+
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def add(self, text: str) -> int:
+        position = self.positions.get(text)
+        if position is None:
+            position = len(self.items)
+            self.positions[text] = position
+            self.items.append(text)
+        return position
+
+
+class FileRecord:
+    """One markdown file's parse result with its lists stored as feature-table indexes."""
+
+    __slots__ = ("filename", "path") + FILE_SCALAR_FIELDS + LIST_FIELDS
+
+    def __init__(self, filename: str, path: str, file_data: Dict[str, Any], features: FeatureTable):
+        self.filename = filename
+        self.path = path
+        for field in FILE_SCALAR_FIELDS:
+            setattr(self, field, file_data.get(field, 0 if field == "progress" else ""))
+        for field in LIST_FIELDS:
+            setattr(self, field, tuple(features.add(item) for item in file_data.get(field, ())))
+
+    def to_json(self) -> Dict[str, Any]:
+        """Serialize, omitting empty fields."""
+        entry = {"filename": self.filename, "path": self.path}
+        for field in FILE_SCALAR_FIELDS + LIST_FIELDS:
+            value = getattr(self, field)
+            if value:
+                entry[field] = list(value) if field in LIST_FIELDS else value
+        return entry
+
+
+class ProjectRecord:
+    """A project in the compact schema.
+
+    Supports the dict-style reads and status writes the scanner's report and
+    status code use; list fields read back as the (deduplicated) strings.
+    """
+
+    __slots__ = PROJECT_SCALAR_FIELDS + LIST_FIELDS + ("features", "files", "members", "raw_counts")
+
+    def __init__(self, name: str, last_updated: str):
+        self.name = name
+        self.description = ""
+        self.short_description = ""
+        self.status = "Not Started"
+        self.progress = 0
+        self.business_model = ""
+        self.market_analysis = ""
+        self.timeline = ""
+        self.last_updated = last_updated
+        self.features = FeatureTable()
+        self.files = []
+        self.members = {}
+        # List lengths before deduplication, so progress matches the full schema
+        self.raw_counts = dict.fromkeys(LIST_FIELDS, 0)
+        for field in LIST_FIELDS:
+            setattr(self, field, [])
+            self.members[field] = set()
+
+    def add_file(self, filename: str, path: str, file_data: Dict[str, Any]):
+        """Add a file and merge it into the project, skipping duplicate features."""
+        record = FileRecord(filename, path, file_data, self.features)
+        self.files.append(record)
+        for field in LIST_FIELDS:
+            project_list = getattr(self, field)
+            members = self.members[field]
+            positions = getattr(record, field)
+            self.raw_counts[field] += len(positions)
+            for position in positions:
+                if position not in members:
+                    members.add(position)
+                    project_list.append(position)
+        
+        # Other fields come from the first file that has them
+        for field in ("description", "business_model", "market_analysis"):
+            if not getattr(self, field) and file_data.get(field):
+                setattr(self, field, file_data[field])
+
+    def __getitem__(self, key: str) -> Any:
+        if key in LIST_FIELDS:
+            return [self.features.items[position] for position in getattr(self, key)]
+        if key == "markdown_files":
+            return [record.to_json() for record in self.files]
+        if key in PROJECT_SCALAR_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in PROJECT_SCALAR_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_json(self) -> Dict[str, Any]:
+        project = {"schema": "compact"}
+        for field in PROJECT_SCALAR_FIELDS:
+            project[field] = getattr(self, field)
+        project["features"] = self.features.items
+        for field in LIST_FIELDS:
+            project[field] = getattr(self, field)
+        project["markdown_files"] = [record.to_json() for record in self.files]
+        return project
+
+
+def to_json(project_data: Any) -> Dict[str, Any]:
+    """Return a JSON-serializable project, whichever schema it is in."""
+    return project_data.to_json() if isinstance(project_data, ProjectRecord) else project_data
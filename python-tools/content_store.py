@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Content Store
+Lazy, LRU-bounded access to project text files for ProjectAnalyzer. Files are keyed
+by their path relative to the project folder and only read when an analyzer asks
+for them; the most recently used contents are kept up to a shared byte budget.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+# Default budget for cached file contents across all projects
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class ContentCache:
+    """Least-recently-used file contents, bounded by their total size in bytes.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[str]:
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is None:
+                return None
+            self.entries.move_to_end(path)
+            return entry[0]
+
+    def put(self, path: Path, content: str, size: int):
+        """Cache content, evicting the least recently used entries to stay within max_bytes.
+
+        Contents bigger than the whole budget are not cached.
+        """
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(path, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self.entries[path] = (content, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+class ContentStore:
+    """Read-on-demand view of a project's files.
+
+    Keys are POSIX-style paths relative to the project folder, so same-named
+    files in different subfolders stay distinct. A bare file name that is not
+    a top-level file resolves to the shallowest file with that name.
+    """
+
+    def __init__(self, root, paths: Iterable[Path], cache: Optional[ContentCache] = None, profiler=None):
+        self.root = Path(root)
+        self.cache = cache if cache is not None else ContentCache()
+        self.profiler = profiler
+        # Size and mtime of every file handed out, and whether any read failed,
+        # so results computed from this store can be cached against them
+        self.reads = {}
+        self.failed = False
+        self.paths = {}
+        by_name = {}
+        for path in paths:
+            key = Path(path).relative_to(self.root).as_posix()
+            self.paths[key] = Path(path)
+            depth = key.count("/")
+            name = key.rsplit("/", 1)[-1]
+            if name not in by_name or depth < by_name[name][0]:
+                by_name[name] = (depth, key)
+        self.by_name = {name: key for name, (_, key) in by_name.items()}
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Return the key for a relative path or bare file name, or None if no such file."""
+        if name in self.paths:
+            return name
+        if "/" not in name:
+            return self.by_name.get(name)
+        return None
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def keys(self) -> List[str]:
+        return list(self.paths)
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return a file's text, reading it if it is not cached; default if missing or unreadable."""
+        key = self.resolve(name)
+        if key is None:
+            return default
+
+        path = self.paths[key]
+        content = self.cache.get(path)
+        if content is not None:
+            if path not in self.reads:
+                try:
+                    stat = path.stat()
+                    self.reads[path] = [stat.st_size, stat.st_mtime_ns]
+                except OSError:
+                    self.failed = True
+            return content
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stat = os.fstat(f.fileno())
+                content = f.read()
+        except Exception as e:
+            print(f"    ❌ {key}: {e}")
+            self.failed = True
+            return default
+        size = stat.st_size
+        self.reads[path] = [size, stat.st_mtime_ns]
+
+        if self.profiler:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            self.profiler.add_phase("read", wall, cpu)
+            self.profiler.record_file(str(path), wall, cpu, size)
+
+        self.cache.put(path, content, size)
+        return content
+
+    def __getitem__(self, name: str) -> str:
+        content = self.get(name)
+        if content is None:
+            raise KeyError(name)
+        return content
+
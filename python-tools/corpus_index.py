@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Corpus Index
+SQLite-backed index of the project corpus shared by the analysis tools. It caches
+each project folder's file listing (revalidated by directory and ignore-file stats
+instead of re-listing), per-file stats, hashes and extracted fields, and per-project
+results, so a run over an unchanged tree does almost no filesystem reads.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from project_walker import snapshot_tree
+
+# Bump when the schema changes; older index files are rebuilt from scratch
+INDEX_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    root TEXT PRIMARY KEY,
+    files TEXT NOT NULL,
+    directories TEXT NOT NULL,
+    ignore_files TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS fields (
+    path TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (path, tool)
+);
+"""
+TABLES = ("meta", "listings", "files", "fields")
+
+
+def _stat_key(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _path_range(directory: str) -> Tuple[str, str]:
+    """Bounds for selecting every path below directory with a primary-key range scan."""
+    prefix = os.path.join(directory, "")
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class CorpusIndex:
+    """One SQLite index file; safe to share between threads of one process.
+
+    Paths are stored absolute, so tools started with different --root
+    spellings of the same folder share entries.
+    """
+
+    def __init__(self, index_file: str):
+        self.index_file = index_file
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(index_file, timeout=30, check_same_thread=False)
+        with self.lock, self.connection:
+            # WAL lets worker processes read while another one writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(SCHEMA)
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != str(INDEX_VERSION):
+                for table in TABLES:
+                    self.connection.execute(f"DELETE FROM {table}")
+                self.connection.execute("INSERT INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),))
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def list_files(self, root) -> List[str]:
+        """Every file walk_files(root) would yield, in the same order, relative to root.
+
+        The cached listing is reused while none of the listed directories'
+        mtimes and none of the ignore files have changed, which costs one stat
+        per directory instead of reading every directory.
+        """
+        root = os.path.abspath(root)
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT files, directories, ignore_files FROM listings WHERE root = ?", (root,)
+            ).fetchone()
+        if row is not None:
+            files, directories, ignore_files = (json.loads(column) for column in row)
+            if all(_stat_key(path) == key for path, key in directories + ignore_files):
+                return files
+
+        files, directories, ignore_files = snapshot_tree(root)
+        files = [os.path.relpath(path, root) for path in files]
+        directory_keys = [(path, _stat_key(path)) for path in directories]
+        ignore_keys = [(path, _stat_key(path)) for path in ignore_files]
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?)",
+                (root, json.dumps(files), json.dumps(directory_keys), json.dumps(ignore_keys))
+            )
+        return files
+
+    def walk_files(self, root, suffixes: Tuple[str, ...] = (), ignore_case: bool = False) -> List[Path]:
+        """Same result as project_walker.walk_files, served from the cached listing."""
+        if ignore_case:
+            suffixes = tuple(suffix.lower() for suffix in suffixes)
+        root = Path(root)
+        return [
+            root / relative for relative in self.list_files(root)
+            if not suffixes or (relative.lower() if ignore_case else relative).endswith(suffixes)
+        ]
+
+    def load_fields(self, directory: str, tool: str, version: int) -> Dict[str, Dict[str, Any]]:
+        """Cached stat, hash and fields of one tool for every file below directory, by path."""
+        low, high = _path_range(os.path.abspath(directory))
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT f.path, f.size, f.mtime_ns, f.sha256, d.data FROM files f "
+                "JOIN fields d ON d.path = f.path "
+                "WHERE d.tool = ? AND d.version = ? AND f.path >= ? AND f.path < ?",
+                (tool, version, low, high)
+            ).fetchall()
+        return {
+            path: {"size": size, "mtime_ns": mtime_ns, "sha256": sha256, "data": json.loads(data)}
+            for path, size, mtime_ns, sha256, data in rows
+        }
+
+    def store_fields(self, tool: str, version: int,
+                     entries: Iterable[Tuple[str, int, int, Optional[str], Any]]):
+        """Record (path, size, mtime_ns, sha256, data) for files processed by tool."""
+        with self.lock, self.connection:
+            for path, size, mtime_ns, sha256, data in entries:
+                self.connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                        (path, size, mtime_ns, sha256))
+                self.connection.execute("INSERT OR REPLACE INTO fields VALUES (?, ?, ?, ?)",
+                                        (path, tool, version, json.dumps(data, ensure_ascii=False)))
+
+    def prune_fields(self, directory: str, tool: str, keep: Sequence[str]):
+        """Drop tool's fields for files below directory that are not in keep."""
+        low, high = _path_range(os.path.abspath(directory))
+        with self.lock, self.connection:
+            stale = [
+                path for (path,) in self.connection.execute(
+                    "SELECT path FROM fields WHERE tool = ? AND path >= ? AND path < ?", (tool, low, high)
+                )
+                if path not in keep
+            ]
+            self.connection.executemany("DELETE FROM fields WHERE path = ? AND tool = ?",
+                                        [(path, tool) for path in stale])
+            self.connection.execute("DELETE FROM files WHERE path NOT IN (SELECT path FROM fields)")
+
+    def load_result(self, key: str, tool: str, version: int) -> Optional[Dict[str, Any]]:
+        """A result stored under key (e.g. a project folder) by tool, if still valid.
+
+        The result is valid while the files it was computed from have the same
+        size and mtime as when it was stored.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM fields WHERE path = ? AND tool = ? AND version = ?",
+                (os.path.abspath(key), tool, version)
+            ).fetchone()
+        if row is None:
+            return None
+        stored = json.loads(row[0])
+        if all(_stat_key(path) == stat_key for path, stat_key in stored["depends"]):
+            return stored
+        return None
+
+    def store_result(self, key: str, tool: str, version: int,
+                     depends: Iterable[Tuple[str, List[int]]], data: Dict[str, Any]):
+        """Store a result computed from the files in depends, given as (path, [size, mtime_ns]) as read."""
+        stored = dict(data, depends=[(os.path.abspath(path), stat_key) for path, stat_key in depends])
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO fields VALUES (?, ?, ?, ?)",
+                                    (os.path.abspath(key), tool, version, json.dumps(stored, ensure_ascii=False)))
+
+
+class IndexedManifest:
+    """ScanManifest-compatible view of one tool's per-file fields in a CorpusIndex.
+
+    Keys are paths relative to root, as with ScanManifest. Entries below the
+    root that were not seen in the scan are pruned on save.
+    """
+
+    def __init__(self, index: CorpusIndex, root, tool: str, version: int, full_scan: bool = False):
+        self.index = index
+        self.root = os.path.abspath(root)
+        self.tool = tool
+        self.version = version
+        self.previous = {} if full_scan else index.load_fields(self.root, tool, version)
+        self.current = {}
+        self.seen = set()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def lookup_stat(self, key: str, size: int, mtime_ns: int) -> Optional[Dict[str, Any]]:
+        """Return the cached entry if the file's size and mtime are unchanged."""
+        entry = self.previous.get(self.path(key))
+        if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+            return entry
+        return None
+
+    def lookup_hash(self, key: str, sha256: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry if the file was touched but its content is unchanged."""
+        entry = self.previous.get(self.path(key))
+        if entry and entry["sha256"] == sha256:
+            return entry
+        return None
+
+    def known_sha256(self, key: str) -> Optional[str]:
+        entry = self.previous.get(self.path(key))
+        return entry["sha256"] if entry else None
+
+    def record(self, key: str, size: int, mtime_ns: int, sha256: str, data: Dict[str, Any]):
+        """Record a file seen during the current scan."""
+        path = self.path(key)
+        self.seen.add(path)
+        entry = self.previous.get(path)
+        if entry and (entry["size"], entry["mtime_ns"], entry["sha256"]) == (size, mtime_ns, sha256):
+            return
+        self.current[path] = {"size": size, "mtime_ns": mtime_ns, "sha256": sha256, "data": data}
+
+    def start_rescan(self, prefixes: Iterable[str]):
+        """Begin another pass in the same process, forgetting entries under prefixes."""
+        prefixes = tuple(self.path(prefix) for prefix in prefixes)
+        self.previous.update(self.current)
+        self.current = {}
+        self.seen = {path for path in self.seen if not path.startswith(prefixes)}
+
+    def save(self):
+        """Write changed entries to the index and drop files that were not seen."""
+        self.index.store_fields(self.tool, self.version, (
+            (path, entry["size"], entry["mtime_ns"], entry["sha256"], entry["data"])
+            for path, entry in self.current.items()
+        ))
+        self.index.prune_fields(self.root, self.tool, self.seen)
+        self.previous.update(self.current)
+        self.current = {}
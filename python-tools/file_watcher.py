@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+File Watcher
+Change detection for the scanner's --watch mode. Uses Linux inotify (through ctypes,
+no external dependencies) where available and falls back to polling file stats.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from project_walker import DEFAULT_IGNORED_DIRS, walk_directories, walk_files
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changes by periodically comparing the size and mtime of matching files."""
+
+    def __init__(self, roots: Iterable[str], suffixes: Tuple[str, ...], interval: float = 2.0):
+        self.roots = [os.fspath(root) for root in roots]
+        self.suffixes = suffixes
+        self.interval = interval
+        self.snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for root in self.roots:
+            for path in walk_files(root, suffixes=self.suffixes):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[str(path)] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block until files change or timeout elapses; return the changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+            snapshot = self._take_snapshot()
+            changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                       if snapshot.get(path) != self.snapshot.get(path)}
+            self.snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes with inotify watches on every non-ignored directory under the roots.
+
+    Reports matching files that were written, created, deleted or moved, and
+    directories that were created or removed. A queue overflow reports the
+    roots themselves so the caller rescans everything.
+    """
+
+    def __init__(self, roots: Iterable[str], suffixes: Tuple[str, ...]):
+        self.libc = _load_libc()
+        self.roots = [os.fspath(root) for root in roots]
+        self.suffixes = suffixes
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        try:
+            for root in self.roots:
+                self._watch_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, root: str):
+        for directory in walk_directories(root):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                if errno in (2, 20):  # ENOENT, ENOTDIR: removed while walking
+                    continue
+                raise OSError(errno, f"inotify_add_watch failed for {directory}")
+            self.watches[wd] = directory
+
+    def wait(self, timeout: Optional[float] = None) -> Set[str]:
+        """Block until relevant events arrive or timeout elapses; return the changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return set()
+            changed = self._read_events()
+            if changed:
+                return changed
+
+    def _read_events(self) -> Set[str]:
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    changed.update(self.roots)
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self.watches[wd]
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    changed.add(directory)
+                    continue
+
+                path = os.path.join(directory, name)
+                if mask & IN_ISDIR:
+                    if name in DEFAULT_IGNORED_DIRS:
+                        continue
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._watch_tree(path)
+                    if mask & (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO):
+                        changed.add(path)
+                elif name.endswith(self.suffixes):
+                    changed.add(path)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def _load_libc():
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    for name in ("inotify_init1", "inotify_add_watch"):
+        getattr(libc, name)  # AttributeError if the platform lacks inotify
+    return libc
+
+
+def create_watcher(roots: List[str], suffixes: Tuple[str, ...], poll_interval: float = 2.0,
+                   force_polling: bool = False):
+    """Return an inotify watcher where supported, otherwise a polling watcher."""
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots, suffixes)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(roots, suffixes, poll_interval)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Markdown Sections
+Literal-marker section extraction for the analyzers, and a heading list with
+offsets for callers that want a markdown document's sections by heading.
+"""
+
+import re
+from typing import Optional
+
+HEADING_RE = re.compile(r'^(#+)(.*)$', re.MULTILINE)
+
+
+class Section:
+    """One heading and the offsets of its section in the document.
+
+    start..end covers the heading line, its text and its subsections, up to
+    the next heading of the same or a higher level.
+    """
+
+    __slots__ = ("level", "title", "start", "end")
+
+    def __init__(self, level: int, title: str, start: int):
+        self.level = level
+        self.title = title
+        self.start = start
+        self.end = start
+
+
+class SectionIndex:
+    """Headings of one document, in order, found in a single pass.
+
+    Every line starting with '#' is a heading; its level is the number of
+    leading '#' and its title the rest of the line without the one space
+    after them.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.sections = []
+
+        stack = []
+        for match in HEADING_RE.finditer(text):
+            marks, title = match.group(1), match.group(2)
+            if title.startswith(" "):
+                title = title[1:]
+            section = Section(len(marks), title, match.start())
+            while stack and stack[-1].level >= section.level:
+                stack.pop().end = match.start()
+            stack.append(section)
+            self.sections.append(section)
+
+        for section in stack:
+            section.end = len(text)
+
+
+def text_between(text: str, start: str, end: str) -> Optional[str]:
+    """Text between the first occurrence of start and the next occurrence of end after it.
+
+    Same result as re.search(start + '(.*?)' + end, text, re.DOTALL) for
+    literal markers, in a single linear scan.
+    """
+    begin = text.find(start)
+    if begin == -1:
+        return None
+    begin += len(start)
+    finish = text.find(end, begin)
+    if finish == -1:
+        return None
+    return text[begin:finish]
@@ -6,37 +6,78 @@ Reads through project markdown files and generates comprehensive project analysi
 
 import os
 import re
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import json
 
+from project_walker import ProjectDiscovery, add_discovery_arguments, discovery_from_args, walk_files
+from scan_profile import Profiler, add_profile_arguments
+from content_store import DEFAULT_CACHE_BYTES, ContentCache, ContentStore
+from corpus_index import CorpusIndex
+from markdown_sections import text_between
+
+PRIORITIES_MARKER = '## 🔥 **IMMEDIATE PRIORITIES'
+# "## 1. Topic" style headings in CRYPTO_BOT_RESEARCH.txt
+RESEARCH_HEADING_RE = re.compile(r'## (\d+)\. ')
+
+EXECUTORS = ("thread", "process")
+
+# Bump whenever the analyzers' output changes so results cached in a corpus index are discarded
+ANALYZER_VERSION = 1
+
+
+def analyze_project_job(analyzer_class: type, project_name: str, project_path: Path, cache_bytes: int,
+                        quiet: bool, profile_top: int,
+                        index_file: Optional[str] = None) -> Tuple[Dict[str, Any], Profiler]:
+    """Scan, read and analyze one project in a worker process; returns (analysis, profiler)."""
+    index = CorpusIndex(index_file) if index_file else None
+    analyzer = analyzer_class(cache_bytes=cache_bytes, quiet=quiet, profiler=Profiler(profile_top), index=index)
+    analyzer.projects[project_name] = {'path': project_path, 'files': [], 'content': {}}
+    return analyzer.analyze_project(project_name), analyzer.profiler
+
+
 class ProjectAnalyzer:
-    def __init__(self, parent_dir: str = ".."):
+    def __init__(self, parent_dir: str = "..", cache_bytes: int = DEFAULT_CACHE_BYTES,
+                 discovery: Optional[ProjectDiscovery] = None, quiet: bool = False,
+                 profiler: Optional[Profiler] = None, workers: int = 1, executor: str = "thread",
+                 index: Optional[CorpusIndex] = None):
         self.parent_dir = Path(parent_dir)
+        # Shared by every project's ContentStore
+        self.content_cache = ContentCache(cache_bytes)
+        self.discovery = discovery
+        self.quiet = quiet
+        self.profiler = profiler or Profiler()
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.executor = executor
+        self.index = index
         self.projects = {}
         self.analysis = {}
         
     def scan_projects(self):
-        """Scan for project directories and their markdown files"""
+        """Scan for project directories (their files are listed when each project is analyzed)"""
         print("🔍 Scanning for project directories...")
         
-        project_dirs = [
-            "DIYAPP",
-            "BusinessLoclAi", 
-            "AiAutoAgency",
-            "CryptoTradingBot",
-            "StockTradingBot"
-        ]
+        if self.discovery:
+            project_paths = self.discovery.find(self.parent_dir)
+        else:
+            project_dirs = [
+                "DIYAPP",
+                "BusinessLoclAi", 
+                "AiAutoAgency",
+                "CryptoTradingBot",
+                "StockTradingBot"
+            ]
+            project_paths = [(project_dir, self.parent_dir / project_dir) for project_dir in project_dirs]
         
-        for project_dir in project_dirs:
-            project_path = self.parent_dir / project_dir
+        for project_dir, project_path in project_paths:
             if project_path.exists():
                 self.projects[project_dir] = {
                     'path': project_path,
                     'files': [],
                     'content': {}
                 }
-                self._scan_project_files(project_dir)
         
         print(f"✅ Found {len(self.projects)} project directories")
     
@@ -44,37 +85,86 @@ class ProjectAnalyzer:
         """Scan markdown and text files in a project directory"""
         project_path = self.projects[project_name]['path']
         
-        # Look for markdown and text files
-        extensions = ['.md', '.txt', '.txt']
-        for file_path in project_path.rglob('*'):
-            if file_path.suffix.lower() in extensions and file_path.is_file():
-                self.projects[project_name]['files'].append(str(file_path))
+        # Look for markdown and text files, skipping ignored directories
+        if self.index:
+            file_paths = self.index.walk_files(project_path, suffixes=('.md', '.txt'), ignore_case=True)
+        else:
+            file_paths = walk_files(project_path, suffixes=('.md', '.txt'), ignore_case=True)
+        for file_path in file_paths:
+            self.projects[project_name]['files'].append(str(file_path))
+    
+    def read_project_files(self, project_name: str, profiler: Optional[Profiler] = None):
+        """Index a project's files for reading on demand by the analyzers"""
+        project_info = self.projects[project_name]
+        if not project_info['files']:
+            self._scan_project_files(project_name)
+        project_info['content'] = ContentStore(project_info['path'], map(Path, project_info['files']),
+                                               self.content_cache, profiler or self.profiler)
+        if not self.quiet:
+            print(f"  📁 {project_name}: {len(project_info['content'])} files")
     
-    def read_project_files(self):
-        """Read content from all project files"""
-        print("📖 Reading project files...")
+    def analyze_project(self, project_name: str, profiler: Optional[Profiler] = None) -> Dict:
+        """List, read and analyze one project"""
+        profiler = profiler or self.profiler
+        print(f"\n📊 Analyzing {project_name}...")
+        with profiler.phase("walk"):
+            self.read_project_files(project_name, profiler)
+        project_info = self.projects[project_name]
+        if not self.index:
+            return self._analyze_single_project(project_name, project_info)
         
-        for project_name, project_info in self.projects.items():
-            print(f"  📁 {project_name}:")
-            project_info['content'] = {}
-            
-            for file_path in project_info['files']:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        filename = Path(file_path).name
-                        project_info['content'][filename] = content
-                        print(f"    ✅ {filename}")
-                except Exception as e:
-                    print(f"    ❌ {filename}: {e}")
+        # Reuse the indexed result while the project's file list and every file it read are unchanged
+        content = project_info['content']
+        with profiler.phase("index_lookup"):
+            cached = self.index.load_result(project_info['path'], "analyzer", ANALYZER_VERSION)
+        if cached and cached['files'] == content.keys() and cached['analysis']['name'] == project_name:
+            if not self.quiet:
+                print("  ♻️  Unchanged since the last analysis")
+            return cached['analysis']
+        
+        analysis = self._analyze_single_project(project_name, project_info)
+        if not content.failed:
+            with profiler.phase("index_store"):
+                self.index.store_result(project_info['path'], "analyzer", ANALYZER_VERSION,
+                                        content.reads.items(), {'files': content.keys(), 'analysis': analysis})
+        return analysis
+    
+    def _analyze_project_task(self, project_name: str) -> Tuple[Dict, Profiler]:
+        # Each thread records into its own profiler; they are merged in project order
+        profiler = Profiler(self.profiler.top_n)
+        return self.analyze_project(project_name, profiler), profiler
     
     def analyze_projects(self):
-        """Analyze each project and generate comprehensive description"""
+        """Analyze each project and generate comprehensive description
+        
+        With workers > 1 every project is listed, read and analyzed as its own
+        task in a thread (or process) pool, so a slow project does not hold up
+        the others; results are stored in project order either way.
+        """
         print("\n🔍 Analyzing projects...")
         
-        for project_name, project_info in self.projects.items():
-            print(f"\n📊 Analyzing {project_name}...")
-            self.analysis[project_name] = self._analyze_single_project(project_name, project_info)
+        project_names = list(self.projects)
+        if self.workers <= 1 or len(project_names) <= 1:
+            for project_name in project_names:
+                self.analysis[project_name] = self.analyze_project(project_name)
+            return
+        
+        workers = min(self.workers, len(project_names))
+        if self.executor == "process":
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(analyze_project_job, type(self), project_name,
+                                       self.projects[project_name]['path'], self.content_cache.max_bytes,
+                                       self.quiet, self.profiler.top_n,
+                                       self.index.index_file if self.index else None)
+                           for project_name in project_names]
+                results = [future.result() for future in futures]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._analyze_project_task, project_names))
+        
+        for project_name, (analysis, profiler) in zip(project_names, results):
+            self.analysis[project_name] = analysis
+            self.profiler.merge(profiler)
     
     def _analyze_single_project(self, project_name: str, project_info: Dict) -> Dict:
         """Analyze a single project and generate description"""
@@ -115,43 +205,43 @@ class ProjectAnalyzer:
     def _analyze_diy_app(self, content: Dict, analysis: Dict) -> Dict:
         """Analyze DIY App project"""
         # Look for PROJECT_STATUS.md
-        if 'PROJECT_STATUS.md' in content:
-            status_content = content['PROJECT_STATUS.md']
-            
+        status_content = content.get('PROJECT_STATUS.md')
+        if status_content is not None:
             # Extract status and progress
             if 'Overall Status: 80% Complete' in status_content:
                 analysis['status'] = 'In Progress'
                 analysis['progress'] = 80
             
             # Extract completed features
-            completed_match = re.search(r'## ✅ \*\*COMPLETED FEATURES\*\*(.*?)##', status_content, re.DOTALL)
-            if completed_match:
-                completed_text = completed_match.group(1)
+            completed_text = text_between(status_content, '## ✅ **COMPLETED FEATURES**', '##')
+            if completed_text is not None:
                 features = re.findall(r'- ✅ \*\*(.*?)\*\*', completed_text)
                 analysis['completed_features'] = features
             
             # Extract in-progress features
-            progress_match = re.search(r'## 🚧 \*\*IN PROGRESS / NEEDS WORK\*\*(.*?)##', status_content, re.DOTALL)
-            if progress_match:
-                progress_text = progress_match.group(1)
-                features = re.findall(r'- 🔄 \*\*(.*?)\*\*', completed_text)
+            progress_text = text_between(status_content, '## 🚧 **IN PROGRESS / NEEDS WORK**', '##')
+            if progress_text is not None:
+                features = re.findall(r'- 🔄 \*\*(.*?)\*\*', completed_text or "")
                 analysis['in_progress_features'] = features
             
             # Extract next steps
-            next_match = re.search(r'## 🚀 \*\*IMMEDIATE NEXT STEPS\*\*(.*?)##', status_content, re.DOTALL)
-            if next_match:
-                next_text = next_match.group(1)
+            next_text = text_between(status_content, '## 🚀 **IMMEDIATE NEXT STEPS**', '##')
+            if next_text is not None:
                 steps = re.findall(r'\d+\. \*\*(.*?)\*\*', next_text)
                 analysis['next_steps'] = steps
         
         # Look for TODO.md
-        if 'TODO.md' in content:
-            todo_content = content['TODO.md']
-            
-            # Extract immediate priorities
-            priorities_match = re.search(r'## 🔥 \*\*IMMEDIATE PRIORITIES.*?\*\*(.*?)##', todo_content, re.DOTALL)
-            if priorities_match:
-                priorities_text = priorities_match.group(1)
+        todo_content = content.get('TODO.md')
+        if todo_content is not None:
+            # Extract immediate priorities (the first ** after the prefix closes the title)
+            priorities_text = None
+            marker = todo_content.find(PRIORITIES_MARKER)
+            if marker != -1:
+                bold_end = todo_content.find('**', marker + len(PRIORITIES_MARKER))
+                section_end = todo_content.find('##', bold_end + 2) if bold_end != -1 else -1
+                if section_end != -1:
+                    priorities_text = todo_content[bold_end + 2:section_end]
+            if priorities_text is not None:
                 todos = re.findall(r'- \[ \] \*\*(.*?)\*\*', priorities_text)
                 analysis['todo_features'].extend(todos)
         
@@ -162,9 +252,8 @@ class ProjectAnalyzer:
     
     def _analyze_business_local_ai(self, content: Dict, analysis: Dict) -> Dict:
         """Analyze BusinessLocal AI project"""
-        if 'MarketAnalasyst.md' in content:
-            market_content = content['MarketAnalasyst.md']
-            
+        market_content = content.get('MarketAnalasyst.md')
+        if market_content is not None:
             # Extract business model
             if 'Business Model & Services' in market_content:
                 analysis['business_model'] = "On-premise LLM deployment service for Canadian businesses, specializing in private, secure AI assistants with local hosting."
@@ -174,9 +263,8 @@ class ProjectAnalyzer:
                 analysis['market_analysis'] = "Canadian AI market projected to grow from USD 18.8B in 2023 to USD 152.7B by 2030. Rising demand for private, locally-hosted LLMs driven by regulatory pressure and security concerns."
             
             # Extract services
-            services_match = re.search(r'Core Services(.*?)Pricing Structure', market_content, re.DOTALL)
-            if services_match:
-                services_text = services_match.group(1)
+            services_text = text_between(market_content, 'Core Services', 'Pricing Structure')
+            if services_text is not None:
                 services = re.findall(r'([A-Za-z &]+)\n(.*?)(?=\n[A-Z]|$)', services_text)
                 analysis['completed_features'] = [f"{service[0]}: {service[1].strip()}" for service in services if service[0].strip()]
         
@@ -195,24 +283,21 @@ class ProjectAnalyzer:
     
     def _analyze_ai_auto_agency(self, content: Dict, analysis: Dict) -> Dict:
         """Analyze AIAutoAgency project"""
-        if 'businessplan.md' in content:
-            plan_content = content['businessplan.md']
-            
+        plan_content = content.get('businessplan.md')
+        if plan_content is not None:
             # Extract business model
             if 'Business Model' in plan_content:
                 analysis['business_model'] = "AI automation agency helping SMBs implement custom AI solutions. Focus on chatbots, workflow automation, and consulting with value-based pricing."
             
             # Extract services
-            services_match = re.search(r'Core Offerings:(.*?)Technology Stack:', plan_content, re.DOTALL)
-            if services_match:
-                services_text = services_match.group(1)
+            services_text = text_between(plan_content, 'Core Offerings:', 'Technology Stack:')
+            if services_text is not None:
                 services = re.findall(r'\* \*\*(.*?)\*\*', services_text)
                 analysis['completed_features'] = services
             
             # Extract tech stack
-            tech_match = re.search(r'Technology Stack:(.*?)Business Model:', plan_content, re.DOTALL)
-            if tech_match:
-                tech_text = tech_match.group(1)
+            tech_text = text_between(plan_content, 'Technology Stack:', 'Business Model:')
+            if tech_text is not None:
                 tech = re.findall(r'\*\*(.*?)\*\*: (.*?)(?=\n\*\*|$)', tech_text)
                 analysis['tech_stack'] = [f"{category}: {tools}" for category, tools in tech]
             
@@ -234,18 +319,30 @@ class ProjectAnalyzer:
     
     def _analyze_crypto_bot(self, content: Dict, analysis: Dict) -> Dict:
         """Analyze Crypto Trading Bot project"""
-        if 'CRYPTO_BOT_RESEARCH.txt' in content:
-            research_content = content['CRYPTO_BOT_RESEARCH.txt']
-            
-            # Extract research areas
-            research_areas = re.findall(r'## (\d+)\. (.*?)(?=\n---|\n##|\Z)', research_content, re.DOTALL)
+        research_content = content.get('CRYPTO_BOT_RESEARCH.txt')
+        if research_content is not None:
+            # Extract research areas: a numbered heading up to the next rule or heading
+            research_areas = []
+            # Next '\n---' and '\n##' at or after pos (-1: none left), searched again only once passed
+            ends = {'\n---': None, '\n##': None}
+            pos = 0
+            while True:
+                match = RESEARCH_HEADING_RE.search(research_content, pos)
+                if not match:
+                    break
+                start = match.end()
+                for marker, found in ends.items():
+                    if found is None or -1 < found < start:
+                        ends[marker] = research_content.find(marker, start)
+                found = [i for i in ends.values() if i != -1]
+                pos = min(found) if found else len(research_content)
+                research_areas.append((match.group(1), research_content[start:pos]))
             analysis['completed_features'] = [f"{num}. {area.strip()}" for num, area in research_areas]
             
             # Extract trading strategies
             if 'Trading Strategy Framework' in research_content:
-                strategies_match = re.search(r'Trading Strategy Framework(.*?)Backtesting Methodology', research_content, re.DOTALL)
-                if strategies_match:
-                    strategies_text = strategies_match.group(1)
+                strategies_text = text_between(research_content, 'Trading Strategy Framework', 'Backtesting Methodology')
+                if strategies_text is not None:
                     strategies = re.findall(r'- ([^:]+):', strategies_text)
                     analysis['todo_features'].extend(strategies)
             
@@ -307,20 +404,43 @@ class ProjectAnalyzer:
     
     def run_full_analysis(self):
         """Run complete analysis pipeline"""
-        self.scan_projects()
-        self.read_project_files()
-        self.analyze_projects()
-        summary = self.generate_summary()
-        self.save_analysis()
+        with self.profiler.phase("discover"):
+            self.scan_projects()
+        with self.profiler.phase("analyze"):
+            self.analyze_projects()
+        with self.profiler.phase("summary"):
+            summary = self.generate_summary()
+        with self.profiler.phase("write"):
+            self.save_analysis()
         return summary
 
 def main():
     """Main function to run the analysis"""
+    parser = argparse.ArgumentParser(description="Project Status Analyzer")
+    parser.add_argument("--root", default="..", help="Parent directory containing the projects")
+    add_discovery_arguments(parser)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Projects analyzed concurrently (0 = one per CPU)")
+    parser.add_argument("--executor", choices=EXECUTORS, default="thread",
+                        help="Run concurrent projects in threads or worker processes")
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_BYTES // (1024 * 1024),
+                        help="Memory budget for cached file contents, in MiB")
+    parser.add_argument("--index", metavar="FILE",
+                        help="SQLite corpus index shared with ai_project_scanner.py; caches folder "
+                             "listings and reuses results for unchanged projects")
+    add_profile_arguments(parser, "project_analysis_profile.json")
+    args = parser.parse_args()
+    
     print("🚀 Starting Project Status Analysis...")
     print("="*50)
     
-    analyzer = ProjectAnalyzer()
+    analyzer = ProjectAnalyzer(args.root, cache_bytes=args.cache_mb * 1024 * 1024,
+                               discovery=discovery_from_args(args), quiet=args.quiet,
+                               profiler=Profiler(args.profile_top), workers=args.workers,
+                               executor=args.executor, index=CorpusIndex(args.index) if args.index else None)
     analysis = analyzer.run_full_analysis()
+    if args.profile:
+        analyzer.profiler.save(args.profile)
     
     print("\n✅ Analysis complete!")
     print("\n📋 To view detailed analysis for each project:")
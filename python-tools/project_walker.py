@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Project Walker
+Shared os.scandir-based directory walker for the analysis tools. Ignored directories
+are pruned before they are descended into, and .projectstatusignore / .gitignore files
+are honored using gitignore-style patterns.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# Directories that never contain project documentation worth scanning
+DEFAULT_IGNORED_DIRS = frozenset({
+    "node_modules", ".git", ".hg", ".svn", ".venv", "venv", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+    "build", "dist", ".next", ".nuxt", ".cache", "coverage", "site-packages"
+})
+
+IGNORE_FILES = (".gitignore", ".projectstatusignore")
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob (with ** support) into a regex body."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1:end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body}]")
+                i = end + 1
+        elif char == "\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return "".join(parts)
+
+
+class IgnoreRule:
+    """One gitignore-style pattern, relative to the directory of the file it came from."""
+
+    __slots__ = ("regex", "negated", "dir_only", "anchored")
+
+    def __init__(self, pattern: str, negated: bool = False):
+        self.negated = negated
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # A slash anywhere but the end anchors the pattern to the ignore file's directory
+        self.anchored = "/" in pattern
+        self.regex = re.compile(_translate_glob(pattern.lstrip("/")) + r"\Z")
+
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        return bool(self.regex.match(rel_path if self.anchored else name))
+
+
+class IgnoreFile:
+    """Rules loaded from one ignore file, scoped to the directory that holds it."""
+
+    def __init__(self, base: str, rules: List[IgnoreRule]):
+        self.base = base
+        self.rules = rules
+
+    @classmethod
+    def load(cls, path: str, base: str) -> Optional["IgnoreFile"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        rules = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated or line.startswith(("\\#", "\\!")):
+                line = line[1:]
+            if line.strip("/"):
+                rules.append(IgnoreRule(line, negated))
+        return cls(base, rules) if rules else None
+
+    def decide(self, path: str, name: str, is_dir: bool) -> Optional[bool]:
+        """Return True to ignore, False to re-include, or None if no rule matches."""
+        rel_path = path[len(self.base):].lstrip(os.sep).replace(os.sep, "/")
+        for rule in reversed(self.rules):
+            if rule.matches(rel_path, name, is_dir):
+                return not rule.negated
+        return None
+
+
+def is_ignored(path: str, name: str, is_dir: bool, ignore_files: Sequence[IgnoreFile]) -> bool:
+    """Apply ignore files from the deepest directory outwards; the first decision wins."""
+    for ignore_file in reversed(ignore_files):
+        decision = ignore_file.decide(path, name, is_dir)
+        if decision is not None:
+            return decision
+    return False
+
+
+def _walk(root, ignored_dirs, use_ignore_files: bool):
+    """Yield (directory, entries, ignore_files) for root and every non-ignored directory below it."""
+    stack = [(os.fspath(root), ())]
+    while stack:
+        directory, ignore_files = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        if use_ignore_files:
+            names = {entry.name for entry in entries}
+            loaded = [IgnoreFile.load(os.path.join(directory, name), directory)
+                      for name in IGNORE_FILES if name in names]
+            loaded = [ignore_file for ignore_file in loaded if ignore_file]
+            if loaded:
+                ignore_files = ignore_files + tuple(loaded)
+
+        yield directory, entries, ignore_files
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            if entry.name in ignored_dirs:
+                continue
+            if ignore_files and is_ignored(entry.path, entry.name, True, ignore_files):
+                continue
+            subdirs.append(entry.path)
+
+        # Reversed so the stack pops subdirectories in sorted order
+        for subdir in reversed(subdirs):
+            stack.append((subdir, ignore_files))
+
+
+def _matching_files(entries, ignore_files, suffixes: Tuple[str, ...], ignore_case: bool) -> Iterator[Path]:
+    for entry in entries:
+        name = entry.name.lower() if ignore_case else entry.name
+        if suffixes and not name.endswith(suffixes):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False) or not entry.is_file():
+                continue
+        except OSError:
+            continue
+        if ignore_files and is_ignored(entry.path, entry.name, False, ignore_files):
+            continue
+        yield Path(entry.path)
+
+
+def walk_files(root, suffixes: Tuple[str, ...] = (), ignore_case: bool = False,
+               ignored_dirs=DEFAULT_IGNORED_DIRS, use_ignore_files: bool = True) -> Iterator[Path]:
+    """Yield files under root whose name ends with one of suffixes (all files if empty).
+
+    Directories are visited depth-first in sorted order, each directory's files
+    before its subdirectories. Ignored directories are skipped without being
+    opened, and symlinked directories are not followed.
+    """
+    if ignore_case:
+        suffixes = tuple(suffix.lower() for suffix in suffixes)
+
+    for _, entries, ignore_files in _walk(root, ignored_dirs, use_ignore_files):
+        yield from _matching_files(entries, ignore_files, suffixes, ignore_case)
+
+
+def snapshot_tree(root, ignored_dirs=DEFAULT_IGNORED_DIRS,
+                  use_ignore_files: bool = True) -> Tuple[List[str], List[str], List[str]]:
+    """Return (files, directories, ignore_files) as walk_files(root) would visit them.
+
+    The file listing can only change if a directory's mtime or one of the
+    ignore files changes, which lets callers cache it.
+    """
+    files = []
+    directories = []
+    ignore_files = []
+    for directory, entries, active_ignore_files in _walk(root, ignored_dirs, use_ignore_files):
+        directories.append(directory)
+        if use_ignore_files:
+            names = {entry.name for entry in entries}
+            ignore_files.extend(os.path.join(directory, name) for name in IGNORE_FILES if name in names)
+        files.extend(str(path) for path in _matching_files(entries, active_ignore_files, (), False))
+    return files, directories, ignore_files
+
+
+def walk_directories(root, ignored_dirs=DEFAULT_IGNORED_DIRS, use_ignore_files: bool = True) -> Iterator[str]:
+    """Yield root and every directory below it that walk_files would descend into."""
+    for directory, _, _ in _walk(root, ignored_dirs, use_ignore_files):
+        yield directory
+
+
+DEFAULT_PROJECT_MARKERS = ("PROJECT_STATUS.md", "README.md", "project_details.md")
+
+
+class ProjectDiscovery:
+    """Find project folders under a root by the marker files they contain.
+
+    A directory holding any marker file (case-insensitive) is a project and is
+    not descended into further. Only directories down to max_depth are opened,
+    and directories matching an exclude glob are pruned, so the cost is
+    proportional to the directories actually visited. Include/exclude globs are
+    matched against the project path relative to the root.
+    """
+
+    def __init__(self, markers: Sequence[str] = DEFAULT_PROJECT_MARKERS, max_depth: int = 2,
+                 include: Sequence[str] = (), exclude: Sequence[str] = (),
+                 ignored_dirs=DEFAULT_IGNORED_DIRS, use_ignore_files: bool = True):
+        self.markers = {marker.lower() for marker in markers}
+        self.max_depth = max_depth
+        self.include = [re.compile(_translate_glob(pattern) + r"\Z") for pattern in include]
+        self.exclude = [re.compile(_translate_glob(pattern) + r"\Z") for pattern in exclude]
+        self.ignored_dirs = ignored_dirs
+        self.use_ignore_files = use_ignore_files
+
+    def find(self, root) -> List[Tuple[str, Path]]:
+        """Return (name, path) for every project under root, sorted by relative path."""
+        root = os.fspath(root)
+        projects = []
+        stack = [(root, "", 0, ())]
+        while stack:
+            directory, rel_path, depth, ignore_files = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            if depth > 0 and any(entry.name.lower() in self.markers for entry in entries):
+                if not self.include or any(p.match(rel_path) for p in self.include):
+                    projects.append((rel_path, Path(directory)))
+                continue
+            if depth >= self.max_depth:
+                continue
+
+            if self.use_ignore_files:
+                loaded = [IgnoreFile.load(entry.path, directory) for entry in entries
+                          if entry.name in IGNORE_FILES]
+                loaded = [ignore_file for ignore_file in loaded if ignore_file]
+                if loaded:
+                    ignore_files = ignore_files + tuple(loaded)
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                child_rel_path = f"{rel_path}/{entry.name}" if rel_path else entry.name
+                if entry.name in self.ignored_dirs:
+                    continue
+                if any(p.match(child_rel_path) for p in self.exclude):
+                    continue
+                if ignore_files and is_ignored(entry.path, entry.name, True, ignore_files):
+                    continue
+                subdirs.append((entry.path, child_rel_path, depth + 1, ignore_files))
+            stack.extend(reversed(subdirs))
+
+        return projects
+
+
+def add_discovery_arguments(parser):
+    """Add the project discovery options shared by the analysis tools' CLIs."""
+    parser.add_argument("--discover", action="store_true",
+                        help="Find projects by marker files instead of the built-in project list")
+    parser.add_argument("--marker", action="append", dest="markers",
+                        help=f"Marker file name that identifies a project (default: {', '.join(DEFAULT_PROJECT_MARKERS)})")
+    parser.add_argument("--max-depth", type=int, default=2,
+                        help="Deepest folder level below the root searched for projects")
+    parser.add_argument("--include", action="append", default=[],
+                        help="Only keep projects whose relative path matches this glob (repeatable)")
+    parser.add_argument("--exclude", action="append", default=[],
+                        help="Skip folders whose relative path matches this glob (repeatable)")
+
+
+def discovery_from_args(args) -> Optional[ProjectDiscovery]:
+    """Build a ProjectDiscovery from parsed CLI arguments, or None without --discover."""
+    if not args.discover:
+        return None
+    return ProjectDiscovery(markers=args.markers or DEFAULT_PROJECT_MARKERS, max_depth=args.max_depth,
+                            include=args.include, exclude=args.exclude)
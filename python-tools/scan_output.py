@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Scan Output
+Atomic writers for the scanner's output formats: one pretty-printed JSON document,
+one compact JSON shard per project plus a small index, or newline-delimited JSON.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+OUTPUT_FORMATS = ("json", "shards", "ndjson")
+SHARD_INDEX = "index.json"
+SHARD_INDEX_VERSION = 1
+COMPACT_SEPARATORS = (",", ":")
+
+
+def _temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def write_json_atomic(path, data: Any, **dump_kwargs):
+    """Write JSON to a temporary sibling file and rename it over the target."""
+    path = Path(path)
+    tmp_path = _temp_path(path)
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def write_ndjson_atomic(path, records: Iterable[Any]):
+    """Stream one compact JSON document per line into a temp file, then rename it into place."""
+    path = Path(path)
+    tmp_path = _temp_path(path)
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=COMPACT_SEPARATORS))
+                f.write("\n")
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def resolve_output_path(output_file: str, output_format: str) -> Path:
+    """Map the --output value onto the path used by each format.
+
+    Shards are written to a directory and NDJSON to a .ndjson file, so a
+    default *.json name is adjusted for them.
+    """
+    path = Path(output_file)
+    if output_format == "shards" and path.suffix == ".json":
+        return path.with_suffix("")
+    if output_format == "ndjson" and path.suffix == ".json":
+        return path.with_suffix(".ndjson")
+    return path
+
+
+def shard_filename(name: str) -> str:
+    """File name for a project's shard.
+
+    Names with unsafe characters, and names that would collide with the
+    shard index (in any letter case), get a hash suffix.
+    """
+    slug = re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('.') or "project"
+    if slug != name or f"{slug}.json".lower() == SHARD_INDEX:
+        slug = f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+    return f"{slug}.json"
+
+
+def content_hash(project_data: Dict[str, Any]) -> str:
+    """Hash of a project's data, ignoring the last_updated timestamp set on every scan."""
+    data = {key: value for key, value in project_data.items() if key != "last_updated"}
+    encoded = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=COMPACT_SEPARATORS)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def load_shard_index(directory) -> Dict[str, Any]:
+    """Return the shard index in directory, or an empty one."""
+    try:
+        with open(Path(directory) / SHARD_INDEX, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if index.get("version") == SHARD_INDEX_VERSION else {}
+
+
+def write_json_shards(directory, projects_data: Dict[str, Dict[str, Any]]) -> int:
+    """Write one compact JSON file per project plus index.json; return the number of shards written.
+
+    Shards whose content hash matches the existing index are left untouched,
+    and shards of projects that no longer exist are removed. The index is
+    replaced last, so it only ever points at complete shards.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    previous = load_shard_index(directory).get("projects", {})
+
+    projects = {}
+    written = 0
+    for name, project_data in projects_data.items():
+        filename = shard_filename(name)
+        digest = content_hash(project_data)
+        entry = previous.get(name)
+        if entry and entry["file"] == filename and entry["sha256"] == digest and (directory / filename).exists():
+            projects[name] = entry
+            continue
+
+        write_json_atomic(directory / filename, project_data, separators=COMPACT_SEPARATORS)
+        written += 1
+        projects[name] = {
+            "file": filename,
+            "sha256": digest,
+            "status": project_data.get("status", ""),
+            "progress": project_data.get("progress", 0),
+            "short_description": project_data.get("short_description", ""),
+            "last_updated": project_data.get("last_updated", "")
+        }
+
+    write_json_atomic(directory / SHARD_INDEX, {"version": SHARD_INDEX_VERSION, "projects": projects},
+                      separators=COMPACT_SEPARATORS)
+
+    live_files = {entry["file"] for entry in projects.values()}
+    for entry in previous.values():
+        # An index written before the shard index name was reserved may list it as a shard
+        if entry["file"] not in live_files and entry["file"].lower() != SHARD_INDEX:
+            try:
+                (directory / entry["file"]).unlink()
+            except OSError:
+                pass
+    return written
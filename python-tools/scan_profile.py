@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Scan Profile
+Lightweight timing instrumentation for the analysis tools. Records wall and CPU time
+per phase and per file, keeps the slowest files, and writes the result as JSON for
+the tools' --profile option.
+"""
+
+import heapq
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+class Profiler:
+    """Accumulates per-phase and per-file timings for one tool run.
+
+    Phases may nest (a "walk" inside "scan", say); each phase's time is its
+    own wall/CPU total, so nested phases are not subtracted from their
+    parents. Times reported by worker processes are added as measured there,
+    so their CPU totals can exceed the run's wall time.
+    """
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self.phases = {}
+        self.files = 0
+        self.bytes_read = 0
+        self.slowest = []
+        self.sequence = 0
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the body of a with-block as one call of phase name."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+    def add_phase(self, name: str, wall: float, cpu: float, calls: int = 1):
+        """Add time measured elsewhere (e.g. in a worker process) to a phase."""
+        totals = self.phases.get(name)
+        if totals is None:
+            totals = self.phases[name] = {"wall": 0.0, "cpu": 0.0, "calls": 0}
+        totals["wall"] += wall
+        totals["cpu"] += cpu
+        totals["calls"] += calls
+
+    def record_file(self, path: str, wall: float, cpu: float, bytes_read: int,
+                    phases: Optional[Dict[str, float]] = None):
+        """Record one processed file; phases maps phase names to this file's wall time in them."""
+        self.files += 1
+        self.bytes_read += bytes_read
+        entry = {"path": path, "wall": wall, "cpu": cpu, "bytes": bytes_read}
+        if phases:
+            entry["phases"] = phases
+        self._keep_if_slow(entry)
+
+    def _keep_if_slow(self, entry: Dict[str, Any]):
+        self.sequence += 1
+        item = (entry["wall"], self.sequence, entry)
+        if len(self.slowest) < self.top_n:
+            heapq.heappush(self.slowest, item)
+        elif self.top_n:
+            heapq.heappushpop(self.slowest, item)
+
+    def merge(self, other: "Profiler"):
+        """Add the phases and files recorded by another profiler (e.g. a worker's)."""
+        for name, totals in other.phases.items():
+            self.add_phase(name, totals["wall"], totals["cpu"], totals["calls"])
+        self.files += other.files
+        self.bytes_read += other.bytes_read
+        for _, _, entry in sorted(other.slowest, key=lambda item: item[1]):
+            self._keep_if_slow(entry)
+
+    def report(self) -> Dict[str, Any]:
+        """Return the collected timings as a JSON-serializable dict."""
+        return {
+            "total": {
+                "wall": time.perf_counter() - self.started,
+                "cpu": time.process_time() - self.started_cpu
+            },
+            "phases": self.phases,
+            "files": {
+                "count": self.files,
+                "bytes_read": self.bytes_read,
+                "slowest": [entry for _, _, entry in sorted(self.slowest, reverse=True)]
+            }
+        }
+
+    def save(self, path: str):
+        """Write report() to path as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"⏱️  Profile saved to {path}")
+
+
+class TimedIterator:
+    """Wraps an iterable and accumulates the wall and CPU time spent producing its items."""
+
+    def __init__(self, iterable: Iterable[Any]):
+        self.iterator = iter(iterable)
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            return next(self.iterator)
+        finally:
+            self.wall += time.perf_counter() - wall_start
+            self.cpu += time.process_time() - cpu_start
+
+
+def add_profile_arguments(parser, default_profile: str):
+    """Add the --profile / --profile-top / --quiet options shared by the tools' CLIs."""
+    parser.add_argument("--profile", nargs="?", const=default_profile, metavar="FILE",
+                        help=f"Write per-phase and per-file timings as JSON (default file: {default_profile})")
+    parser.add_argument("--profile-top", type=int, default=10,
+                        help="Number of slowest files kept in the profile")
+    parser.add_argument("--quiet", action="store_true", help="Don't print a line per file")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Synthetic Corpus
+Generates synthetic project trees for benchmarking the analysis tools. Project count,
+files per project, file size and checkbox/emoji density are configurable, and the
+output is deterministic for a given seed.
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Any, Dict
+
+WORDS = [
+    "build", "planner", "deploy", "cache", "api", "react", "python", "docker",
+    "module", "feature", "review", "release", "shopping", "list", "filter"
+]
+
+# The first projects reuse the names the tools special-case, so ProjectAnalyzer's
+# per-project analyzers run on them too
+KNOWN_PROJECTS = ["DIYAPP", "BusinessLoclAi", "AiAutoAgency", "CryptoTradingBot", "StockTradingBot"]
+
+
+def generate_markdown(target_bytes: int, seed: int = 0, title: str = "Synthetic Project",
+                      checkbox_density: float = 0.10, emoji_density: float = 0.03) -> str:
+    """Generate a markdown document of roughly target_bytes with typical status markers.
+
+    checkbox_density is the share of lines that are "- [x]" / "- [ ]" items and
+    emoji_density the share of ✅ / 🔄 lines; the rest are headings, tech stack
+    lines and plain text.
+    """
+    rng = random.Random(seed)
+    lines = [f"# {title}", "", "A generated project used for benchmarks.", ""]
+    done_cutoff = checkbox_density / 2
+    todo_cutoff = checkbox_density
+    completed_cutoff = todo_cutoff + emoji_density * 2 / 3
+    in_progress_cutoff = todo_cutoff + emoji_density
+    size = 0
+    while size < target_bytes:
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+        roll = rng.random()
+        if roll < done_cutoff:
+            line = f"- [x] {text}"
+        elif roll < todo_cutoff:
+            line = f"- [ ] {text}"
+        elif roll < completed_cutoff:
+            line = f"✅ {text}"
+        elif roll < in_progress_cutoff:
+            line = f"🔄 {text}"
+        elif roll < in_progress_cutoff + 0.01:
+            line = f"Tech Stack: {text.replace(' ', ', ')}"
+        elif roll < in_progress_cutoff + 0.03:
+            line = f"## {text.title()}"
+        else:
+            line = text
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def project_name(index: int) -> str:
+    return KNOWN_PROJECTS[index] if index < len(KNOWN_PROJECTS) else f"Project{index:04d}"
+
+
+def generate_corpus(root, projects: int = 5, files_per_project: int = 4, file_size: int = 20000,
+                    checkbox_density: float = 0.10, emoji_density: float = 0.03,
+                    seed: int = 0) -> Dict[str, Any]:
+    """Write a synthetic project tree under root and return a summary of what was written.
+
+    Every project gets a PROJECT_STATUS.md (the discovery marker) and, with two
+    or more files, a TODO.md; the remaining files go into a docs/ folder.
+    """
+    root = Path(root)
+    rng = random.Random(seed)
+    total_files = 0
+    total_bytes = 0
+    for index in range(projects):
+        name = project_name(index)
+        project_path = root / name
+        (project_path / "docs").mkdir(parents=True, exist_ok=True)
+        for file_index in range(files_per_project):
+            if file_index == 0:
+                file_path = project_path / "PROJECT_STATUS.md"
+            elif file_index == 1:
+                file_path = project_path / "TODO.md"
+            else:
+                file_path = project_path / "docs" / f"notes-{file_index:03d}.md"
+            content = generate_markdown(file_size, rng.randrange(2**32), f"{name} {file_path.stem}",
+                                        checkbox_density, emoji_density)
+            data = content.encode("utf-8")
+            file_path.write_bytes(data)
+            total_files += 1
+            total_bytes += len(data)
+
+    return {
+        "root": str(root),
+        "projects": projects,
+        "files_per_project": files_per_project,
+        "file_size": file_size,
+        "checkbox_density": checkbox_density,
+        "emoji_density": emoji_density,
+        "seed": seed,
+        "files": total_files,
+        "bytes": total_bytes
+    }
+
+
+def add_corpus_arguments(parser):
+    """Add the corpus shape options shared by the generator and benchmark CLIs."""
+    parser.add_argument("--projects", type=int, default=5, help="Number of projects")
+    parser.add_argument("--files", type=int, default=4, help="Markdown files per project")
+    parser.add_argument("--file-size", type=int, default=20000, help="Approximate size of each file in bytes")
+    parser.add_argument("--checkbox-density", type=float, default=0.10,
+                        help="Share of lines that are markdown checkboxes")
+    parser.add_argument("--emoji-density", type=float, default=0.03,
+                        help="Share of lines that start with a status emoji")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+
+def corpus_from_args(root, args) -> Dict[str, Any]:
+    """Generate a corpus under root using parsed CLI arguments."""
+    return generate_corpus(root, projects=args.projects, files_per_project=args.files,
+                           file_size=args.file_size, checkbox_density=args.checkbox_density,
+                           emoji_density=args.emoji_density, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic project corpus")
+    parser.add_argument("root", help="Directory to write the projects into")
+    add_corpus_arguments(parser)
+    args = parser.parse_args()
+
+    summary = corpus_from_args(args.root, args)
+    print(f"✅ Wrote {summary['files']} files ({summary['bytes']:,} bytes) "
+          f"in {summary['projects']} projects under {summary['root']}")
+
+
+if __name__ == "__main__":
+    main()
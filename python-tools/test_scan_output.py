@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Tests for the scanner's sharded output (run with: python3 -m unittest test_scan_output)."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scan_output import SHARD_INDEX, load_shard_index, shard_filename, write_json_shards
+
+
+class ShardFilenameTest(unittest.TestCase):
+    def test_plain_names_are_kept(self):
+        self.assertEqual(shard_filename("BusinessLocalAi"), "BusinessLocalAi.json")
+
+    def test_shard_index_name_is_reserved(self):
+        for name in ("index", "Index", "INDEX"):
+            self.assertNotEqual(shard_filename(name).lower(), SHARD_INDEX)
+        self.assertNotEqual(shard_filename("index"), shard_filename("Index"))
+
+
+class WriteShardsTest(unittest.TestCase):
+    def test_project_named_index(self):
+        projects = {
+            "index": {"name": "index", "status": "Active", "progress": 40},
+            "Other": {"name": "Other", "status": "Planning", "progress": 10},
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(write_json_shards(directory, projects), 2)
+            index = load_shard_index(directory)
+            self.assertEqual(index["version"], 1)
+            self.assertEqual(set(index["projects"]), {"index", "Other"})
+            for name, entry in index["projects"].items():
+                with open(Path(directory) / entry["file"], 'r', encoding='utf-8') as f:
+                    self.assertEqual(json.load(f), projects[name])
+
+            # A second run leaves the shards alone and keeps the index intact
+            self.assertEqual(write_json_shards(directory, projects), 0)
+            self.assertEqual(set(load_shard_index(directory)["projects"]), {"index", "Other"})
+
+    def test_index_from_before_the_name_was_reserved(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / SHARD_INDEX).write_text(json.dumps({
+                "version": 1,
+                "projects": {"index": {"file": SHARD_INDEX, "sha256": "", "status": "", "progress": 0,
+                                       "short_description": "", "last_updated": ""}}
+            }), encoding='utf-8')
+            write_json_shards(directory, {"index": {"name": "index"}})
+            self.assertEqual(set(load_shard_index(directory)["projects"]), {"index"})
+
+
+if __name__ == "__main__":
+    unittest.main()
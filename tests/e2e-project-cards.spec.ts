@@ -50,7 +50,7 @@ test.describe('Project cards (live data)', () => {
 
       const [response] = await Promise.all([
         page.waitForResponse(r =>
-          r.url().includes('raw.githubusercontent.com') &&
+          (r.url().includes('/proxy/raw/') || r.url().includes('raw.githubusercontent.com')) &&
           (r.status() === 200 || r.status() === 304)
         , { timeout: 15000 }).catch(() => null),
         cards.nth(i).click()
@@ -0,0 +1,292 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import '../web-app/modules/GitHubDataManager.js';
+
+// The module publishes the class on window for the page scripts
+const GitHubDataManager = window.ProjectDataManager;
+
+// Stand-in for the browser's EventSource: records listeners so tests can emit events
+class FakeEventSource {
+  static instances = [];
+
+  constructor(url) {
+    this.url = url;
+    this.listeners = {};
+    this.closed = false;
+    FakeEventSource.instances.push(this);
+  }
+
+  addEventListener(type, listener) {
+    (this.listeners[type] = this.listeners[type] || []).push(listener);
+  }
+
+  close() {
+    this.closed = true;
+  }
+
+  emit(type, data) {
+    for (const listener of this.listeners[type] || []) {
+      listener({ data: JSON.stringify(data) });
+    }
+  }
+}
+
+function mockResponse(body, { status = 200, headers = {} } = {}) {
+  return {
+    ok: status >= 200 && status < 300,
+    status,
+    headers: { get: (name) => headers[name] ?? null },
+    json: () => Promise.resolve(body),
+    text: () => Promise.resolve(body)
+  };
+}
+
+function createManager(projects) {
+  const manager = new GitHubDataManager();
+  for (const project of projects) {
+    manager.sessionData.set(project.id, project);
+    manager.dataCache.set(project.id, manager.convertToLegacyFormat(project));
+  }
+  manager._buildIndexes();
+  manager.initialized = true;
+  return manager;
+}
+
+function apiProject(name, data = {}) {
+  return new GitHubDataManager().convertFromApiFormat(name, {
+    name,
+    description: `${name} description`,
+    status: 'In Progress',
+    progress: 50,
+    ...data
+  });
+}
+
+function localProject(title, overview) {
+  return {
+    id: new GitHubDataManager().slugify(title),
+    title,
+    name: title,
+    overview,
+    status: { phase: 'Planning', progress: 10 },
+    features: { completed: [], inProgress: [], pending: [] },
+    technical: [],
+    keyFeatures: [],
+    aliases: [title],
+    source: 'local'
+  };
+}
+
+const PROJECTS_MD = [
+  '# Project Documentation',
+  '',
+  '## Alpha',
+  'Alpha changed on disk.',
+  '',
+  '## Beta',
+  'Beta changed on disk as well.',
+  ''
+].join('\n');
+
+describe('GitHubDataManager server data sources', () => {
+  beforeEach(() => {
+    global.fetch.mockReset();
+    FakeEventSource.instances = [];
+    vi.stubGlobal('EventSource', FakeEventSource);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  describe('convertFromApiFormat', () => {
+    it('should map a scanner record onto the structured format', () => {
+      const project = apiProject('DIYapp', {
+        completed_features: ['Build planner'],
+        in_progress_features: ['Shopping list'],
+        todo_features: ['AI integration'],
+        tech_stack: ['Next.js 14']
+      });
+
+      expect(project.id).toBe('diyapp');
+      expect(project.title).toBe('DIYapp');
+      expect(project.overview).toBe('DIYapp description');
+      expect(project.status).toEqual({ phase: 'In Progress', progress: 50 });
+      expect(project.features).toEqual({
+        completed: ['Build planner'],
+        inProgress: ['Shopping list'],
+        pending: ['AI integration']
+      });
+      expect(project.technical).toEqual(['Next.js 14']);
+      expect(project.source).toBe('api');
+      expect(project.apiName).toBe('DIYapp');
+    });
+
+    it('should keep the API key as an alias when the record has another name', () => {
+      const project = new GitHubDataManager().convertFromApiFormat('diy-folder', { name: 'DIYapp' });
+
+      expect(project.id).toBe('diyapp');
+      expect(project.aliases).toEqual(['DIYapp', 'diy-folder']);
+      expect(project.overview).toBe('Project overview not available');
+      expect(project.status).toEqual({ phase: 'Unknown', progress: 0 });
+    });
+  });
+
+  describe('fetchRawContent', () => {
+    it('should use the proxy response when it carries X-Cache', async () => {
+      const manager = new GitHubDataManager();
+      global.fetch.mockResolvedValueOnce(mockResponse('# Details', { headers: { 'X-Cache': 'HIT' } }));
+
+      const response = await manager.fetchRawContent('owner/repo/main/ProjectDetails.md');
+
+      expect(response.status).toBe(200);
+      expect(global.fetch).toHaveBeenCalledTimes(1);
+      expect(global.fetch).toHaveBeenCalledWith('/proxy/raw/owner/repo/main/ProjectDetails.md');
+    });
+
+    it('should not retry GitHub for a 404 from the proxy', async () => {
+      const manager = new GitHubDataManager();
+      global.fetch.mockResolvedValueOnce(mockResponse('', { status: 404, headers: { 'X-Cache': 'MISS' } }));
+
+      const response = await manager.fetchRawContent('owner/repo/main/project_details.md');
+
+      expect(response.status).toBe(404);
+      expect(global.fetch).toHaveBeenCalledTimes(1);
+    });
+
+    it('should fall back to GitHub when the response has no X-Cache header', async () => {
+      const manager = new GitHubDataManager();
+      global.fetch
+        .mockResolvedValueOnce(mockResponse('Not found', { status: 404 }))
+        .mockResolvedValueOnce(mockResponse('# Details'));
+
+      const response = await manager.fetchRawContent('owner/repo/main/ProjectDetails.md', { cache: 'no-store' });
+
+      expect(response.status).toBe(200);
+      expect(global.fetch).toHaveBeenCalledTimes(2);
+      expect(global.fetch).toHaveBeenLastCalledWith(
+        'https://raw.githubusercontent.com/owner/repo/main/ProjectDetails.md', { cache: 'no-store' });
+    });
+
+    it('should fall back to GitHub when the proxy is unreachable', async () => {
+      const manager = new GitHubDataManager();
+      global.fetch
+        .mockRejectedValueOnce(new TypeError('Failed to fetch'))
+        .mockResolvedValueOnce(mockResponse('# Details'));
+
+      const response = await manager.fetchRawContent('owner/repo/main/ProjectDetails.md');
+
+      expect(response.status).toBe(200);
+      expect(global.fetch).toHaveBeenLastCalledWith(
+        'https://raw.githubusercontent.com/owner/repo/main/ProjectDetails.md', {});
+    });
+  });
+
+  describe('subscribeToChanges', () => {
+    it('should adopt the first versions event without fetching', async () => {
+      const manager = createManager([apiProject('DIYapp')]);
+      const onChange = vi.fn();
+
+      manager.subscribeToChanges(onChange);
+      FakeEventSource.instances[0].emit('versions', { api: { DIYapp: '"v1"' }, data: {} });
+      await vi.waitFor(() => expect(manager.versions).not.toBeNull());
+
+      expect(FakeEventSource.instances[0].url).toBe('/events');
+      expect(manager.versions.api).toEqual({ DIYapp: '"v1"' });
+      expect(global.fetch).not.toHaveBeenCalled();
+      expect(onChange).not.toHaveBeenCalled();
+    });
+
+    it('should replay versions that changed while disconnected', async () => {
+      const manager = createManager([apiProject('DIYapp'), apiProject('StockTradingBot')]);
+      manager.versions = { api: { DIYapp: '"v1"', StockTradingBot: '"s1"' }, data: {} };
+      const onChange = vi.fn();
+      global.fetch.mockResolvedValueOnce(mockResponse({ name: 'DIYapp', status: 'Completed', progress: 100 }));
+
+      manager.subscribeToChanges(onChange);
+      // A reconnect starts with the current versions: only DIYapp moved on
+      FakeEventSource.instances[0].emit('versions', { api: { DIYapp: '"v2"', StockTradingBot: '"s1"' }, data: {} });
+      await vi.waitFor(() => expect(onChange).toHaveBeenCalledWith('diyapp'));
+
+      expect(global.fetch).toHaveBeenCalledTimes(1);
+      expect(global.fetch).toHaveBeenCalledWith('/api/projects/DIYapp');
+      expect(manager.sessionData.get('diyapp').status).toEqual({ phase: 'Completed', progress: 100 });
+      expect(manager.versions.api).toEqual({ DIYapp: '"v2"', StockTradingBot: '"s1"' });
+    });
+
+    it('should move a project whose API record was renamed', async () => {
+      const manager = createManager([apiProject('DIYapp')]);
+      const onChange = vi.fn();
+      global.fetch.mockResolvedValueOnce(mockResponse({ name: 'DIY Planner', progress: 60 }));
+
+      manager.subscribeToChanges(onChange);
+      FakeEventSource.instances[0].emit('project', {
+        source: 'api', name: 'DIYapp', etag: '"v2"', url: '/api/projects/DIYapp'
+      });
+      await vi.waitFor(() => expect(onChange).toHaveBeenCalled());
+
+      expect(manager.sessionData.has('diyapp')).toBe(false);
+      expect(manager.sessionData.get('diy-planner').apiName).toBe('DIYapp');
+    });
+
+    it('should remove the project for an api notice without an etag', async () => {
+      const manager = createManager([apiProject('DIYapp'), apiProject('StockTradingBot')]);
+      const onChange = vi.fn();
+
+      manager.subscribeToChanges(onChange);
+      FakeEventSource.instances[0].emit('project', {
+        source: 'api', name: 'DIYapp', etag: null, url: '/api/projects/DIYapp'
+      });
+      await vi.waitFor(() => expect(onChange).toHaveBeenCalledWith('diyapp'));
+
+      expect(global.fetch).not.toHaveBeenCalled();
+      expect(manager.sessionData.has('diyapp')).toBe(false);
+      expect(manager.dataCache.has('diyapp')).toBe(false);
+      expect(manager.getById('stocktradingbot')).not.toBeNull();
+    });
+
+    it('should re-parse only the section a data notice names', async () => {
+      const alpha = localProject('Alpha', 'Alpha as first loaded.');
+      const beta = localProject('Beta', 'Beta as first loaded.');
+      const manager = createManager([alpha, beta]);
+      const onChange = vi.fn();
+      global.fetch.mockResolvedValueOnce(mockResponse(PROJECTS_MD));
+
+      manager.subscribeToChanges(onChange);
+      FakeEventSource.instances[0].emit('project', {
+        source: 'data', name: 'Alpha', version: 'a2', url: '/data/PROJECTS.md', etag: '"e2"'
+      });
+      await vi.waitFor(() => expect(onChange).toHaveBeenCalledWith('alpha'));
+
+      expect(global.fetch).toHaveBeenCalledWith('/data/PROJECTS.md');
+      expect(onChange).toHaveBeenCalledTimes(1);
+      expect(manager.sessionData.get('alpha')).not.toBe(alpha);
+      expect(manager.sessionData.get('alpha').source).toBe('local');
+      // Beta changed in the file too, but no notice named it
+      expect(manager.sessionData.get('beta')).toBe(beta);
+    });
+
+    it('should ignore notices for a source the page did not load from', async () => {
+      const manager = createManager([localProject('Alpha', 'Alpha as first loaded.')]);
+      const onChange = vi.fn();
+
+      manager.subscribeToChanges(onChange);
+      FakeEventSource.instances[0].emit('project', {
+        source: 'api', name: 'Alpha', etag: null, url: '/api/projects/Alpha'
+      });
+      await new Promise(resolve => setTimeout(resolve, 0));
+
+      expect(onChange).not.toHaveBeenCalled();
+      expect(manager.sessionData.has('alpha')).toBe(true);
+    });
+
+    it('should close the stream on unsubscribe', () => {
+      const manager = createManager([]);
+
+      manager.subscribeToChanges(vi.fn());
+      manager.unsubscribeFromChanges();
+
+      expect(FakeEventSource.instances[0].closed).toBe(true);
+      expect(manager.eventSource).toBeNull();
+    });
+  });
+});
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Load test for the ProjectStatus web server.
+Simulates dashboard viewers loading index.html or project-detail.html together with
+the stylesheet, scripts and project data, over several parallel keep-alive connections
+like a browser. Reports throughput, latency percentiles and error rates as JSON, per
+number of connections per viewer, so server changes can be compared before and after.
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+WEB_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_SCRIPT = os.path.join(WEB_APP_DIR, "server.py")
+SERVER_START_TIMEOUT = 30.0
+REQUEST_TIMEOUT = 30.0
+DEFAULT_REPORT = "load_report.json"
+# Browsers open up to six HTTP/1.1 connections per host
+DEFAULT_CONNECTIONS = 6
+
+# What a browser asks for on each page, besides every modules/*.js file and the project data
+PAGES = {
+    "index": ["/index.html", "/styles.css", "/script.js"],
+    "detail": ["/project-detail.html", "/styles.css", "/project-detail.js"],
+}
+# The pages parse PROJECTS.md themselves when /api/projects is off or finds no projects
+API_DATA = ["/api/projects"]
+FALLBACK_DATA = ["/api/projects", "/data/PROJECTS.md"]
+
+
+def page_paths(page: str, data_paths: Sequence[str] = FALLBACK_DATA) -> List[str]:
+    """Requests for one load of page, in the order a browser makes them."""
+    html, *assets = PAGES[page]
+    modules = sorted(f"/modules/{path.name}" for path in Path(WEB_APP_DIR, "modules").glob("*.js"))
+    return [html] + assets[:1] + modules + assets[1:] + list(data_paths)
+
+
+def project_data_paths(host: str, port: int) -> List[str]:
+    """The project data requests a page makes: /api/projects alone if it returns projects."""
+    try:
+        connection = http.client.HTTPConnection(host, port, timeout=REQUEST_TIMEOUT)
+        connection.request("GET", API_DATA[0])
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        if response.status == 200 and json.loads(body):
+            return API_DATA
+    except (OSError, http.client.HTTPException, ValueError):
+        pass
+    return FALLBACK_DATA
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values; None if there are none."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, Optional[float]]:
+    """Latency statistics in milliseconds."""
+    values = sorted(latencies)
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "p50": ms(percentile(values, 0.50)),
+        "p95": ms(percentile(values, 0.95)),
+        "p99": ms(percentile(values, 0.99)),
+        "max": ms(values[-1] if values else None),
+        "mean": ms(sum(values) / len(values) if values else None),
+    }
+
+
+class Viewer(threading.Thread):
+    """One simulated dashboard viewer: loads pages back to back over parallel keep-alive connections.
+
+    The HTML comes first; the stylesheet, scripts and data are then fetched
+    over up to connections connections at once, as a browser does. A
+    revalidate fraction of page loads send If-None-Match for files seen
+    before, as a browser does on reload.
+    """
+
+    def __init__(self, host: str, port: int, pages: Dict[str, List[str]], detail_ratio: float,
+                 revalidate: float, think_time: float, warmup_until: float,
+                 stop_at: float, seed: int, connections: int = DEFAULT_CONNECTIONS):
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.pages = pages
+        self.detail_ratio = detail_ratio
+        self.revalidate = revalidate
+        self.think_time = think_time
+        self.warmup_until = warmup_until
+        self.stop_at = stop_at
+        self.random = random.Random(seed)
+        self.connections = connections
+        self.etags = {}
+        # One keep-alive connection per fetching thread
+        self.local = threading.local()
+        self.opened = []
+        self.opened_lock = threading.Lock()
+        # (path, status or error name, seconds, bytes) for every measured request
+        self.requests = []
+        self.page_loads = []
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.connections) as fetchers:
+            while time.monotonic() < self.stop_at:
+                page = "detail" if self.random.random() < self.detail_ratio else "index"
+                conditional = self.random.random() < self.revalidate
+                page_started = time.monotonic()
+                html, *assets = self.pages[page]
+                ok = fetchers.submit(self._request, html, conditional).result()
+                ok &= all(fetchers.map(lambda path: self._request(path, conditional), assets))
+                if page_started >= self.warmup_until and time.monotonic() <= self.stop_at:
+                    self.page_loads.append((time.monotonic() - page_started, not ok))
+                if self.think_time:
+                    time.sleep(self.random.expovariate(1.0 / self.think_time))
+        for connection in self.opened:
+            connection.close()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """The calling thread's keep-alive connection, opened if needed."""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = http.client.HTTPConnection(self.host, self.port,
+                                                                            timeout=REQUEST_TIMEOUT)
+            with self.opened_lock:
+                self.opened.append(connection)
+        return connection
+
+    def _request(self, path: str, conditional: bool) -> bool:
+        """Make one request; False if it failed (transport error or status >= 400)."""
+        headers = {"Accept-Encoding": "br, gzip"}
+        if conditional and path in self.etags:
+            headers["If-None-Match"] = self.etags[path]
+        connection = self._connection()
+        started = time.monotonic()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+            outcome = response.status
+            if response.getheader("ETag"):
+                self.etags[path] = response.getheader("ETag")
+            if response.will_close:
+                # http.client reconnects on the next request
+                connection.close()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            body = b""
+            outcome = type(e).__name__
+        finished = time.monotonic()
+        if started >= self.warmup_until and finished <= self.stop_at:
+            self.requests.append((path, outcome, finished - started, len(body)))
+        return isinstance(outcome, int) and outcome < 400
+
+
+def run_load(host: str, port: int, concurrency: int, duration: float, warmup: float = 0.0,
+             detail_ratio: float = 0.3, revalidate: float = 0.5, think_time: float = 0.0,
+             seed: int = 0, connections: int = DEFAULT_CONNECTIONS) -> Dict[str, Any]:
+    """Run concurrency viewers for warmup + duration seconds and return the report."""
+    data_paths = project_data_paths(host, port)
+    pages = {page: page_paths(page, data_paths) for page in PAGES}
+    started = time.monotonic()
+    warmup_until = started + warmup
+    stop_at = warmup_until + duration
+    viewers = [Viewer(host, port, pages, detail_ratio, revalidate, think_time, warmup_until, stop_at,
+                      seed + i, connections)
+               for i in range(concurrency)]
+    for viewer in viewers:
+        viewer.start()
+    for viewer in viewers:
+        viewer.join()
+
+    requests = [record for viewer in viewers for record in viewer.requests]
+    page_loads = [record for viewer in viewers for record in viewer.page_loads]
+    by_path = {}
+    for path, outcome, seconds, size in requests:
+        by_path.setdefault(path, []).append((outcome, seconds, size))
+
+    def summary(records) -> Dict[str, Any]:
+        outcomes = {}
+        for outcome, _, _ in records:
+            outcomes[str(outcome)] = outcomes.get(str(outcome), 0) + 1
+        errors = sum(1 for outcome, _, _ in records if not (isinstance(outcome, int) and outcome < 400))
+        return {
+            "requests": len(records),
+            "errors": errors,
+            "error_rate": round(errors / len(records), 6) if records else 0.0,
+            "outcomes": dict(sorted(outcomes.items())),
+            "bytes": sum(size for _, _, size in records),
+            "latency_ms": latency_summary([seconds for _, seconds, _ in records]),
+        }
+
+    overall = summary([(outcome, seconds, size) for _, outcome, seconds, size in requests])
+    failed_pages = sum(1 for _, failed in page_loads if failed)
+    return {
+        "config": {
+            "target": f"http://{host}:{port}",
+            "concurrency": concurrency,
+            "connections": connections,
+            "project_data": data_paths,
+            "duration": duration,
+            "warmup": warmup,
+            "detail_ratio": detail_ratio,
+            "revalidate": revalidate,
+            "think_time": think_time,
+            "seed": seed,
+        },
+        "throughput": {
+            "requests_per_second": round(len(requests) / duration, 3),
+            "page_loads_per_second": round(len(page_loads) / duration, 3),
+            "bytes_per_second": round(overall["bytes"] / duration, 1),
+        },
+        "requests": overall,
+        "page_loads": {
+            "count": len(page_loads),
+            "failed": failed_pages,
+            "error_rate": round(failed_pages / len(page_loads), 6) if page_loads else 0.0,
+            "latency_ms": latency_summary([seconds for seconds, _ in page_loads]),
+        },
+        "paths": {path: summary(records) for path, records in sorted(by_path.items())},
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int, server_args: Sequence[str]) -> subprocess.Popen:
+    """Start server.py on 127.0.0.1:port and wait until it answers."""
+    process = subprocess.Popen([sys.executable, SERVER_SCRIPT, str(port), "--bind", "127.0.0.1", *server_args],
+                               cwd=WEB_APP_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server.py exited with status {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1.0)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            connection.close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    stop_server(process)
+    raise RuntimeError(f"server.py did not answer within {SERVER_START_TIMEOUT:.0f}s")
+
+
+def stop_server(process: subprocess.Popen):
+    process.terminate()
+    try:
+        process.wait(15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def tail_latency(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Throughput and latency of one run, for comparing connection counts."""
+    return {
+        "requests_per_second": report["throughput"]["requests_per_second"],
+        "page_loads_per_second": report["throughput"]["page_loads_per_second"],
+        "error_rate": report["requests"]["error_rate"],
+        "request_latency_ms": report["requests"]["latency_ms"],
+        "page_load_latency_ms": report["page_loads"]["latency_ms"],
+    }
+
+
+def positive_seconds(value: str) -> float:
+    """Parse a duration that must be more than zero seconds."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {value!r}")
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError("must be more than 0 seconds")
+    return seconds
+
+
+def connection_counts(value: str) -> List[int]:
+    """Parse --connections: one count or a comma-separated list of them."""
+    try:
+        counts = [int(part) for part in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a comma-separated list of numbers: {value!r}")
+    if not counts or min(counts) < 1:
+        raise argparse.ArgumentTypeError("connection counts must be at least 1")
+    return counts
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """Relative change of throughput and latency percentiles against a previous report."""
+    def change(new, old):
+        return None if new is None or not old else round((new - old) / old, 4)
+
+    return {
+        "requests_per_second": change(report["throughput"]["requests_per_second"],
+                                      baseline["throughput"]["requests_per_second"]),
+        **{f"latency_{key}": change(report["requests"]["latency_ms"][key], baseline["requests"]["latency_ms"][key])
+           for key in ("p50", "p95", "p99")},
+        "error_rate": round(report["requests"]["error_rate"] - baseline["requests"]["error_rate"], 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the ProjectStatus web server")
+    parser.add_argument("--url", help="Test a server that is already running (default: start server.py on a free port)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Simulated viewers loading pages at once")
+    parser.add_argument("--connections", type=connection_counts, default=[DEFAULT_CONNECTIONS],
+                        help=f"Parallel keep-alive connections per viewer (default {DEFAULT_CONNECTIONS}); "
+                             "a comma-separated list such as 1,2,6 runs once per count")
+    parser.add_argument("--duration", type=positive_seconds, default=10.0, help="Seconds to measure")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Seconds of load before measuring starts")
+    parser.add_argument("--detail-ratio", type=float, default=0.3,
+                        help="Fraction of page loads that open project-detail.html instead of index.html")
+    parser.add_argument("--revalidate", type=float, default=0.5,
+                        help="Fraction of page loads that revalidate files already seen (If-None-Match)")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Mean seconds a viewer waits between page loads (0 = back to back)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the page mix")
+    parser.add_argument("--server-arg", action="append", default=[], metavar="ARG",
+                        help="Extra argument for the started server.py (repeatable, e.g. --server-arg=--workers=16)")
+    parser.add_argument("--output", default=DEFAULT_REPORT, help="Where to write the JSON report")
+    parser.add_argument("--baseline", metavar="FILE", help="Earlier report to compare against")
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        target = urlsplit(args.url)
+        host, port = target.hostname or "127.0.0.1", target.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        print(f"🚀 Starting server.py on port {port}...")
+        process = start_server(port, args.server_arg)
+
+    runs = {}
+    try:
+        for connections in args.connections:
+            print(f"⏱️  {args.concurrency} viewers with {connections} connections each for {args.duration:g}s "
+                  f"(after {args.warmup:g}s warmup)...")
+            runs[connections] = run_load(host, port, args.concurrency, args.duration, args.warmup,
+                                         args.detail_ratio, args.revalidate, args.think_time, args.seed,
+                                         connections)
+    finally:
+        if process is not None:
+            stop_server(process)
+
+    # The full report is for the first count; every count gets its tail latency
+    report = runs[args.connections[0]]
+    report["by_connections"] = {str(connections): tail_latency(run) for connections, run in runs.items()}
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report["compared_to"] = {"file": args.baseline, "change": compare(report, json.load(f))}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    latency = report["requests"]["latency_ms"]
+    print(f"📊 {report['throughput']['requests_per_second']:.1f} requests/s, "
+          f"{report['throughput']['page_loads_per_second']:.1f} page loads/s")
+    print(f"⏱️  Latency p50 {latency['p50']} ms, p95 {latency['p95']} ms, p99 {latency['p99']} ms")
+    if len(runs) > 1:
+        for connections, stats in report["by_connections"].items():
+            pages = stats["page_load_latency_ms"]
+            print(f"🔌 {connections} connections: {stats['page_loads_per_second']:.1f} page loads/s, "
+                  f"page load p50 {pages['p50']} ms, p95 {pages['p95']} ms, p99 {pages['p99']} ms")
+    if report["requests"]["errors"]:
+        print(f"⚠️  {report['requests']['errors']} errors ({report['requests']['error_rate']:.2%})")
+        for path, stats in report["paths"].items():
+            if stats["errors"]:
+                print(f"   {path}: {stats['outcomes']}")
+    else:
+        print("✅ No errors")
+    if "compared_to" in report:
+        print(f"🔁 Change vs {args.baseline}: {report['compared_to']['change']}")
+    print(f"💾 Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,15 @@ class GitHubDataManager {
     constructor() {
         this.githubApiBase = 'https://api.github.com';
         this.rawContentBase = 'https://raw.githubusercontent.com';
+        // Parsed by server.py's scanner; 404 when the page is served by something else
+        this.apiBase = '/api/projects';
+        // server.py's shared, cached copy of rawContentBase
+        this.rawProxyBase = '/proxy/raw';
+        // server.py's change notices, and the versions they were last seen at
+        this.eventsUrl = '/events';
+        this.eventSource = null;
+        this.onProjectChange = null;
+        this.versions = null;
         this.dataCache = new Map();
         this.sessionData = new Map(); // Session-based data storage
         this.initialized = false;
@@ -186,6 +195,7 @@ class GitHubDataManager {
             if (sessionData) {
                 const parsed = JSON.parse(sessionData);
                 this.sessionData = new Map(Object.entries(parsed));
+                this.versions = JSON.parse(sessionStorage.getItem('githubProjectVersions') || 'null');
                 
                 // Migrate old session data to new format
                 this._migrateSessionData();
@@ -282,8 +292,13 @@ class GitHubDataManager {
     async loadAllProjectData() {
         console.log(`Loading data for ${this.repositories.length} repositories...`);
         
-        // First, try to load from local data file
-        await this.loadLocalProjectData();
+        // First, try the server's parsed project data
+        await this.loadApiProjectData();
+        
+        // Then the local data file, parsed here
+        if (this.sessionData.size === 0) {
+            await this.loadLocalProjectData();
+        }
         
         // If no local data loaded, try GitHub repositories
         if (this.sessionData.size === 0) {
@@ -315,6 +330,61 @@ class GitHubDataManager {
         console.log(`Loaded data for ${this.sessionData.size} projects`);
     }
 
+    async loadApiProjectData() {
+        try {
+            console.log('Attempting to load project data from the server API...');
+            
+            const response = await fetch(this.apiBase);
+            if (!response.ok) {
+                console.warn(`Project API not available (${response.status}), will try local PROJECTS.md`);
+                return;
+            }
+            
+            const projects = await response.json();
+            for (const [name, data] of Object.entries(projects)) {
+                const project = this.convertFromApiFormat(name, data);
+                if (project.id) {
+                    this.sessionData.set(project.id, project);
+                    this.dataCache.set(project.id, this.convertToLegacyFormat(project));
+                }
+            }
+            console.log(`Loaded ${this.sessionData.size} projects from the server API`);
+            
+        } catch (error) {
+            console.warn('Error loading project data from the server API:', error);
+        }
+    }
+
+    /**
+     * Convert a scanner record from /api/projects into the structured project format
+     * @param {string} name - Project name (the key in the API response)
+     * @param {Object} data - Scanner record for the project
+     * @returns {Object} Structured project data
+     */
+    convertFromApiFormat(name, data) {
+        const title = data.name || name;
+        return {
+            id: this.slugify(title),
+            title: title,
+            name: title,
+            overview: data.description || data.short_description || 'Project overview not available',
+            status: {
+                phase: data.status || 'Unknown',
+                progress: Number(data.progress) || 0
+            },
+            features: {
+                completed: data.completed_features || [],
+                inProgress: data.in_progress_features || [],
+                pending: data.todo_features || []
+            },
+            technical: data.tech_stack || [],
+            keyFeatures: data.key_achievements || [],
+            aliases: title === name ? [title] : [title, name],
+            source: 'api',
+            apiName: name
+        };
+    }
+
     async loadLocalProjectData() {
         try {
             console.log('Attempting to load local PROJECTS.md file...');
@@ -335,6 +405,7 @@ class GitHubDataManager {
             // Add each project to session data and cache
             for (const project of projects) {
                 if (project.id && project.title) {
+                    project.source = 'local';
                     this.sessionData.set(project.id, project);
                     
                     // Also store in cache for backward compatibility
@@ -428,10 +499,10 @@ class GitHubDataManager {
     async loadProjectData(repo) {
         try {
             // Fetch the ProjectDetails.md file from GitHub
-            const rawContentUrl = `${this.rawContentBase}/${repo.owner}/${repo.name}/${repo.branch}/${repo.projectDetailsPath}`;
-            console.log(`Fetching from: ${rawContentUrl}`);
+            const rawContentPath = `${repo.owner}/${repo.name}/${repo.branch}/${repo.projectDetailsPath}`;
+            console.log(`Fetching from: ${rawContentPath}`);
             
-            const response = await fetch(rawContentUrl);
+            const response = await this.fetchRawContent(rawContentPath);
             if (!response.ok) {
                 throw new Error(`Failed to fetch ${repo.projectDetailsPath}: ${response.status}`);
             }
@@ -457,6 +528,25 @@ class GitHubDataManager {
         }
     }
 
+    /**
+     * Fetch a file from GitHub raw content, through server.py's proxy when there is one
+     * @param {string} path - owner/repo/branch/path of the file
+     * @param {Object} options - fetch options for a direct request to GitHub
+     * @returns {Response} Fetch response
+     */
+    async fetchRawContent(path, options = {}) {
+        try {
+            const response = await fetch(`${this.rawProxyBase}/${path}`);
+            // Only the proxy sets X-Cache, also on an upstream 404; anything else means there is no proxy
+            if (response.headers.get('X-Cache')) {
+                return response;
+            }
+        } catch (error) {
+            console.warn(`Raw content proxy not reachable for ${path}:`, error);
+        }
+        return fetch(`${this.rawContentBase}/${path}`, options);
+    }
+
     /**
      * Parse markdown content into structured data format
      * @param {string} content - Raw markdown content
@@ -1167,11 +1257,13 @@ class GitHubDataManager {
         // Clear all caches
         this.dataCache.clear();
         this.sessionData.clear();
+        this.versions = null;
         this.initialized = false;
         
         // Clear session storage
         try {
             sessionStorage.removeItem('githubProjectData');
+            sessionStorage.removeItem('githubProjectVersions');
         } catch (error) {
             console.warn('Failed to clear session storage:', error);
         }
@@ -1248,14 +1340,14 @@ class GitHubDataManager {
         try {
             // Try candidate paths in order - lowercase first to prevent initial 404
             const candidates = [
-                { path: "project_details.md", url: `https://raw.githubusercontent.com/${repoInfo.owner}/${repoInfo.repo}/main/project_details.md` },
-                { path: "ProjectDetails.md",  url: `https://raw.githubusercontent.com/${repoInfo.owner}/${repoInfo.repo}/main/ProjectDetails.md` }
+                { path: "project_details.md", url: `${repoInfo.owner}/${repoInfo.repo}/main/project_details.md` },
+                { path: "ProjectDetails.md",  url: `${repoInfo.owner}/${repoInfo.repo}/main/ProjectDetails.md` }
             ];
             
             for (const candidate of candidates) {
                 console.log(`[ProjectStatus] trying`, { id: proj.id, path: candidate.path, url: candidate.url });
                 
-                const res = await fetch(candidate.url, { cache: 'no-store' });
+                const res = await this.fetchRawContent(candidate.url, { cache: 'no-store' });
                 if (res.ok) {
                     const md = await res.text();
                     const parsed = this.parseProjectMarkdown(md);
@@ -1364,6 +1456,166 @@ class GitHubDataManager {
         }
     }
 
+    /**
+     * Follow server.py's /events stream and re-fetch only the projects it names
+     * @param {Function} onChange - Called with a project ID after that project is updated or removed
+     * @returns {EventSource|null} The stream, or null when the browser has no EventSource
+     */
+    subscribeToChanges(onChange) {
+        this.onProjectChange = onChange;
+        if (this.eventSource || typeof EventSource === 'undefined') {
+            return this.eventSource;
+        }
+        
+        // The browser reconnects by itself; each connection starts with a versions event
+        this.eventSource = new EventSource(this.eventsUrl);
+        this.eventSource.addEventListener('versions', (event) => {
+            this._handleVersions(JSON.parse(event.data)).catch(error => {
+                console.warn('Failed to apply project versions:', error);
+            });
+        });
+        this.eventSource.addEventListener('project', (event) => {
+            this._handleProjectEvent(JSON.parse(event.data)).catch(error => {
+                console.warn('Failed to apply project change:', error);
+            });
+        });
+        return this.eventSource;
+    }
+
+    /**
+     * Stop following /events
+     */
+    unsubscribeFromChanges() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+        this.onProjectChange = null;
+    }
+
+    /**
+     * Compare the versions sent on (re)connect with the ones last seen and re-fetch what changed meanwhile
+     * @param {Object} versions - {api: {name: etag}, data: {url: {etag, projects: {title: version}}}}
+     */
+    async _handleVersions(versions) {
+        const previous = this.versions;
+        this._saveVersions(versions);
+        if (!previous) return;
+        
+        const oldApi = previous.api || {};
+        const newApi = versions.api || {};
+        for (const name of new Set([...Object.keys(oldApi), ...Object.keys(newApi)])) {
+            if (oldApi[name] !== newApi[name]) {
+                await this._handleProjectEvent({
+                    source: 'api', name, etag: newApi[name] || null,
+                    url: `${this.apiBase}/${encodeURIComponent(name)}`
+                }, false);
+            }
+        }
+        
+        for (const [url, file] of Object.entries(versions.data || {})) {
+            const oldProjects = previous.data?.[url]?.projects || {};
+            const newProjects = file.projects || {};
+            for (const name of new Set([...Object.keys(oldProjects), ...Object.keys(newProjects)])) {
+                if (oldProjects[name] !== newProjects[name]) {
+                    await this._handleProjectEvent({
+                        source: 'data', name, version: newProjects[name] || null, url
+                    }, false);
+                }
+            }
+        }
+    }
+
+    /**
+     * Apply one project change notice from /events
+     * @param {Object} notice - {source: 'api'|'data', name, url, etag or version}
+     * @param {boolean} record - Whether to record the notice's version (false while replaying versions)
+     */
+    async _handleProjectEvent(notice, record = true) {
+        if (record && this.versions) {
+            const seen = notice.source === 'api'
+                ? (this.versions.api = this.versions.api || {})
+                : this.versions.data?.[notice.url]?.projects;
+            const version = notice.source === 'api' ? notice.etag : notice.version;
+            if (seen) {
+                if (version) seen[notice.name] = version;
+                else delete seen[notice.name];
+                this._saveVersions(this.versions);
+            }
+        }
+        
+        // Only follow the source the page's projects were loaded from
+        const sources = new Set([...this.sessionData.values()].map(project => project.source));
+        if (notice.source === 'api' && sources.has('api')) {
+            const current = [...this.sessionData.values()].find(project => project.apiName === notice.name);
+            if (!notice.etag) {
+                if (current) this._removeProject(current.id);
+                return;
+            }
+            const response = await fetch(notice.url);
+            if (response.ok) {
+                this._storeProject(this.convertFromApiFormat(notice.name, await response.json()), current);
+            }
+        } else if (notice.source === 'data' && sources.has('local')) {
+            const current = [...this.sessionData.values()].find(project =>
+                project.source === 'local' && project.title === notice.name);
+            const response = await fetch(notice.url);
+            if (!response.ok) return;
+            const project = this.parseLocalProjectsFile(await response.text())
+                .find(parsed => parsed.title === notice.name);
+            if (project) {
+                project.source = 'local';
+                this._storeProject(project, current);
+            } else if (current) {
+                this._removeProject(current.id);
+            }
+        }
+    }
+
+    /**
+     * Add or replace one project and tell the subscriber
+     * @param {Object} project - Structured project data
+     * @param {Object} current - The project it replaces, if any
+     */
+    _storeProject(project, current) {
+        if (current && current.id !== project.id) {
+            this.sessionData.delete(current.id);
+            this.dataCache.delete(current.id);
+        }
+        this.sessionData.set(project.id, project);
+        this.dataCache.set(project.id, this.convertToLegacyFormat(project));
+        this._buildIndexes();
+        this._saveToSession();
+        console.log(`Project changed on the server: ${project.id}`);
+        if (this.onProjectChange) this.onProjectChange(project.id);
+    }
+
+    /**
+     * Remove one project and tell the subscriber
+     * @param {string} id - Project ID
+     */
+    _removeProject(id) {
+        this.sessionData.delete(id);
+        this.dataCache.delete(id);
+        this._buildIndexes();
+        this._saveToSession();
+        console.log(`Project removed on the server: ${id}`);
+        if (this.onProjectChange) this.onProjectChange(id);
+    }
+
+    /**
+     * Remember the versions the session data matches, so a later page load can catch up
+     * @param {Object} versions - Versions from /events
+     */
+    _saveVersions(versions) {
+        this.versions = versions;
+        try {
+            sessionStorage.setItem('githubProjectVersions', JSON.stringify(versions));
+        } catch (error) {
+            console.warn('Failed to save project versions:', error);
+        }
+    }
+
     /**
      * Save current session data to sessionStorage
      */
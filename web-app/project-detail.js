@@ -225,6 +225,9 @@ class ProjectDetailManager {
                 window.githubDataManager = githubDataManager;
                 console.log('GitHub data manager initialized successfully');
                 
+                // Re-render when the server reports a change to the project on display
+                githubDataManager.subscribeToChanges((id) => this.handleProjectChange(id));
+                
                 // Now load project data after GitHubDataManager is ready
                 this.loadProjectData();
             } else {
@@ -2485,6 +2488,14 @@ class ProjectDetailManager {
         return this.currentProject.status || 'Unknown';
     }
 
+    async handleProjectChange(id) {
+        if (!this.currentProject || this.currentProject.id !== id) return;
+        const project = await window.githubDataManager.ensureDetails(id);
+        if (!project) return this.showProjectNotFoundError();
+        this.currentProject = project;
+        this.renderProjectData(project);
+    }
+
     async refreshProjectData() {
         this.notificationManager.showNotification('Refreshing project data...', 'info');
         if (this.projectId && window.githubDataManager) {
@@ -2710,10 +2721,9 @@ class ProjectDetailManager {
             this.loadingTimeout = null;
         }
         
-        // Clear any stored intervals
-        if (this.refreshInterval) {
-            clearInterval(this.refreshInterval);
-            this.refreshInterval = null;
+        // Close the change stream
+        if (window.githubDataManager) {
+            window.githubDataManager.unsubscribeFromChanges();
         }
         
         // Clear any stored event handlers
@@ -33,6 +33,9 @@ async function initializeGitHubDataManager() {
         // Make it globally available for other scripts
         window.githubDataManager = githubDataManager;
         
+        // Redraw the cards when the server reports a project change
+        githubDataManager.subscribeToChanges(() => populateProjectCardsFromGitHub());
+        
         console.log('GitHub data manager initialized successfully');
         showNotification('Project data loaded from GitHub', 'success');
     } catch (error) {
@@ -2,89 +2,2111 @@
 """
 Custom HTTP server for ProjectStatus web application.
 Handles broken pipe errors gracefully and provides better logging.
+Connections are served by a fixed pool of worker threads over HTTP/1.1 keep-alive;
+log records are written in batches by a background thread.
 """
 
+import argparse
+import bisect
+import contextlib
+import datetime
+import email.utils
+import fnmatch
+import gzip
+import hashlib
 import http.server
-import socketserver
+import io
+import json
+import logging.handlers
 import os
+import queue
+import random
+import selectors
+import signal
+import socket
 import sys
-from urllib.parse import urlparse
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlparse, urlsplit
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('server.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The /api/ endpoints run the scanner from python-tools in-process
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "python-tools"))
+
+from ai_project_scanner import WATCH_SUFFIXES, AIProjectScanner
+from file_watcher import create_watcher
+from markdown_sections import SectionIndex
+from project_walker import ProjectDiscovery, add_discovery_arguments, discovery_from_args, walk_files
+
+# Worker threads serving connections, and accepted connections allowed to wait for one
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_QUEUE_SIZE = 64
+# Seconds an idle keep-alive connection is held open
+DEFAULT_KEEP_ALIVE = 15.0
+# Seconds to wait for in-flight requests on shutdown
+DEFAULT_SHUTDOWN_TIMEOUT = 10.0
+
+# Memory for cached (and precompressed) static files; bigger files are streamed from disk
+DEFAULT_ASSET_CACHE_BYTES = 64 * 1024 * 1024
+MAX_ASSET_BYTES = 2 * 1024 * 1024
+# Smaller files are not worth compressing
+MIN_COMPRESS_BYTES = 256
+# Ranges accepted in one Range header; requests with more get the whole file
+MAX_RANGES = 32
+# Chunk size for copying file bodies when sendfile is not used
+COPY_BUFSIZE = 256 * 1024
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "application/xml",
+                      "image/svg+xml")
+# Content-Encoding values in order of preference, with the suffix they add to the ETag
+ENCODINGS = (("br", "-br"), ("gzip", "-gz"))
+
+# Same default as ai_project_scanner.py run from python-tools/: the folder holding this repo
+DEFAULT_PROJECTS_ROOT = os.path.dirname(REPO_DIR)
+# Seconds a request waits for the first scan before getting a 503
+API_READY_TIMEOUT = 30.0
+
+# /proxy/raw/ fetches from here; point it at a local server for testing
+DEFAULT_RAW_UPSTREAM = "https://raw.githubusercontent.com"
+DEFAULT_RAW_CACHE_DIR = os.path.join(tempfile.gettempdir(), "projectstatus-raw-cache")
+# Seconds a fetched file is fresh, then may still be served while it is refetched,
+# and for which a 404 is remembered
+DEFAULT_RAW_TTL = 300.0
+DEFAULT_RAW_STALE = 86400.0
+DEFAULT_RAW_NEGATIVE_TTL = 60.0
+RAW_FETCH_TIMEOUT = 10.0
+# Disk space the raw cache may use, and seconds between sweeps for expired entries
+DEFAULT_RAW_CACHE_BYTES = 256 * 1024 * 1024
+RAW_PRUNE_INTERVAL = 3600.0
+
+# Folder served as /data/ (the dashboard loads /data/PROJECTS.md) and watched for /events
+DEFAULT_DATA_DIR = os.path.join(REPO_DIR, "data")
+# /events: seconds between keep-alive comments, and bytes a client may fall behind before it is dropped
+DEFAULT_EVENTS_HEARTBEAT = 20.0
+EVENTS_MAX_BUFFER = 64 * 1024
+# Milliseconds browsers wait before reconnecting a dropped event stream
+EVENTS_RETRY = 3000
+
+# Cache-Control by URL path pattern, first match wins: project data is revalidated
+# on every use (cheap with ETags), static assets are kept for a day
+DEFAULT_CACHE_CONTROL = [
+    ("/api/*", "no-cache"),
+    ("/proxy/*", "no-cache"),
+    ("/data/*", "no-cache"),
+    ("/events", "no-store"),
+    ("*.html", "no-cache"),
+    ("/", "no-cache"),
+    ("*.js", "public, max-age=86400"),
+    ("*.css", "public, max-age=86400"),
+    ("*.png", "public, max-age=86400"),
+    ("*.jpg", "public, max-age=86400"),
+    ("*.svg", "public, max-age=86400"),
+    ("*.ico", "public, max-age=86400"),
+    ("*.woff2", "public, max-age=86400"),
+]
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+ACCESS_LOGGER = "access"
+# Records waiting for the log writer; beyond this they are dropped rather than block requests
+LOG_QUEUE_SIZE = 10000
+LOG_BATCH_SIZE = 256
+LOG_FLUSH_INTERVAL = 0.2
+
+# /metrics: request latency histogram buckets in seconds, and the URL path classes
+# requests are counted under (a fixed set, so label cardinality stays bounded)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+PATH_CLASSES = [
+    ("/api/*", "api"),
+    ("/proxy/*", "proxy"),
+    ("/data/*", "data"),
+    ("/metrics", "metrics"),
+    ("/events", "events"),
+    ("/", "html"),
+    ("*.html", "html"),
+    ("*.js", "js"),
+    ("*.css", "css"),
+]
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that counts and drops records when the queue is full instead of blocking."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchLogWriter:
+    """Background thread writing queued log records to handlers, flushing once per batch.
+
+    Each handler's level and filters apply as usual; records are formatted
+    and written here, so request threads only pay for a queue put.
+    """
+
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.StreamHandler],
+                 batch_size: int = LOG_BATCH_SIZE, flush_interval: float = LOG_FLUSH_INTERVAL):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        """Write everything still queued, then stop and close the handlers."""
+        self.queue.put(None)
+        self.thread.join()
+        for handler in self.handlers:
+            handler.close()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            record = self.queue.get()
+            batch = []
+            # Collect whatever arrives within flush_interval, up to batch_size records
+            deadline = time.monotonic() + self.flush_interval
+            while record is not None:
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            stopping = record is None
+            self._write(batch)
+
+    def _write(self, batch: List[logging.LogRecord]):
+        for handler in self.handlers:
+            handler.acquire()
+            try:
+                for record in batch:
+                    if record.levelno >= handler.level and handler.filter(record):
+                        try:
+                            handler.stream.write(handler.format(record) + handler.terminator)
+                        except Exception:
+                            handler.handleError(record)
+                handler.flush()
+            finally:
+                handler.release()
+
+
+class AccessLog:
+    """Access records with a level by status class, sampling of successful requests and optional JSON lines.
+
+    Successful requests are logged at INFO, 4xx at WARNING and 5xx at ERROR;
+    records below level are skipped, and only sample (0..1) of the INFO ones
+    are kept.
+    """
+
+    def __init__(self, level: int = logging.INFO, sample: float = 1.0, json_lines: bool = False):
+        self.logger = logging.getLogger(ACCESS_LOGGER)
+        self.level = level
+        self.sample = sample
+        self.json_lines = json_lines
+
+    def record(self, handler: http.server.BaseHTTPRequestHandler, status: int, duration: float,
+               bytes_sent: int):
+        level = logging.ERROR if status >= 500 else logging.WARNING if status >= 400 else logging.INFO
+        if level < self.level or (level == logging.INFO and self.sample < 1.0 and random.random() >= self.sample):
+            return
+        if self.json_lines:
+            message = json.dumps({
+                "ts": round(time.time(), 3),
+                "client": handler.client_address[0],
+                "method": handler.command,
+                "path": handler.path,
+                "status": status,
+                "bytes": bytes_sent,
+                "ms": round(duration * 1000, 2)
+            }, separators=(",", ":"))
+        else:
+            message = (f'{handler.client_address[0]} - "{handler.requestline}" {status} {bytes_sent} '
+                       f'{duration * 1000:.1f}ms')
+        self.logger.log(level, message)
+
+
+def setup_logging(level: str = "INFO", log_file: str = "server.log", access_log: AccessLog = None,
+                  access_file: Optional[str] = None) -> Tuple[BatchLogWriter, DroppingQueueHandler]:
+    """Route all logging through a queue to a BatchLogWriter; returns (writer, queue handler).
+
+    Server messages go to log_file and stdout. Access records go there too,
+    or only to access_file when one is given (as bare lines for JSON records).
+    """
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    if access_file:
+        for handler in handlers:
+            handler.addFilter(lambda record: record.name != ACCESS_LOGGER)
+        access_handler = logging.FileHandler(access_file)
+        access_handler.setFormatter(logging.Formatter(
+            '%(message)s' if access_log and access_log.json_lines else LOG_FORMAT))
+        access_handler.addFilter(lambda record: record.name == ACCESS_LOGGER)
+        handlers.append(access_handler)
+    # Access records are filtered by AccessLog itself, not by the root level
+    logging.getLogger(ACCESS_LOGGER).setLevel(logging.DEBUG)
+
+    writer = BatchLogWriter(log_queue, handlers)
+    writer.start()
+    return writer, queue_handler
+
+
+def parse_cache_control(rule: str) -> Tuple[str, str]:
+    """Parse a --cache-control PATTERN=VALUE option."""
+    pattern, separator, value = rule.partition("=")
+    if not separator or not pattern:
+        raise argparse.ArgumentTypeError(f"expected PATTERN=VALUE, got {rule!r}")
+    return pattern, value
+
+
+def file_tag(stat: os.stat_result, sha256: str) -> str:
+    """Strong ETag value (without quotes) from a file's size, mtime and content hash."""
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}-{sha256[:16]}"
+
+
+def parse_range(header: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """Byte ranges (first, last; inclusive) of a Range header, for a file of size bytes.
+
+    Overlapping and adjacent ranges are merged. Returns None if the header
+    should be ignored (not a valid bytes range, or more than MAX_RANGES) and
+    an empty list if no range is satisfiable.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+    parts = [part.strip() for part in spec.split(",") if part.strip()]
+    if not parts or len(parts) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for part in parts:
+        first, dash, last = part.partition("-")
+        first, last = first.strip(), last.strip()
+        if not dash or not (first or last) or not all(value.isdigit() for value in (first, last) if value):
+            return None
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if last and int(last) < start:
+                return None
+        else:
+            # A suffix range: the last N bytes
+            start, end = max(0, size - int(last)), size - 1
+            if int(last) == 0:
+                continue
+        if start < size:
+            ranges.append((start, end))
+
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> List[str]:
+    """Content codings from an Accept-Encoding header that the client accepts (q > 0)."""
+    accepted = []
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.append(coding.strip().lower())
+    return accepted
+
+
+class Asset:
+    """A cached file: its body per Content-Encoding ("identity", "gzip", "br") and their ETags."""
+
+    __slots__ = ("key", "content_type", "last_modified", "bodies", "etags", "size")
+
+    def __init__(self, key: Optional[Tuple[int, int]], content_type: str, last_modified: float):
+        self.key = key
+        self.content_type = content_type
+        self.last_modified = last_modified
+        self.bodies = {}
+        self.etags = {}
+        self.size = 0
+
+    @classmethod
+    def build(cls, key: Optional[Tuple[int, int]], content_type: str, last_modified: float,
+              body: bytes, tag: str) -> "Asset":
+        """Asset for body with ETag "tag", plus the compressed variants worth keeping."""
+        asset = cls(key, content_type, last_modified)
+        asset.add("identity", body, f'"{tag}"')
+        if len(body) >= MIN_COMPRESS_BYTES and content_type.startswith(COMPRESSIBLE_TYPES):
+            for encoding, suffix in ENCODINGS:
+                if encoding == "br":
+                    if brotli is None:
+                        continue
+                    compressed = brotli.compress(body)
+                else:
+                    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+                if len(compressed) < len(body):
+                    asset.add(encoding, compressed, f'"{tag}{suffix}"')
+        return asset
+
+    def add(self, encoding: str, body: bytes, etag: str):
+        self.bodies[encoding] = body
+        self.etags[encoding] = etag
+        self.size += len(body)
+
+    def select(self, accept_encoding: Optional[str]) -> str:
+        """The best encoding this asset has that the client accepts."""
+        accepted = accepted_encodings(accept_encoding)
+        for encoding, _ in ENCODINGS:
+            if encoding in self.bodies and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+
+class AssetCache:
+    """Static files kept in memory, raw and precompressed, bounded by total bytes.
+
+    Entries are replaced when the file's size or mtime changes; the least
+    recently used are evicted to stay within max_bytes. Safe to share
+    between threads.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_ASSET_CACHE_BYTES, max_file_bytes: int = MAX_ASSET_BYTES):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def cacheable(self, stat: os.stat_result) -> bool:
+        return stat.st_size <= self.max_file_bytes and stat.st_size <= self.max_bytes
+
+    def get(self, path: str, stat: os.stat_result, content_type: str) -> Optional[Asset]:
+        """Return the file's asset, reading and compressing it if stat shows it changed; None if unreadable."""
+        asset = self.lookup(path, (stat.st_size, stat.st_mtime_ns))
+        if asset is not None:
+            return asset
+
+        asset = self.load(path, content_type)
+        if asset is not None:
+            self.put(path, asset)
+        return asset
+
+    def lookup(self, path: str, key) -> Optional[Asset]:
+        """The cached asset for path if its key (the version it was built from) matches."""
+        with self.lock:
+            asset = self.entries.get(path)
+            if asset is None or asset.key != key:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(path)
+            return asset
+
+    def load(self, path: str, content_type: str) -> Optional[Asset]:
+        try:
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                body = f.read()
+        except OSError:
+            return None
+        return Asset.build((stat.st_size, stat.st_mtime_ns), content_type, stat.st_mtime, body,
+                           file_tag(stat, hashlib.sha256(body).hexdigest()))
+
+    def put(self, path: str, asset: Asset):
+        """Cache asset, evicting the least recently used entries to stay within max_bytes.
+
+        Assets bigger than the whole budget are not cached.
+        """
+        if asset.size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(path, None)
+            if previous is not None:
+                self.size -= previous.size
+            self.entries[path] = asset
+            self.size += asset.size
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+
+class ETagCache:
+    """Strong ETags for files, hashed once per (size, mtime) version of each file.
+
+    The tag combines size, mtime and a SHA-256 prefix of the content, so it
+    changes whenever the file does, even if its mtime is restored.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, path: str, f, stat: os.stat_result) -> str:
+        """Return the ETag for the open file f; f is left at offset 0."""
+        key = (stat.st_size, stat.st_mtime_ns)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        hasher = hashlib.sha256()
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+        f.seek(0)
+        etag = f'"{file_tag(stat, hasher.hexdigest())}"'
+        with self.lock:
+            if len(self.entries) >= self.max_entries:
+                self.entries.clear()
+            self.entries[path] = (key, etag)
+        return etag
+
+
+def json_asset(data, last_modified: float) -> Asset:
+    """Compact JSON response body for data, tagged with its content hash."""
+    body = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return Asset.build(None, "application/json", last_modified, body, hashlib.sha256(body).hexdigest()[:16])
+
+
+class ProjectsAPI:
+    """Scanner results for /api/projects, kept in memory and rebuilt when project files change.
+
+    A background thread runs AIProjectScanner once, then watches the project
+    folders and re-parses only the projects whose files changed. Each result is
+    published as a snapshot of ready-to-send JSON assets, so requests never
+    wait for a scan once the first one is done.
+    """
+
+    def __init__(self, projects_root: str = DEFAULT_PROJECTS_ROOT, discovery: Optional[ProjectDiscovery] = None,
+                 poll_interval: float = 2.0, debounce: float = 0.5):
+        self.scanner = AIProjectScanner(projects_root, discovery=discovery, quiet=True)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        # (listing, {project name: asset}), replaced as a whole on every rebuild
+        self.snapshot = None
+        # Called as listener(event, data) for every project whose result changed after a rescan
+        self.listeners = []
+        self.scans = 0
+        self.scan_failures = 0
+        self.last_scan_seconds = 0.0
+        self.ready = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="projects-api", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def close(self):
+        self.stopping.set()
+        self.thread.join(self.poll_interval + 1.0)
+
+    def get(self, timeout: float = API_READY_TIMEOUT) -> Optional[Tuple[Asset, Dict[str, Asset]]]:
+        """The current snapshot, waiting up to timeout for the first scan; None if unavailable."""
+        self.ready.wait(timeout)
+        return self.snapshot
+
+    def versions(self) -> Dict[str, str]:
+        """ETag of every project's /api/projects/<name> response, by name (empty before the first scan)."""
+        snapshot = self.snapshot
+        return {name: asset.etags["identity"] for name, asset in snapshot[1].items()} if snapshot else {}
+
+    def _run(self):
+        try:
+            self._scan(self.scanner.scan_for_projects)
+            roots = self.scanner.watch_roots()
+            if not roots:
+                return
+            watcher = create_watcher(roots, WATCH_SUFFIXES, self.poll_interval)
+        finally:
+            self.ready.set()
+
+        logging.info(f"Projects API watching {len(roots)} folder(s) with {type(watcher).__name__}")
+        try:
+            while not self.stopping.is_set():
+                changed = watcher.wait(1.0)
+                if not changed:
+                    continue
+                while True:
+                    more = watcher.wait(self.debounce)
+                    if not more:
+                        break
+                    changed |= more
+                self._scan(lambda: self.scanner.update_projects(changed))
+        finally:
+            watcher.close()
+
+    def _scan(self, scan):
+        started = time.perf_counter()
+        try:
+            # The scanner reports progress on stdout; the server logs through its own handlers
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                scan()
+                projects = self.scanner.serialize_projects()
+        except Exception as e:
+            logging.error(f"Projects API scan failed: {e}")
+            self.scan_failures += 1
+            return
+        now = time.time()
+        previous = self.snapshot
+        self.snapshot = (json_asset(projects, now),
+                         {name: json_asset(project, now) for name, project in projects.items()})
+        if previous is not None:
+            self._notify(previous[1], self.snapshot[1])
+        self.scans += 1
+        self.last_scan_seconds = time.perf_counter() - started
+        logging.info(f"Projects API: {len(projects)} project(s) scanned in {self.last_scan_seconds:.2f}s")
+
+    def _notify(self, before: Dict[str, Asset], after: Dict[str, Asset]):
+        """Tell the listeners about projects added, removed or changed by a rescan."""
+        for name in sorted(set(before) | set(after)):
+            old = before[name].etags["identity"] if name in before else None
+            new = after[name].etags["identity"] if name in after else None
+            if old == new:
+                continue
+            data = {"source": "api", "name": name, "etag": new, "url": f"/api/projects/{quote(name)}"}
+            for listener in self.listeners:
+                listener("project", data)
+
+
+class DataWatcher:
+    """Markdown files in the /data/ folder (PROJECTS.md), watched so /events can announce changes.
+
+    Each file's version is the ETag it is served with; each "## " section
+    (one per project in PROJECTS.md) also gets a version from a hash of its
+    text, so a change notice names the projects whose section changed.
+    """
+
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR, poll_interval: float = 2.0, debounce: float = 0.5):
+        self.data_dir = os.path.abspath(data_dir)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        # URL path -> (ETag, {section title: version})
+        self.files = {}
+        # Called as listener(event, data) for every change
+        self.listeners = []
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="data-watcher", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def close(self):
+        self.stopping.set()
+        self.thread.join(self.poll_interval + 1.0)
+
+    def versions(self) -> Dict[str, Dict]:
+        """ETag and per-project versions of every watched file, by URL path."""
+        with self.lock:
+            return {url: {"etag": etag, "projects": sections} for url, (etag, sections) in self.files.items()}
+
+    def _url(self, path: str) -> str:
+        return "/data/" + "/".join(quote(part) for part in os.path.relpath(path, self.data_dir).split(os.sep))
+
+    def _read(self, path: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        try:
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                body = f.read()
+        except OSError:
+            return None
+        text = body.decode("utf-8", errors="replace")
+        sections = {
+            section.title.strip(): hashlib.sha256(text[section.start:section.end].encode("utf-8")).hexdigest()[:16]
+            for section in SectionIndex(text).sections if section.level == 2
+        }
+        return f'"{file_tag(stat, hashlib.sha256(body).hexdigest())}"', sections
+
+    def _run(self):
+        if not os.path.isdir(self.data_dir):
+            return
+        for path in walk_files(self.data_dir, suffixes=(".md",)):
+            version = self._read(str(path))
+            if version is not None:
+                with self.lock:
+                    self.files[self._url(str(path))] = version
+        watcher = create_watcher([self.data_dir], (".md",), self.poll_interval)
+        try:
+            while not self.stopping.is_set():
+                changed = watcher.wait(1.0)
+                if not changed:
+                    continue
+                while True:
+                    more = watcher.wait(self.debounce)
+                    if not more:
+                        break
+                    changed |= more
+                for path in sorted(changed):
+                    self._update(path)
+        finally:
+            watcher.close()
+
+    def _update(self, path: str):
+        url = self._url(path)
+        version = self._read(path)
+        with self.lock:
+            previous = self.files.pop(url, None)
+            if version is not None:
+                self.files[url] = version
+        if version == previous:
+            return
+
+        etag, sections = version or (None, {})
+        old_sections = previous[1] if previous else {}
+        notices = [("file", {"url": url, "etag": etag})]
+        for name in sorted(set(old_sections) | set(sections)):
+            if old_sections.get(name) != sections.get(name):
+                notices.append(("project", {"source": "data", "name": name, "version": sections.get(name),
+                                            "url": url, "etag": etag}))
+        logging.info(f"Data watcher: {url} changed ({len(notices) - 1} project section(s))")
+        for event, data in notices:
+            for listener in self.listeners:
+                listener(event, data)
+
+
+class RawEntry:
+    """One upstream response held by RawProxy: a 200 with its body, or a remembered 404."""
+
+    __slots__ = ("status", "body", "content_type", "fetched", "etag", "last_modified")
+
+    def __init__(self, status: int, body: bytes, content_type: Optional[str], fetched: float,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.fetched = fetched
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class RawFetch:
+    """An upstream fetch in progress; requests for the same key wait for its result."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class RawProxy:
+    """Caching proxy for GitHub raw content, shared by every viewer of the dashboard.
+
+    Responses are kept on disk under cache_dir. A 200 is fresh for ttl seconds;
+    for stale_ttl seconds after that it is still served while a background
+    request revalidates it, and it is also served if the upstream is failing.
+    A 404 is remembered for negative_ttl seconds. Concurrent requests for a
+    key that has to be fetched share a single upstream request.
+
+    Expired entries are deleted at startup and then at most every
+    RAW_PRUNE_INTERVAL seconds; when a write takes the cache over max_bytes,
+    the entries fetched longest ago are deleted as well.
+    """
+
+    def __init__(self, upstream: str = DEFAULT_RAW_UPSTREAM, cache_dir: str = DEFAULT_RAW_CACHE_DIR,
+                 ttl: float = DEFAULT_RAW_TTL, stale_ttl: float = DEFAULT_RAW_STALE,
+                 negative_ttl: float = DEFAULT_RAW_NEGATIVE_TTL, timeout: float = RAW_FETCH_TIMEOUT,
+                 max_bytes: int = DEFAULT_RAW_CACHE_BYTES):
+        self.upstream = upstream.rstrip("/")
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        # Responses ready to send, compressed, keyed by cache key and body hash
+        self.assets = AssetCache(16 * 1024 * 1024)
+        self.fetches = {}
+        # Requests answered per cache state, for /metrics
+        self.results = {"HIT": 0, "STALE": 0, "MISS": 0}
+        self.lock = threading.Lock()
+        # Bytes on disk as of the last prune plus everything written since, and files deleted for /metrics
+        self.disk_bytes = 0
+        self.evictions = 0
+        self.last_prune = 0.0
+        self.prune_lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self.prune()
+
+    def get(self, key: str) -> Tuple[Optional[RawEntry], str]:
+        """Return (entry, cache state) for owner/repo/path; entry is None if nothing could be fetched.
+
+        The state is "HIT", "STALE" or "MISS", for the X-Cache response header.
+        """
+        entry, state = self._lookup(key)
+        with self.lock:
+            self.results[state] += 1
+        return entry, state
+
+    def _lookup(self, key: str) -> Tuple[Optional[RawEntry], str]:
+        entry = self._load(key)
+        if entry is not None:
+            age = time.time() - entry.fetched
+            if age < (self.ttl if entry.status == 200 else self.negative_ttl):
+                return entry, "HIT"
+            if entry.status == 200 and age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(key, entry)
+                return entry, "STALE"
+
+        fetched = self._fetch_shared(key, entry)
+        if fetched is not None:
+            return fetched, "MISS"
+        if entry is not None and entry.status == 200:
+            # The upstream is failing: an old copy beats an error
+            return entry, "STALE"
+        return None, "MISS"
+
+    def asset(self, key: str, entry: RawEntry) -> Asset:
+        """The response for a 200 entry, built (and compressed) once per body."""
+        tag = hashlib.sha256(entry.body).hexdigest()[:16]
+        asset = self.assets.lookup(key, tag)
+        if asset is None:
+            asset = Asset.build(tag, entry.content_type or "text/plain; charset=utf-8", entry.fetched,
+                                entry.body, tag)
+            self.assets.put(key, asset)
+        return asset
+
+    def _refresh_in_background(self, key: str, entry: RawEntry):
+        with self.lock:
+            if key in self.fetches:
+                return
+        threading.Thread(target=self._fetch_shared, args=(key, entry), name="raw-refresh", daemon=True).start()
+
+    def _fetch_shared(self, key: str, previous: Optional[RawEntry]) -> Optional[RawEntry]:
+        with self.lock:
+            fetch = self.fetches.get(key)
+            leader = fetch is None
+            if leader:
+                fetch = self.fetches[key] = RawFetch()
+        if not leader:
+            fetch.done.wait(self.timeout + 1.0)
+            return fetch.result
+
+        try:
+            fetch.result = self._fetch(key, previous)
+        finally:
+            with self.lock:
+                del self.fetches[key]
+            fetch.done.set()
+        return fetch.result
+
+    def _fetch(self, key: str, previous: Optional[RawEntry]) -> Optional[RawEntry]:
+        """Fetch key from the upstream (revalidating previous) and store the result; None on failure."""
+        request = urllib.request.Request(f"{self.upstream}/{key}", headers={"User-Agent": "ProjectStatus-server"})
+        if previous is not None and previous.status == 200:
+            if previous.etag:
+                request.add_header("If-None-Match", previous.etag)
+            if previous.last_modified:
+                request.add_header("If-Modified-Since", previous.last_modified)
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                entry = RawEntry(200, response.read(), response.headers.get("Content-Type"), time.time(),
+                                 response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and previous is not None:
+                entry = RawEntry(200, previous.body, previous.content_type, time.time(),
+                                 previous.etag, previous.last_modified)
+            elif e.code == 404:
+                entry = RawEntry(404, b"", None, time.time())
+            else:
+                logging.warning(f"Raw proxy: upstream returned {e.code} for {key}")
+                return None
+        except (urllib.error.URLError, OSError) as e:
+            logging.warning(f"Raw proxy: fetching {key} failed: {e}")
+            return None
+
+        self._store(key, entry)
+        return entry
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest())
+        return base + ".json", base + ".body"
+
+    def _load(self, key: str) -> Optional[RawEntry]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            body = b""
+            if meta["status"] == 200:
+                with open(body_path, 'rb') as f:
+                    body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        if meta.get("key") != key or (meta["status"] == 200 and len(body) != meta.get("size")):
+            return None
+        return RawEntry(meta["status"], body, meta.get("content_type"), meta["fetched"],
+                        meta.get("etag"), meta.get("last_modified"))
+
+    def _store(self, key: str, entry: RawEntry):
+        """Write the entry atomically: body first, then the metadata that points at it."""
+        meta_path, body_path = self._paths(key)
+        meta = {
+            "key": key,
+            "status": entry.status,
+            "size": len(entry.body),
+            "content_type": entry.content_type,
+            "fetched": entry.fetched,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified
+        }
+        try:
+            if entry.status == 200:
+                with tempfile.NamedTemporaryFile('wb', dir=self.cache_dir, delete=False) as f:
+                    f.write(entry.body)
+                os.replace(f.name, body_path)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_dir, delete=False) as f:
+                json.dump(meta, f)
+            os.replace(f.name, meta_path)
+        except OSError as e:
+            logging.warning(f"Raw proxy: caching {key} failed: {e}")
+            return
+        with self.lock:
+            self.disk_bytes += len(entry.body)
+            due = self.disk_bytes > self.max_bytes or time.time() - self.last_prune > RAW_PRUNE_INTERVAL
+        if due:
+            self.prune()
+
+    def prune(self):
+        """Delete expired entries and leftover files, then the oldest entries until within max_bytes."""
+        if not self.prune_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.time()
+            entries = []
+            files = set()
+            with os.scandir(self.cache_dir) as scan:
+                for item in scan:
+                    files.add(item.name)
+            for name in files:
+                path = os.path.join(self.cache_dir, name)
+                base, ext = os.path.splitext(name)
+                if ext == ".body" and base + ".json" in files:
+                    continue
+                if ext != ".json":
+                    # A body without metadata, or a temporary file left by an interrupted write
+                    try:
+                        if now - os.stat(path).st_mtime > self.timeout + 60.0:
+                            os.unlink(path)
+                    except OSError:
+                        pass
+                    continue
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                    status, fetched = meta["status"], float(meta["fetched"])
+                    size = int(meta.get("size") or 0)
+                except (OSError, ValueError, KeyError, TypeError):
+                    status, fetched, size = None, 0.0, 0
+                max_age = self.ttl + self.stale_ttl if status == 200 else self.negative_ttl
+                if now - fetched > max_age:
+                    self._delete(base)
+                else:
+                    entries.append((fetched, size, base))
+
+            total = sum(size for _, size, _ in entries)
+            for fetched, size, base in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self._delete(base)
+                total -= size
+            with self.lock:
+                self.disk_bytes = total
+                self.last_prune = now
+        except OSError as e:
+            logging.warning(f"Raw proxy: pruning {self.cache_dir} failed: {e}")
+        finally:
+            self.prune_lock.release()
+
+    def _delete(self, base: str):
+        """Remove one entry: the metadata first, so it never points at a missing body."""
+        for ext in (".json", ".body"):
+            try:
+                os.unlink(os.path.join(self.cache_dir, base + ext))
+            except OSError:
+                pass
+        with self.lock:
+            self.evictions += 1
+
+
+class EventStream:
+    """Server-Sent Events for /events, written to every subscriber by one thread.
+
+    A worker hands the connection over once the response headers are sent, so
+    an idle dashboard costs an open socket in a selector rather than a worker
+    thread. Clients that stop reading are dropped once more than max_buffer
+    bytes are waiting for them.
+    """
+
+    def __init__(self, heartbeat: float = DEFAULT_EVENTS_HEARTBEAT, max_buffer: int = EVENTS_MAX_BUFFER):
+        self.heartbeat = heartbeat
+        self.max_buffer = max_buffer
+        self.selector = selectors.DefaultSelector()
+        self.wake_reader, self.wake_writer = socket.socketpair()
+        self.wake_reader.setblocking(False)
+        self.wake_writer.setblocking(False)
+        self.selector.register(self.wake_reader, selectors.EVENT_READ)
+        self.lock = threading.Lock()
+        # Handed from other threads to the event thread
+        self.joining = []
+        self.outbox = []
+        self.subscribers = set()
+        self.stopping = False
+        self.last_id = 0
+        # Bytes still to send to each client; only touched by the event thread
+        self.clients = {}
+        self.thread = threading.Thread(target=self._run, name="events", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def close(self):
+        """Stop the event thread and close every subscribed connection."""
+        with self.lock:
+            self.stopping = True
+        self._wake()
+        self.thread.join(2.0)
+
+    def owns(self, connection) -> bool:
+        with self.lock:
+            return connection in self.subscribers
+
+    def subscriber_count(self) -> int:
+        with self.lock:
+            return len(self.subscribers)
+
+    def subscribe(self, connection: socket.socket, greeting: bytes):
+        """Take over connection, whose response headers have been sent; greeting is written first."""
+        with self.lock:
+            if self.stopping:
+                return
+            self.subscribers.add(connection)
+            self.joining.append((connection, greeting))
+        self._wake()
+
+    def publish(self, event: str, data):
+        """Send an event with JSON data to every subscriber."""
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        with self.lock:
+            self.last_id += 1
+            self.outbox.append(f"id: {self.last_id}\nevent: {event}\ndata: {payload}\n\n".encode("utf-8"))
+        self._wake()
+
+    def _wake(self):
+        try:
+            self.wake_writer.send(b"\0")
+        except OSError:
+            # The wake-up socket is full, so the event thread is already due to run
+            pass
+
+    def _run(self):
+        next_heartbeat = time.monotonic() + self.heartbeat
+        try:
+            while True:
+                for key, mask in self.selector.select(max(0.0, next_heartbeat - time.monotonic())):
+                    if key.fileobj is self.wake_reader:
+                        try:
+                            while self.wake_reader.recv(4096):
+                                pass
+                        except OSError:
+                            pass
+                    elif mask & selectors.EVENT_READ and not self._readable(key.fileobj):
+                        self._drop(key.fileobj)
+                    elif mask & selectors.EVENT_WRITE:
+                        self._flush(key.fileobj)
+
+                with self.lock:
+                    joining, self.joining = self.joining, []
+                    outbox, self.outbox = self.outbox, []
+                    stopping = self.stopping
+                if stopping:
+                    for connection, _ in joining:
+                        self._close(connection)
+                    return
+                for connection, greeting in joining:
+                    connection.setblocking(False)
+                    self.clients[connection] = bytearray(greeting)
+                    self.selector.register(connection, selectors.EVENT_READ)
+                    self._flush(connection)
+                if time.monotonic() >= next_heartbeat:
+                    # A comment line keeps proxies from timing the stream out and finds dead clients
+                    outbox.append(b": ping\n\n")
+                    next_heartbeat = time.monotonic() + self.heartbeat
+                if outbox:
+                    message = b"".join(outbox)
+                    for connection in list(self.clients):
+                        self.clients[connection] += message
+                        self._flush(connection)
+        finally:
+            for connection in list(self.clients):
+                self._drop(connection)
+            self.selector.close()
+            self.wake_reader.close()
+            self.wake_writer.close()
+
+    def _readable(self, connection: socket.socket) -> bool:
+        """Discard anything the client sends; False once it has closed the connection."""
+        try:
+            return connection.recv(4096) != b""
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    def _flush(self, connection: socket.socket):
+        buffer = self.clients.get(connection)
+        if buffer is None:
+            return
+        try:
+            sent = connection.send(buffer) if buffer else 0
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._drop(connection)
+            return
+        del buffer[:sent]
+        if len(buffer) > self.max_buffer:
+            logging.debug("Event stream client fell behind - dropped")
+            self._drop(connection)
+            return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if buffer else 0)
+        if self.selector.get_key(connection).events != events:
+            self.selector.modify(connection, events)
+
+    def _drop(self, connection: socket.socket):
+        self.clients.pop(connection, None)
+        try:
+            self.selector.unregister(connection)
+        except (KeyError, ValueError):
+            pass
+        self._close(connection)
+
+    def _close(self, connection: socket.socket):
+        with self.lock:
+            self.subscribers.discard(connection)
+        try:
+            connection.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        connection.close()
+
+
+class IdleConnections:
+    """Keep-alive connections between requests, watched by one thread instead of held by workers.
+
+    A worker parks a connection once its response is sent; when the client
+    sends its next request the connection goes back on the server's queue,
+    and after keep_alive idle seconds it is closed.
+    """
+
+    def __init__(self, server: "ThreadPoolHTTPServer", keep_alive: float):
+        self.server = server
+        self.keep_alive = keep_alive
+        self.selector = selectors.DefaultSelector()
+        self.wake_reader, self.wake_writer = socket.socketpair()
+        self.wake_reader.setblocking(False)
+        self.wake_writer.setblocking(False)
+        self.selector.register(self.wake_reader, selectors.EVENT_READ)
+        self.lock = threading.Lock()
+        self.joining = []
+        self.stopping = False
+        self.parked = 0
+        # Handler -> monotonic time it is closed if still idle; only touched by the idle thread
+        self.deadlines = {}
+        self.thread = threading.Thread(target=self._run, name="keep-alive", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def close(self):
+        """Close every idle connection and stop the thread."""
+        with self.lock:
+            self.stopping = True
+        self._wake()
+        self.thread.join(2.0)
+
+    def count(self) -> int:
+        with self.lock:
+            return self.parked
+
+    def park(self, handler) -> bool:
+        """Watch handler's connection for its next request; False if shutting down."""
+        with self.lock:
+            if self.stopping:
+                return False
+            self.parked += 1
+            self.joining.append(handler)
+        self._wake()
+        return True
+
+    def _wake(self):
+        try:
+            self.wake_writer.send(b"\0")
+        except OSError:
+            # The wake-up socket is full, so the idle thread is already due to run
+            pass
+
+    def _run(self):
+        try:
+            while True:
+                timeout = None
+                if self.deadlines:
+                    timeout = max(0.0, min(self.deadlines.values()) - time.monotonic())
+                for key, _ in self.selector.select(timeout):
+                    if key.fileobj is self.wake_reader:
+                        try:
+                            while self.wake_reader.recv(4096):
+                                pass
+                        except OSError:
+                            pass
+                    else:
+                        self._unpark(key.data)
+                        self.server.resume_request(key.data)
+
+                with self.lock:
+                    joining, self.joining = self.joining, []
+                    stopping = self.stopping
+                if stopping:
+                    for handler in joining:
+                        self.deadlines[handler] = 0
+                    for handler in list(self.deadlines):
+                        self._unpark(handler)
+                        self.server.close_parked(handler)
+                    return
+                deadline = time.monotonic() + self.keep_alive
+                for handler in joining:
+                    self.deadlines[handler] = deadline
+                    self.selector.register(handler.connection, selectors.EVENT_READ, handler)
+                now = time.monotonic()
+                for handler in [handler for handler, deadline in self.deadlines.items() if deadline <= now]:
+                    self._unpark(handler)
+                    self.server.close_parked(handler)
+        finally:
+            self.selector.close()
+            self.wake_reader.close()
+            self.wake_writer.close()
+
+    def _unpark(self, handler):
+        del self.deadlines[handler]
+        try:
+            self.selector.unregister(handler.connection)
+        except (KeyError, ValueError):
+            pass
+        with self.lock:
+            self.parked -= 1
+
+
+def path_class(path: str) -> str:
+    """The PATH_CLASSES label for a request path; "other" if no pattern matches."""
+    url_path = urlsplit(path).path
+    for pattern, name in PATH_CLASSES:
+        if fnmatch.fnmatchcase(url_path, pattern):
+            return name
+    return "other"
+
+
+class Metrics:
+    """Request counters for /metrics, rendered in the Prometheus text format.
+
+    Recording a request takes one lock and a few dict updates; cache and
+    queue figures are read from the server's components only when scraped.
+    """
+
+    def __init__(self, log_handler: Optional[DroppingQueueHandler] = None):
+        self.log_handler = log_handler
+        self.lock = threading.Lock()
+        self.requests = {}
+        # Per path class: a count per latency bucket (the last one is +Inf), sum, bytes sent
+        self.latency = {}
+        self.latency_sum = {}
+        self.bytes_sent = {}
+        self.in_flight = 0
+        self.disconnects = {"broken_pipe": 0, "connection_reset": 0}
+        self.started = time.time()
+
+    def request_started(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def request_finished(self, path: Optional[str], status: Optional[int], duration: float, bytes_sent: int):
+        """Record a finished request; path is None for one that could not be parsed."""
+        name = path_class(path) if path is not None else "invalid"
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, duration)
+        key = (name, str(status) if status is not None else "none")
+        with self.lock:
+            self.in_flight -= 1
+            self.requests[key] = self.requests.get(key, 0) + 1
+            counts = self.latency.get(name)
+            if counts is None:
+                counts = self.latency[name] = [0] * (len(LATENCY_BUCKETS) + 1)
+            counts[bucket] += 1
+            self.latency_sum[name] = self.latency_sum.get(name, 0.0) + duration
+            self.bytes_sent[name] = self.bytes_sent.get(name, 0) + bytes_sent
+
+    def disconnect(self, reason: str):
+        with self.lock:
+            self.disconnects[reason] += 1
+
+    def render(self, server) -> str:
+        """Every metric in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP projectstatus_{name} {help_text}")
+            lines.append(f"# TYPE projectstatus_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+                lines.append(f"projectstatus_{name}{suffix}{{{label_text}}} {value}" if label_text
+                             else f"projectstatus_{name}{suffix} {value}")
+
+        with self.lock:
+            requests = sorted(self.requests.items())
+            latency = {name: list(counts) for name, counts in self.latency.items()}
+            latency_sum = dict(self.latency_sum)
+            bytes_sent = sorted(self.bytes_sent.items())
+            in_flight = self.in_flight
+            disconnects = sorted(self.disconnects.items())
+
+        metric("http_requests_total", "counter", "HTTP requests by path class and status.",
+               [("", (("class", name), ("status", status)), count) for (name, status), count in requests])
+        samples = []
+        for name in sorted(latency):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), latency[name]):
+                cumulative += count
+                samples.append(("_bucket", (("class", name), ("le", bound)), cumulative))
+            samples.append(("_sum", (("class", name),), f"{latency_sum[name]:.6f}"))
+            samples.append(("_count", (("class", name),), cumulative))
+        metric("http_request_duration_seconds", "histogram", "Time from reading a request to sending its response.",
+               samples)
+        metric("http_response_bytes_total", "counter", "Response bytes written, headers included, by path class.",
+               [("", (("class", name),), count) for name, count in bytes_sent])
+        metric("http_requests_in_flight", "gauge", "Requests currently being handled.", [("", (), in_flight)])
+        metric("http_client_disconnects_total", "counter", "Responses cut short by the client closing the connection.",
+               [("", (("reason", reason),), count) for reason, count in disconnects])
+
+        with server.connections_lock:
+            connections = len(server.connections)
+        metric("http_connections_open", "gauge", "Connections held by a worker.", [("", (), connections)])
+        metric("http_connections_idle", "gauge", "Keep-alive connections waiting for their next request.",
+               [("", (), server.idle.count())])
+        metric("http_connections_queued", "gauge", "Accepted connections waiting for a worker.",
+               [("", (), server.pending.qsize())])
+        metric("http_workers", "gauge", "Worker threads.", [("", (), len(server.workers))])
+
+        caches = [("etag", server.etags)]
+        if server.assets is not None:
+            caches.append(("static", server.assets))
+        if server.raw_proxy is not None:
+            caches.append(("raw_response", server.raw_proxy.assets))
+        metric("cache_requests_total", "counter", "In-memory cache lookups by cache and result.",
+               [("", (("cache", name), ("result", "hit")), cache.hits) for name, cache in caches] +
+               [("", (("cache", name), ("result", "miss")), cache.misses) for name, cache in caches])
+        sized = [(name, cache) for name, cache in caches if isinstance(cache, AssetCache)]
+        metric("cache_bytes", "gauge", "Bytes held by each asset cache, compressed variants included.",
+               [("", (("cache", name),), cache.size) for name, cache in sized])
+        metric("cache_evictions_total", "counter", "Entries evicted from each asset cache to stay within budget.",
+               [("", (("cache", name),), cache.evictions) for name, cache in sized])
+
+        if server.raw_proxy is not None:
+            metric("raw_proxy_requests_total", "counter", "/proxy/raw/ requests by cache state.",
+                   [("", (("state", state.lower()),), count) for state, count in sorted(server.raw_proxy.results.items())])
+            metric("raw_proxy_disk_bytes", "gauge", "Bytes of proxied files in the raw disk cache.",
+                   [("", (), server.raw_proxy.disk_bytes)])
+            metric("raw_proxy_disk_evictions_total", "counter",
+                   "Raw disk cache entries deleted because they expired or the cache was full.",
+                   [("", (), server.raw_proxy.evictions)])
+        if server.events is not None:
+            metric("events_clients", "gauge", "Connections subscribed to /events.",
+                   [("", (), server.events.subscriber_count())])
+            metric("events_published_total", "counter", "Events sent to /events subscribers.",
+                   [("", (), server.events.last_id)])
+        if server.projects_api is not None:
+            api = server.projects_api
+            metric("projects_scans_total", "counter", "Completed project scans for /api/projects.", [("", (), api.scans)])
+            metric("projects_scan_failures_total", "counter", "Failed project scans.", [("", (), api.scan_failures)])
+            metric("projects_last_scan_seconds", "gauge", "Duration of the latest project scan.",
+                   [("", (), f"{api.last_scan_seconds:.6f}")])
+        if self.log_handler is not None:
+            metric("log_records_dropped_total", "counter", "Log records dropped because the log queue was full.",
+                   [("", (), self.log_handler.dropped)])
+        metric("start_time_seconds", "gauge", "Unix time the server started.", [("", (), f"{self.started:.3f}")])
+        return "\n".join(lines) + "\n"
+
+
+class ThreadPoolHTTPServer(http.server.HTTPServer):
+    """HTTP server handing accepted connections to a fixed pool of worker threads.
+
+    Connections wait in a bounded queue; when it is full new connections get
+    a 503 instead of piling up. Between requests, keep-alive connections are
+    parked in IdleConnections, so an idle browser connection does not hold a
+    worker. server_close() stops accepting, lets queued and in-flight requests
+    finish and closes idle keep-alive connections.
+    """
+
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, workers: int = DEFAULT_WORKERS,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, keep_alive: float = DEFAULT_KEEP_ALIVE,
+                 shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT,
+                 cache_control: Optional[List[Tuple[str, str]]] = None,
+                 asset_cache_bytes: int = DEFAULT_ASSET_CACHE_BYTES,
+                 projects_api: Optional[ProjectsAPI] = None, raw_proxy: Optional[RawProxy] = None,
+                 access_log: Optional[AccessLog] = None, metrics: Optional[Metrics] = None,
+                 data_dir: Optional[str] = None, data_watcher: Optional[DataWatcher] = None,
+                 events: Optional[EventStream] = None, use_sendfile: bool = True):
+        super().__init__(server_address, handler_class)
+        self.keep_alive = keep_alive
+        self.cache_control = DEFAULT_CACHE_CONTROL if cache_control is None else cache_control
+        self.etags = ETagCache()
+        self.use_sendfile = use_sendfile and hasattr(os, "sendfile")
+        self.assets = AssetCache(asset_cache_bytes) if asset_cache_bytes > 0 else None
+        self.raw_proxy = raw_proxy
+        self.access_log = access_log if access_log is not None else AccessLog()
+        self.metrics = metrics
+        self.projects_api = projects_api
+        self.data_dir = data_dir
+        self.data_watcher = data_watcher
+        self.events = events
+        if events is not None:
+            for source in (projects_api, data_watcher):
+                if source is not None:
+                    source.listeners.append(events.publish)
+            events.start()
+        for source in (projects_api, data_watcher):
+            if source is not None:
+                source.start()
+        self.shutdown_timeout = shutdown_timeout
+        self.draining = False
+        self.pending = queue.Queue(queue_size)
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+        self.idle = IdleConnections(self, keep_alive)
+        self.idle.start()
+        self.workers = [threading.Thread(target=self._work, name=f"http-worker-{i}", daemon=True)
+                        for i in range(max(1, workers))]
+        for worker in self.workers:
+            worker.start()
+
+    def process_request(self, request, client_address):
+        try:
+            self.pending.put_nowait((request, client_address, None))
+        except queue.Full:
+            self._reject(request, client_address)
+
+    def resume_request(self, handler):
+        """Queue a parked keep-alive connection whose next request has arrived."""
+        try:
+            self.pending.put_nowait((handler.connection, handler.client_address, handler))
+        except queue.Full:
+            self._reject(handler.connection, handler.client_address, handler)
+
+    def close_parked(self, handler):
+        handler.parked = False
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.connection)
+
+    def _reject(self, request, client_address, handler=None):
+        logging.warning(f"Request queue full - rejecting {client_address[0]}")
+        try:
+            request.sendall(b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 1\r\n"
+                            b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+        except OSError:
+            pass
+        if handler is not None:
+            self.close_parked(handler)
+        else:
+            self.shutdown_request(request)
+
+    def finish_request(self, request, client_address):
+        """Serve a new connection; returns its handler, which may be parked."""
+        return self.RequestHandlerClass(request, client_address, self)
+
+    def shutdown_request(self, request):
+        """Close a finished connection, unless it now belongs to the event stream."""
+        if self.events is not None and self.events.owns(request):
+            return
+        super().shutdown_request(request)
+
+    def _work(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            request, client_address, handler = item
+            with self.connections_lock:
+                self.connections.add(request)
+            try:
+                if handler is None:
+                    handler = self.finish_request(request, client_address)
+                else:
+                    handler.resume()
+            except Exception:
+                handler = None
+                self.handle_error(request, client_address)
+            finally:
+                with self.connections_lock:
+                    self.connections.discard(request)
+                if handler is not None and handler.parked:
+                    if not self.idle.park(handler):
+                        self.close_parked(handler)
+                else:
+                    self.shutdown_request(request)
+
+    def server_close(self):
+        """Stop accepting connections and wait up to shutdown_timeout for the workers."""
+        super().server_close()
+        self.draining = True
+        for source in (self.projects_api, self.data_watcher, self.events, self.idle):
+            if source is not None:
+                source.close()
+        # Wake workers blocked reading a request that has not fully arrived;
+        # responses being written are not affected
+        with self.connections_lock:
+            for connection in self.connections:
+                try:
+                    connection.shutdown(socket.SHUT_RD)
+                except OSError:
+                    pass
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for _ in self.workers:
+            try:
+                self.pending.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                break
+        for worker in self.workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        busy = sum(worker.is_alive() for worker in self.workers)
+        if busy:
+            logging.warning(f"Shutdown timed out with {busy} requests still running")
+
+
+class CountingWriter:
+    """File-like wrapper around a handler's wfile that counts the bytes written."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        written = self.wfile.write(data)
+        self.bytes_written += len(data)
+        return written
+
+    @property
+    def closed(self) -> bool:
+        return self.wfile.closed
+
+    def flush(self):
+        self.wfile.flush()
+
+    def close(self):
+        self.wfile.close()
+
+    def sendfile(self, connection: socket.socket, f, offset: int, count: int, use_sendfile: bool = True) -> int:
+        """Write count bytes of f from offset, with os.sendfile where possible; returns the bytes sent.
+
+        socket.sendfile() falls back to send() itself when the socket or file
+        does not support sendfile; with use_sendfile off the file is copied
+        through this writer in COPY_BUFSIZE chunks.
+        """
+        if use_sendfile:
+            self.wfile.flush()
+            sent = connection.sendfile(f, offset, count)
+            self.bytes_written += sent
+            return sent
+        f.seek(offset)
+        sent = 0
+        while sent < count:
+            chunk = f.read(min(COPY_BUFSIZE, count - sent))
+            if not chunk:
+                break
+            self.write(chunk)
+            sent += len(chunk)
+        return sent
+
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom HTTP request handler with better error handling."""
-    
+
+    # Persistent connections: every response carries a Content-Length
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle's algorithm the body of a response on a
+    # reused connection waits for the client's delayed ACK of the headers (~40ms)
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        """Apply the server's keep-alive timeout to the connection."""
+        self.timeout = getattr(self.server, 'keep_alive', None)
+        super().setup()
+        self.wfile = CountingWriter(self.wfile)
+
     def log_message(self, format, *args):
         """Override to use our logging configuration."""
         logging.info(f"{self.address_string()} - {format % args}")
-    
+
+    def log_request(self, code='-', size='-'):
+        """Remember the status; the access record is written once the response is complete."""
+        self.status = int(code) if isinstance(code, int) or str(code).isdigit() else None
+
+    def log_error(self, format, *args):
+        """Errors sent to the client are already in the access log; keep the message at debug level."""
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+    def handle(self):
+        """Serve requests on the connection until it closes, goes idle or the server shuts down.
+
+        An idle keep-alive connection is parked with the server's
+        IdleConnections instead of blocking this worker on the next read;
+        resume() carries on once the client sends another request.
+        """
+        self.parked = False
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and not getattr(self.server, 'draining', False):
+            if getattr(self.server, 'idle', None) is not None and not self.request_waiting():
+                self.parked = True
+                return
+            self.handle_one_request()
+
+    def resume(self):
+        """Serve the next requests of a parked connection that has become readable."""
+        try:
+            self.handle()
+        finally:
+            self.finish()
+
+    def finish(self):
+        """Close the connection's files, unless it is being parked."""
+        if not self.parked:
+            super().finish()
+
+    def request_waiting(self) -> bool:
+        """True if (part of) the next request is already readable, e.g. pipelined after the last one."""
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def parse_request(self):
+        """Start timing, and count the request as in flight, once its request line has been read."""
+        self.request_started = time.perf_counter()
+        metrics = getattr(self.server, 'metrics', None)
+        if metrics is not None:
+            metrics.request_started()
+            self.in_flight = True
+        self.request_parsed = super().parse_request()
+        return self.request_parsed
+
+    def client_disconnected(self, reason: str):
+        self.close_connection = True
+        metrics = getattr(self.server, 'metrics', None)
+        if metrics is not None:
+            metrics.disconnect(reason)
+
     def handle_one_request(self):
         """Override to handle broken pipe errors gracefully."""
+        # Nothing may carry over from the previous request on a keep-alive connection
+        self.path = None
+        self.status = None
+        self.in_flight = False
+        self.request_parsed = False
+        # Set by parse_request; time spent waiting for the request on an idle keep-alive connection is not counted
+        self.request_started = None
+        bytes_before = self.wfile.bytes_written
         try:
             super().handle_one_request()
         except BrokenPipeError:
             # This is normal when browsers close connections
             logging.debug("Broken pipe - client disconnected")
+            self.client_disconnected("broken_pipe")
         except ConnectionResetError:
             # This is also normal when browsers reset connections
             logging.debug("Connection reset - client disconnected")
+            self.client_disconnected("connection_reset")
         except Exception as e:
             logging.error(f"Unexpected error: {e}")
-    
+            self.close_connection = True
+        finally:
+            duration = time.perf_counter() - self.request_started if self.request_started else 0.0
+            bytes_sent = self.wfile.bytes_written - bytes_before
+            access_log = getattr(self.server, 'access_log', None)
+            if self.status is not None and access_log is not None:
+                access_log.record(self, self.status, duration, bytes_sent)
+            if self.in_flight:
+                # A malformed request line has no path to classify
+                self.server.metrics.request_finished(self.path if self.request_parsed else None, self.status,
+                                                     duration, bytes_sent)
+
     def end_headers(self):
         """Add CORS headers for development."""
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        if getattr(self.server, 'draining', False):
+            self.send_header('Connection', 'close')
         super().end_headers()
-    
+
+    def cache_control_for(self, path: str) -> Optional[str]:
+        """Cache-Control value of the first rule whose pattern matches the URL path."""
+        for pattern, value in getattr(self.server, 'cache_control', DEFAULT_CACHE_CONTROL):
+            if fnmatch.fnmatchcase(path, pattern):
+                return value
+        return None
+
+    def not_modified(self, etag: str, mtime: float) -> bool:
+        """Evaluate If-None-Match, or If-Modified-Since when there is none, against a file."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            # If-None-Match uses weak comparison: W/"x" matches "x"
+            return "*" in tags or any(tag.replace("W/", "", 1) == etag for tag in tags)
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is None:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        modified = datetime.datetime.fromtimestamp(int(mtime), datetime.timezone.utc)
+        return modified <= since
+
+    def send_validators(self, etag: str, mtime: float, cache_control: Optional[str]):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        if cache_control:
+            self.send_header("Cache-Control", cache_control)
+
+    def send_head(self):
+        """Serve regular files with ETag, Last-Modified and Cache-Control, answering 304 when unchanged.
+
+        Files small enough for the asset cache are served from memory, compressed
+        when the client accepts it. Redirects, directory listings and errors are
+        left to SimpleHTTPRequestHandler.
+        """
+        # (part header, offset, length) of each piece of the file to send; see copyfile()
+        self.file_parts = None
+        url_path = urlsplit(self.path).path
+        if url_path == "/api" or url_path.startswith("/api/"):
+            return self.send_api(url_path)
+        if url_path.startswith("/proxy/"):
+            return self.send_raw_proxy(url_path)
+        if url_path == "/metrics" and getattr(self.server, 'metrics', None) is not None:
+            return self.send_metrics()
+        if url_path == "/events" and getattr(self.server, 'events', None) is not None:
+            return self.send_events()
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not url_path.endswith('/'):
+                return super().send_head()
+            for index in "index.html", "index.htm":
+                if os.path.isfile(os.path.join(path, index)):
+                    path = os.path.join(path, index)
+                    break
+            else:
+                return super().send_head()
+        etags = getattr(self.server, 'etags', None)
+        if etags is None or path.endswith("/") or not os.path.isfile(path):
+            return super().send_head()
+        cache_control = self.cache_control_for(url_path)
+
+        assets = getattr(self.server, 'assets', None)
+        # Range requests are answered from the file, which is the identity encoding the ranges refer to
+        if assets is not None and "Range" not in self.headers:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return super().send_head()
+            if assets.cacheable(stat):
+                asset = assets.get(path, stat, self.guess_type(path))
+                if asset is not None:
+                    # A Range request for this file is served from disk below
+                    return self.send_asset(asset, cache_control, {"Accept-Ranges": "bytes"})
+
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        try:
+            stat = os.fstat(f.fileno())
+            etag = etags.get(path, f, stat)
+            if self.not_modified(etag, stat.st_mtime):
+                f.close()
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_validators(etag, stat.st_mtime, cache_control)
+                self.end_headers()
+                return None
+
+            return self.send_file(f, stat, etag, self.guess_type(path), cache_control)
+        except:
+            f.close()
+            raise
+
+    def send_file(self, f, stat: os.stat_result, etag: str, content_type: str, cache_control: Optional[str]):
+        """Send the headers for a whole file, one range of it or several as multipart/byteranges.
+
+        The body is written by copyfile() from self.file_parts; an
+        unsatisfiable Range gets a 416 and None is returned.
+        """
+        size = stat.st_size
+        ranges = None
+        if "Range" in self.headers and self.range_applies(etag, stat.st_mtime):
+            ranges = parse_range(self.headers["Range"], size)
+        if ranges is not None and not ranges:
+            f.close()
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.send_validators(etag, stat.st_mtime, cache_control)
+            self.end_headers()
+            return None
+
+        if not ranges:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-type", content_type)
+            self.file_parts = [(b"", 0, size)]
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-type", content_type)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.file_parts = [(b"", start, end - start + 1)]
+        else:
+            boundary = os.urandom(12).hex()
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-type", f"multipart/byteranges; boundary={boundary}")
+            headers = [
+                (("\r\n" if i else "") + f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+                 f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n").encode("latin-1")
+                for i, (start, end) in enumerate(ranges)
+            ]
+            self.file_parts = [(header, start, end - start + 1) for header, (start, end) in zip(headers, ranges)]
+            self.file_parts.append((f"\r\n--{boundary}--\r\n".encode("latin-1"), 0, 0))
+        self.send_header("Content-Length", str(sum(len(header) + length for header, _, length in self.file_parts)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_validators(etag, stat.st_mtime, cache_control)
+        self.end_headers()
+        return f
+
+    def range_applies(self, etag: str, mtime: float) -> bool:
+        """Evaluate If-Range: ranges are only served if the client's copy is still current."""
+        if_range = self.headers.get("If-Range")
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith(('"', 'W/')):
+            # Strong comparison: a weak tag never matches
+            return if_range == etag
+        try:
+            since = email.utils.parsedate_to_datetime(if_range)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        return datetime.datetime.fromtimestamp(int(mtime), datetime.timezone.utc) == since
+
+    def copyfile(self, source, outputfile):
+        """Write a body from send_head(); files go out with sendfile, ranges and all."""
+        parts, self.file_parts = self.file_parts, None
+        if parts is None:
+            return super().copyfile(source, outputfile)
+        use_sendfile = getattr(self.server, 'use_sendfile', True)
+        for header, offset, length in parts:
+            if header:
+                outputfile.write(header)
+            if length and outputfile.sendfile(self.connection, source, offset, length, use_sendfile) < length:
+                # The file shrank while being sent: the response is short of its Content-Length
+                logging.warning(f"{self.path} changed while being sent")
+                self.close_connection = True
+                return
+
+    def send_asset(self, asset: Asset, cache_control: Optional[str], headers: Optional[Dict[str, str]] = None):
+        """Send the headers for a cached asset in the best accepted encoding; returns its body as a file."""
+        encoding = asset.select(self.headers.get("Accept-Encoding"))
+        etag = asset.etags[encoding]
+        modified = not self.not_modified(etag, asset.last_modified)
+        if modified:
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-type", asset.content_type)
+            self.send_header("Content-Length", str(len(asset.bodies[encoding])))
+            if encoding != "identity":
+                self.send_header("Content-Encoding", encoding)
+        else:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+        if len(asset.bodies) > 1:
+            self.send_header("Vary", "Accept-Encoding")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_validators(etag, asset.last_modified, cache_control)
+        self.end_headers()
+        return io.BytesIO(asset.bodies[encoding]) if modified else None
+
+    def send_api(self, url_path: str):
+        """/api/projects (every project, keyed by name) and /api/projects/<name>."""
+        api = getattr(self.server, 'projects_api', None)
+        parts = [unquote(part) for part in url_path.split("/") if part]
+        if api is None or parts[:2] != ["api", "projects"] or len(parts) > 3:
+            self.send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return None
+
+        snapshot = api.get()
+        if snapshot is None:
+            self.send_error(HTTPStatus.SERVICE_UNAVAILABLE, "Project data is not available yet")
+            return None
+        listing, projects = snapshot
+        asset = listing if len(parts) == 2 else projects.get(parts[2])
+        if asset is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "No such project")
+            return None
+        return self.send_asset(asset, self.cache_control_for(url_path))
+
+    def send_raw_proxy(self, url_path: str):
+        """/proxy/raw/<owner>/<repo>/<path>: GitHub raw content through the server's RawProxy."""
+        proxy = getattr(self.server, 'raw_proxy', None)
+        key = url_path[len("/proxy/raw/"):] if url_path.startswith("/proxy/raw/") else ""
+        segments = key.split("/")
+        if proxy is None or len(segments) < 3 or any(segment in ("", ".", "..") for segment in segments):
+            self.send_error(HTTPStatus.NOT_FOUND, "Not found")
+            return None
+
+        entry, state = proxy.get(key)
+        if entry is None:
+            self.send_error(HTTPStatus.BAD_GATEWAY, "Upstream fetch failed")
+            return None
+        if entry.status == 404:
+            # X-Cache tells the page this 404 came from the proxy, not from a server without one
+            body = b"File not found upstream\n"
+            self.send_response(HTTPStatus.NOT_FOUND)
+            self.send_header("Content-type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", self.cache_control_for(url_path) or "no-cache")
+            self.send_header("X-Cache", state)
+            self.end_headers()
+            return io.BytesIO(body)
+        return self.send_asset(proxy.asset(key, entry), self.cache_control_for(url_path), {"X-Cache": state})
+
+    def send_events(self):
+        """/events: an event stream of change notices, handed to the server's EventStream.
+
+        The stream starts with a "versions" event holding every project's
+        current ETag; after that each "project" event names one project whose
+        /api/projects/<name> result or PROJECTS.md section changed, and "file"
+        events carry the new ETag of a changed /data/ file.
+        """
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", self.cache_control_for("/events") or "no-store")
+        self.end_headers()
+        self.close_connection = True
+        if self.command != "GET":
+            return None
+
+        api = getattr(self.server, 'projects_api', None)
+        data_watcher = getattr(self.server, 'data_watcher', None)
+        versions = {"api": api.versions() if api else {}, "data": data_watcher.versions() if data_watcher else {}}
+        greeting = (f"retry: {EVENTS_RETRY}\nevent: versions\n"
+                    f"data: {json.dumps(versions, separators=(',', ':'), ensure_ascii=False)}\n\n")
+        self.server.events.subscribe(self.connection, greeting.encode("utf-8"))
+        return None
+
+    def translate_path(self, path):
+        """Map /data/ to the server's data folder; everything else is served from the web-app folder."""
+        data_dir = getattr(self.server, 'data_dir', None)
+        url_path = urlsplit(path).path
+        if data_dir and (url_path == "/data" or url_path.startswith("/data/")):
+            relative = os.path.relpath(super().translate_path(path[len("/data"):] or "/"), self.directory)
+            return os.path.join(data_dir, relative) + ("/" if url_path.endswith("/") else "")
+        return super().translate_path(path)
+
+    def send_metrics(self):
+        """/metrics: the server's counters for Prometheus to scrape."""
+        body = self.server.metrics.render(self.server).encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        return io.BytesIO(body)
+
     def do_GET(self):
         """Handle GET requests with better error handling."""
         try:
             # Parse the URL
             parsed_url = urlparse(self.path)
             path = parsed_url.path
-            
-            # Log the request
-            logging.info(f"GET request: {path}")
-            
+
             # Handle favicon requests gracefully
             if path == '/favicon.ico':
                 self.send_response(204)  # No content
                 self.end_headers()
                 return
-            
+
             # Serve the file normally
             super().do_GET()
-            
+
         except BrokenPipeError:
             logging.debug("Broken pipe during GET request")
+            self.client_disconnected("broken_pipe")
         except Exception as e:
             logging.error(f"Error handling GET request: {e}")
             self.send_error(500, "Internal Server Error")
 
-def run_server(port=8000):
-    """Run the custom HTTP server."""
+def run_server(port=8000, bind="", **options):
+    """Run the custom HTTP server until Ctrl+C or SIGTERM, then shut down gracefully.
+
+    options are passed on to ThreadPoolHTTPServer.
+    """
     try:
-        with socketserver.TCPServer(("", port), CustomHTTPRequestHandler) as httpd:
-            logging.info(f"Server started at http://localhost:{port}")
+        with ThreadPoolHTTPServer((bind, port), CustomHTTPRequestHandler, **options) as httpd:
+            # serve_forever() runs on this thread, so shutdown() has to be called from another
+            signal.signal(signal.SIGTERM,
+                          lambda signum, frame: threading.Thread(target=httpd.shutdown).start())
+            logging.info(f"Server started at http://localhost:{port} ({len(httpd.workers)} workers)")
             logging.info("Press Ctrl+C to stop the server")
-            httpd.serve_forever()
-    except KeyboardInterrupt:
-        logging.info("Server stopped by user")
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                logging.info("Server stopped by user")
+            logging.info("Finishing in-flight requests...")
+        logging.info("Server stopped")
     except Exception as e:
         logging.error(f"Server error: {e}")
 
 if __name__ == "__main__":
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
-    run_server(port)
+    parser = argparse.ArgumentParser(description="ProjectStatus web server")
+    parser.add_argument("port", nargs="?", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--bind", default="", help="Address to bind (default: all interfaces)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Worker threads serving connections")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="Accepted connections allowed to wait for a worker before new ones get a 503")
+    parser.add_argument("--keep-alive", type=float, default=DEFAULT_KEEP_ALIVE,
+                        help="Seconds an idle keep-alive connection is kept open")
+    parser.add_argument("--shutdown-timeout", type=float, default=DEFAULT_SHUTDOWN_TIMEOUT,
+                        help="Seconds to wait for in-flight requests when stopping")
+    parser.add_argument("--cache-control", type=parse_cache_control, action="append", metavar="PATTERN=VALUE",
+                        help="Cache-Control for URL paths matching PATTERN (e.g. '*.js=no-cache'); "
+                             "checked before the defaults, first match wins")
+    parser.add_argument("--no-default-cache-control", action="store_true",
+                        help="Only use the --cache-control rules")
+    parser.add_argument("--asset-cache-mb", type=int, default=DEFAULT_ASSET_CACHE_BYTES // (1024 * 1024),
+                        help="Memory for static files kept raw and precompressed (0 = serve from disk)")
+    parser.add_argument("--no-sendfile", action="store_true",
+                        help="Copy file bodies through the server instead of with os.sendfile")
+    parser.add_argument("--projects-root", default=DEFAULT_PROJECTS_ROOT,
+                        help="Directory scanned for /api/projects (default: the folder containing this repo)")
+    parser.add_argument("--no-api", action="store_true", help="Disable the /api/projects endpoints")
+    parser.add_argument("--poll-interval", type=float, default=2.0,
+                        help="Seconds between checks for project changes when inotify is unavailable")
+    add_discovery_arguments(parser)
+    parser.add_argument("--raw-upstream", default=DEFAULT_RAW_UPSTREAM,
+                        help="Base URL behind /proxy/raw/<owner>/<repo>/<path>")
+    parser.add_argument("--raw-cache-dir", default=DEFAULT_RAW_CACHE_DIR, help="Disk cache for /proxy/raw/")
+    parser.add_argument("--raw-ttl", type=float, default=DEFAULT_RAW_TTL,
+                        help="Seconds a proxied file is served without asking the upstream")
+    parser.add_argument("--raw-stale", type=float, default=DEFAULT_RAW_STALE,
+                        help="Seconds after --raw-ttl a proxied file is still served while it is refetched")
+    parser.add_argument("--raw-negative-ttl", type=float, default=DEFAULT_RAW_NEGATIVE_TTL,
+                        help="Seconds an upstream 404 is remembered")
+    parser.add_argument("--raw-cache-mb", type=int, default=DEFAULT_RAW_CACHE_BYTES // (1024 * 1024),
+                        help="Disk space for proxied files; the oldest are deleted beyond it")
+    parser.add_argument("--no-proxy", action="store_true", help="Disable /proxy/raw/")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR,
+                        help="Folder served as /data/ and watched for /events (default: this repo's data folder; "
+                             "'' serves /data/ from the web-app folder)")
+    parser.add_argument("--no-events", action="store_true", help="Disable the /events change stream")
+    parser.add_argument("--events-heartbeat", type=float, default=DEFAULT_EVENTS_HEARTBEAT,
+                        help="Seconds between keep-alive comments on /events")
+    parser.add_argument("--no-metrics", action="store_true", help="Disable the /metrics endpoint")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, default="INFO", help="Level for server messages")
+    parser.add_argument("--access-log-level", choices=LOG_LEVELS, default="INFO",
+                        help="INFO logs every request, WARNING only 4xx/5xx, ERROR only 5xx")
+    parser.add_argument("--access-log-sample", type=float, default=1.0,
+                        help="Fraction of successful requests logged (errors are always kept)")
+    parser.add_argument("--access-log-format", choices=("text", "json"), default="text",
+                        help="json: one compact JSON object per request with duration and bytes sent")
+    parser.add_argument("--access-log", metavar="FILE",
+                        help="Write access records here instead of server.log/stdout "
+                             "(default for --access-log-format json: access.jsonl)")
+    args = parser.parse_args()
+
+    access_log = AccessLog(getattr(logging, args.access_log_level), args.access_log_sample,
+                           args.access_log_format == "json")
+    access_file = args.access_log or ("access.jsonl" if access_log.json_lines else None)
+    log_writer, log_queue_handler = setup_logging(args.log_level, access_log=access_log, access_file=access_file)
+    run_server(
+        args.port, args.bind,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        keep_alive=args.keep_alive,
+        shutdown_timeout=args.shutdown_timeout,
+        cache_control=(args.cache_control or []) + ([] if args.no_default_cache_control else DEFAULT_CACHE_CONTROL),
+        asset_cache_bytes=args.asset_cache_mb * 1024 * 1024,
+        use_sendfile=not args.no_sendfile,
+        projects_api=None if args.no_api else ProjectsAPI(args.projects_root, discovery_from_args(args),
+                                                          args.poll_interval),
+        raw_proxy=None if args.no_proxy else RawProxy(args.raw_upstream, args.raw_cache_dir, args.raw_ttl,
+                                                      args.raw_stale, args.raw_negative_ttl,
+                                                      max_bytes=args.raw_cache_mb * 1024 * 1024),
+        access_log=access_log,
+        metrics=None if args.no_metrics else Metrics(log_queue_handler),
+        data_dir=args.data_dir or None,
+        data_watcher=DataWatcher(args.data_dir, args.poll_interval) if args.data_dir and not args.no_events else None,
+        events=None if args.no_events else EventStream(args.events_heartbeat)
+    )
+    if log_queue_handler.dropped:
+        logging.warning(f"{log_queue_handler.dropped} log records were dropped because the log queue was full")
+    log_writer.stop()